@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import subprocess
+
+# Startup budget for short CLI invocations (milliseconds, interpreter start included)
+STARTUP_BUDGET_MS = 100
+# Command that is measured: print the saved lineups and exit
+STARTUP_COMMAND = ['main.py', '--show-lineups']
+# Modules that must not be imported by a short invocation (they are loaded on the first solve)
+HEAVY_MODULES = ['numpy', 'scipy']
+
+def parse_import_times(stderr):
+    """
+    Parses the output of `python -X importtime` into a list of (module, self time, cumulative time, level)
+    tuples, with the times in microseconds. Level 0 are the modules imported directly by the program.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(self_time), int(cumulative_time), level))
+    return imports
+
+def check_startup_time(budget_ms=STARTUP_BUDGET_MS, runs=5):
+    """
+    Name:
+        check_startup_time
+
+    Parameters:
+        budget_ms (int, optional): Maximum allowed startup time in milliseconds. Defaults to 100.
+        runs (int, optional): Number of runs; the fastest one is reported, to leave out disk cache effects.
+
+    Description:
+        Runs `python -X importtime main.py --show-lineups` several times and reports:
+            - the wall time of the fastest run (interpreter start, imports and reading lineups.txt),
+            - the slowest modules imported directly by main.py, from the `-X importtime` output,
+            - whether any heavy module (NumPy, SciPy) was imported, which should only happen on the first solve.
+
+    Expected Output:
+        bool: True if the startup time is within the budget and no heavy module was imported.
+
+    Example:
+        python check_startup_time.py
+        Startup time: 38.2 ms (budget 100 ms)
+        Slowest imports:
+            9.1 ms  squad_store.open_squad_store
+            ...
+        OK
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable, '-X', 'importtime'] + STARTUP_COMMAND
+
+    wall_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=base_dir, capture_output=True, text=True, encoding='utf-8')
+        wall_times.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            print(result.stderr)
+            return False
+
+    imports = parse_import_times(result.stderr)
+    project_imports = [
+        (name, cumulative_time) for name, _, cumulative_time, level in imports
+        if level == 0 and name.split('.')[0] in ('functions', 'read_files', 'squad_store')
+    ]
+    heavy_imports = sorted({name for name, _, _, _ in imports if name.split('.')[0] in HEAVY_MODULES})
+
+    startup_ms = min(wall_times)
+    print(f"Startup time: {startup_ms:.1f} ms (budget {budget_ms} ms)")
+    print("Slowest imports:")
+    for name, cumulative_time in sorted(project_imports, key=lambda item: -item[1])[:5]:
+        print(f"    {cumulative_time / 1000:.1f} ms  {name}")
+
+    within_budget = startup_ms <= budget_ms and not heavy_imports
+    if heavy_imports:
+        print(f"Heavy modules imported at startup: {', '.join(heavy_imports[:5])}")
+    print("OK" if within_budget else "Over budget")
+    return within_budget
+
+if __name__ == "__main__":
+    budget_ms = int(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_BUDGET_MS
+    sys.exit(0 if check_startup_time(budget_ms) else 1)
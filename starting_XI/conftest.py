@@ -0,0 +1,2 @@
+# The modules import each other as `functions.x` / `read_files.x`, as when the scripts are run from this
+# directory; this file makes pytest put the directory on sys.path so the tests import them the same way.
@@ -0,0 +1,127 @@
+from collections import deque
+
+# Rolling windows (number of most recent lineups) kept by default
+DEFAULT_WINDOWS = (5, 10)
+DEFAULT_ROTATION_WINDOW = 5
+
+class AppearanceStats:
+    """
+    Name:
+        AppearanceStats
+
+    Parameters:
+        windows (tuple, optional): Sizes of the rolling windows, in lineups. Defaults to (5, 10).
+
+    Description:
+        Start counts of every player over the saved lineups, kept in memory and updated one lineup at a time:
+        - a player x position matrix of starts over all the lineups (`{player: {position: starts}}`) with the
+          total starts of every player,
+        - the same matrix and totals for each rolling window (the last N lineups). When a lineup leaves a
+          window its starts are subtracted, so adding a lineup costs O(11 x number of windows) whatever the
+          size of the archive.
+
+        Queries are dictionary lookups. `sync` reads only the lineups saved since the last call through the
+        lineup index (see `LineupArchive`), so the archive text is parsed once per lineup.
+
+        `rotation_penalties` turns the starts of a window into the extra lineup cost accepted by
+        `generate_lineup`, so players who started often recently are more likely to be rested.
+
+    Example:
+        stats = AppearanceStats()
+        stats.sync(store)
+        stats.starts("Pedri", window=5)
+        4
+        stats.position_starts("Pedri")
+        {'Midfielder': 2, 'Attacking-midfielder': 1}
+        stats.rotation_penalties(window=5, weight=10)
+        {'Pedri': 40, 'Gavi': 10, ...}
+    """
+
+    def __init__(self, windows=DEFAULT_WINDOWS):
+        self.windows = tuple(sorted(set(windows)))
+        self.lineup_count = 0
+        self._recent = deque(maxlen=(self.windows[-1] + 1) if self.windows else 1)
+        self._counts = {None: {}}      # window (None = all lineups) -> {player: {position: starts}}
+        self._totals = {None: {}}      # window -> {player: starts}
+        for window in self.windows:
+            self._counts[window] = {}
+            self._totals[window] = {}
+
+    @classmethod
+    def from_lineups(cls, lineups, windows=DEFAULT_WINDOWS):
+        """Builds the statistics from lineups given as (lineup_number, [(position, player), ...]) pairs, oldest first."""
+        stats = cls(windows)
+        for _, lineup in lineups:
+            stats.add_lineup(lineup)
+        return stats
+
+    def sync(self, store):
+        """
+        Adds the lineups saved in the store since the last call (only those are read). If the store has fewer
+        lineups than were counted (e.g. the archive was replaced), the statistics are rebuilt.
+        Returns the number of lineups read.
+        """
+        count = store.count_lineups()
+        if count < self.lineup_count:
+            self.__init__(self.windows)
+        new_lineups = store.read_last_lineups(count - self.lineup_count) if count > self.lineup_count else []
+        for _, lineup in new_lineups:
+            self.add_lineup(lineup)
+        return len(new_lineups)
+
+    def add_lineup(self, lineup):
+        """Adds the starts of one lineup (a list of (position, player) tuples) to every count."""
+        self._recent.append(lineup)
+        self._update(None, lineup, 1)
+        for window in self.windows:
+            self._update(window, lineup, 1)
+            if len(self._recent) > window:
+                # The lineup that was `window` lineups ago leaves this window
+                self._update(window, self._recent[-window - 1], -1)
+        self.lineup_count += 1
+
+    def _update(self, window, lineup, change):
+        counts = self._counts[window]
+        totals = self._totals[window]
+        for position, player in lineup:
+            positions = counts.setdefault(player, {})
+            positions[position] = positions.get(position, 0) + change
+            totals[player] = totals.get(player, 0) + change
+            if not positions[position]:
+                del positions[position]
+                if not positions:
+                    del counts[player]
+            if not totals[player]:
+                del totals[player]
+
+    def _check_window(self, window):
+        if window not in self._counts:
+            raise ValueError(f"Window {window} is not tracked (tracked windows: {', '.join(map(str, self.windows))}).")
+
+    def starts(self, player, window=None):
+        """Returns the starts of a player over all the lineups (window=None) or over the last `window` lineups."""
+        self._check_window(window)
+        return self._totals[window].get(player, 0)
+
+    def position_starts(self, player, window=None):
+        """Returns {position: starts} of a player over all the lineups or over the last `window` lineups."""
+        self._check_window(window)
+        return dict(self._counts[window].get(player, {}))
+
+    def start_counts(self, window=None):
+        """Returns {player: starts} of every player with at least one start (over all lineups or a window)."""
+        self._check_window(window)
+        return dict(self._totals[window])
+
+    def start_matrix(self, window=None):
+        """Returns the player x position matrix of starts as {player: {position: starts}}."""
+        self._check_window(window)
+        return {player: dict(positions) for player, positions in self._counts[window].items()}
+
+    def rotation_penalties(self, window, weight):
+        """
+        Returns {player: weight * starts in the last `window` lineups}, the rotation term of `generate_lineup`
+        (players without starts in the window have no penalty).
+        """
+        self._check_window(window)
+        return {player: weight * starts for player, starts in self._totals[window].items()}
@@ -0,0 +1,129 @@
+import numpy as np
+
+def calculate_player_metrics(player_names, played_minutes, player_performance, risk_coefficients, age_risks, rotation_penalties=None):
+    """
+    Name:
+        calculate_player_metrics
+
+    Parameters:
+        player_names (list): List of player names (str). The order defines the order of the returned vector.
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        rotation_penalties (dict, optional): Extra cost of each player for their recent starts
+                                             (see `AppearanceStats.rotation_penalties`). Added as is.
+
+    Description:
+        Computes the lineup cost of every player once, as a single vector. Each metric is looked up once per
+        player and the weights are applied to whole arrays:
+            cost = (10 - performance) * 0.5 + played minutes * 0.2 + injury risk * 0.2 + age risk * 0.1
+        Missing values default to 0, exactly as in the per-cell computation used before. The rotation
+        penalty, when given, is added to the cost of each player.
+
+    Expected Output:
+        numpy.ndarray: A float vector with one cost per player, in the order of `player_names`.
+    """
+    count = len(player_names)
+    performance = np.fromiter((player_performance.get(player, 0) for player in player_names), dtype=float, count=count)
+    minutes = np.fromiter((played_minutes.get(player, 0) for player in player_names), dtype=float, count=count)
+    injury_risk = np.fromiter((risk_coefficients.get(player, 0) for player in player_names), dtype=float, count=count)
+    age_risk = np.fromiter((age_risks.get(player, 0) for player in player_names), dtype=float, count=count)
+
+    metrics = (
+        (10 - performance) * 0.5 +  # Weight for performance (higher is better)
+        minutes * 0.2 +  # Weight for minutes played
+        injury_risk * 0.2 +  # Weight for injury risk
+        age_risk * 0.1  # Weight for age risk
+    )
+    if rotation_penalties:
+        metrics += np.fromiter((rotation_penalties.get(player, 0) for player in player_names), dtype=float, count=count)
+    return metrics
+
+def build_eligibility_edges(players, player_names, roles):
+    """
+    Name:
+        build_eligibility_edges
+
+    Parameters:
+        players (dict): Dictionary of players, where each key is the player's name (str) and the value is another dictionary
+                        containing the player's attributes ('number', 'age', 'positions').
+        player_names (list): List of player names (str). Edges refer to players by their index in this list.
+        roles (list): List of distinct position names (str). Edges refer to roles by their index in this list.
+
+    Description:
+        Lists every (player, role) pair where the player can play the role. Every player's position list is
+        walked once, so the cost is proportional to the total number of listed positions and not to
+        players x roles. Positions that are not in `roles` are ignored.
+
+    Expected Output:
+        tuple: Two integer arrays (player indices, role indices) with one entry per eligible pair.
+    """
+    role_index = {role: r for r, role in enumerate(roles)}
+    rows = []
+    cols = []
+    for i, player in enumerate(player_names):
+        for position in players[player]['positions']:
+            r = role_index.get(position)
+            if r is not None:
+                rows.append(i)
+                cols.append(r)
+
+    return np.array(rows, dtype=int), np.array(cols, dtype=int)
+
+def build_eligibility_mask(players, player_names, roles):
+    """
+    Name:
+        build_eligibility_mask
+
+    Parameters:
+        players (dict): Dictionary of players, where each key is the player's name (str) and the value is another dictionary
+                        containing the player's attributes ('number', 'age', 'positions').
+        player_names (list): List of player names (str), one row of the mask per player.
+        roles (list): List of distinct position names (str), one column of the mask per role.
+
+    Description:
+        Builds a boolean matrix telling which player can play which role, from the pairs returned by
+        `build_eligibility_edges`.
+
+    Expected Output:
+        numpy.ndarray: A boolean matrix of shape (len(player_names), len(roles)).
+    """
+    rows, cols = build_eligibility_edges(players, player_names, roles)
+    mask = np.zeros((len(player_names), len(roles)), dtype=bool)
+    mask[rows, cols] = True
+    return mask
+
+def build_cost_matrix(players, available_players, positions, played_minutes, player_performance, risk_coefficients, age_risks, rotation_penalties=None):
+    """
+    Name:
+        build_cost_matrix
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        available_players (list): Names of the players that can be selected (rows of the matrix).
+        positions (list): Positions to fill (columns of the matrix). A position may appear more than once,
+                          for example two "Centre-back" slots.
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        rotation_penalties (dict, optional): Extra cost of each player for their recent starts.
+
+    Description:
+        Builds the player x position cost matrix used by the assignment solver. The metric vector is computed
+        once per player and the eligibility mask once per distinct role; both are then combined in a single
+        broadcast. Cells where the player cannot play the position are set to np.inf.
+
+    Expected Output:
+        numpy.ndarray: A float matrix of shape (len(available_players), len(positions)).
+    """
+    roles = list(dict.fromkeys(positions))
+    role_index = {role: r for r, role in enumerate(roles)}
+    slot_roles = np.array([role_index[position] for position in positions], dtype=int)
+
+    metrics = calculate_player_metrics(available_players, played_minutes, player_performance, risk_coefficients, age_risks, rotation_penalties)
+    eligible = build_eligibility_mask(players, available_players, roles)
+
+    # Expand the role columns to slots and apply the metric of each row in one broadcast
+    return np.where(eligible[:, slot_roles], metrics[:, None], np.inf)
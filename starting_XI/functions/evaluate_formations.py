@@ -0,0 +1,106 @@
+from functions.hungarian_algorithm import hungarian_algorithm
+from functions.build_cost_matrix import build_eligibility_edges, calculate_player_metrics
+from functions.min_cost_flow import min_cost_flow
+from functions.formations import FORMATIONS, formation_positions
+from read_files.injury_index import InjuryIndex, build_injury_index
+import numpy as np
+
+def evaluate_formations(players, injury_history, current_date, played_minutes, player_performance, risk_coefficients, age_risks, formations=None, solver="hungarian"):
+    """
+    Name:
+        evaluate_formations
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        injury_history (dict): Injury history as returned by `read_injury_history`, or an `InjuryIndex`.
+        current_date (str): Date of the match (YYYY-MM-DD). Players injured on that date are left out.
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        formations (list, optional): Names of the formations to evaluate. Defaults to every registered formation.
+        solver (str, optional): "hungarian" (default) or "sparse", as in `generate_lineup`.
+
+    Description:
+        Finds the best lineup of every formation for the same match, and the formation with the lowest cost.
+        The work shared by the formations is done once:
+            - the availability of the players on the date,
+            - the metric vector of the available players,
+            - their eligibility for every role used by any of the formations.
+        Each formation then only picks its role columns from the eligibility (one column per slot for
+        "hungarian", or one capacity per role for "sparse") and solves its assignment. Every lineup is the
+        same as the one `generate_lineup` returns for that formation.
+
+    Expected Output:
+        tuple: (results, best_formation), where results maps every evaluated formation to a (total cost, lineup)
+               tuple, or to None if the available players cannot fill it, and best_formation is the name of
+               the formation with the lowest total cost.
+
+    Raises:
+        ValueError: If the solver or a formation is unknown, or no formation can be filled.
+
+    Example:
+        evaluate_formations(players, injury_history, "2024-10-01", ...)
+        (
+            {
+                '4-3-3': (559.434, [('Goalkeeper', 'Ander Astralaga'), ...]),
+                '4-2-3-1': (592.934, [('Goalkeeper', 'Ander Astralaga'), ...]),
+                '4-4-2': (594.3, [('Goalkeeper', 'Ander Astralaga'), ...]),
+                '3-5-2': (557.574, [('Goalkeeper', 'Ander Astralaga'), ...])
+            },
+            '3-5-2'
+        )
+    """
+    if solver not in ("hungarian", "sparse"):
+        raise ValueError(f"Unknown solver: {solver}")
+    formations = list(FORMATIONS) if formations is None else list(formations)
+    formation_slots = {formation: formation_positions(formation) for formation in formations}
+
+    # Shared work: available players, their metrics and their eligibility for every role of every formation
+    if not isinstance(injury_history, InjuryIndex):
+        injury_history = build_injury_index(injury_history)
+    player_names = list(players)
+    unavailable = injury_history.unavailable_mask([current_date], player_names)[0]
+    available_players = [player for player, is_injured in zip(player_names, unavailable) if not is_injured]
+
+    roles = list(dict.fromkeys(role for positions in formation_slots.values() for role in positions))
+    edge_players, edge_roles = build_eligibility_edges(players, available_players, roles)
+    eligible = np.zeros((len(available_players), len(roles)), dtype=bool)
+    eligible[edge_players, edge_roles] = True
+    metrics = calculate_player_metrics(available_players, played_minutes, player_performance, risk_coefficients, age_risks)
+
+    results = {}
+    for formation, positions in formation_slots.items():
+        formation_roles = list(dict.fromkeys(positions))
+        role_columns = np.array([roles.index(role) for role in formation_roles])
+        if not eligible[:, role_columns].any(axis=0).all() or len(available_players) < len(positions):
+            results[formation] = None
+            continue
+
+        try:
+            if solver == "sparse":
+                # Keep the edges of the formation's roles, renumbered in the formation's role order
+                formation_role = np.full(len(roles), -1)
+                formation_role[role_columns] = np.arange(len(formation_roles))
+                keep = formation_role[edge_roles] >= 0
+                role_capacities = [positions.count(role) for role in formation_roles]
+                assignment = min_cost_flow(len(available_players), role_capacities, edge_players[keep], formation_role[edge_roles[keep]], metrics[edge_players[keep]])
+                lineup = [(formation_roles[r], available_players[i]) for i, r in assignment]
+                total_cost = float(metrics[[i for i, _ in assignment]].sum())
+            else:
+                slot_roles = np.array([roles.index(position) for position in positions])
+                cost_matrix = np.where(eligible[:, slot_roles], metrics[:, None], np.inf)
+                row_ind, col_ind = hungarian_algorithm(cost_matrix)
+                lineup = [(positions[j], available_players[i]) for i, j in zip(row_ind, col_ind) if cost_matrix[i, j] != np.inf]
+                total_cost = float(cost_matrix[row_ind, col_ind].sum())
+        except ValueError:
+            results[formation] = None  # The roles are covered, but not all at the same time
+            continue
+        results[formation] = (round(total_cost, 4), lineup)
+
+    feasible = [formation for formation in formations if results[formation] is not None]
+    if not feasible:
+        raise ValueError("No formation can be filled with the available players")
+    best_formation = min(feasible, key=lambda formation: results[formation][0])
+
+    return results, best_formation
@@ -0,0 +1,85 @@
+# Registered formations: role -> number of slots, in the order the lineup is listed
+FORMATIONS = {
+    "4-3-3": {
+        "Goalkeeper": 1,
+        "Centre-back": 2, "Right-back": 1, "Left-back": 1,
+        "Pivot": 1, "Attacking-midfielder": 1, "Midfielder": 1,
+        "Striker": 1, "Right-winger": 1, "Left-winger": 1
+    },
+    "4-2-3-1": {
+        "Goalkeeper": 1,
+        "Centre-back": 2, "Right-back": 1, "Left-back": 1,
+        "Pivot": 1, "Central-midfielder": 1,
+        "Attacking-midfielder": 1, "Right-winger": 1, "Left-winger": 1,
+        "Striker": 1
+    },
+    "4-4-2": {
+        "Goalkeeper": 1,
+        "Centre-back": 2, "Right-back": 1, "Left-back": 1,
+        "Right-winger": 1, "Midfielder": 1, "Central-midfielder": 1, "Left-winger": 1,
+        "Striker": 2
+    },
+    "3-5-2": {
+        "Goalkeeper": 1,
+        "Centre-back": 3,
+        "Right-back": 1, "Pivot": 1, "Midfielder": 1, "Attacking-midfielder": 1, "Left-back": 1,
+        "Striker": 2
+    }
+}
+
+DEFAULT_FORMATION = "4-3-3"
+
+def register_formation(name, role_capacities):
+    """
+    Name:
+        register_formation
+
+    Parameters:
+        name (str): Name of the formation (e.g. "5-3-2").
+        role_capacities (dict): Number of slots of every role, in the order the lineup is listed.
+
+    Description:
+        Adds a formation (or replaces one with the same name) so it can be used by `generate_lineup` and
+        is evaluated by `evaluate_formations`.
+
+    Expected Output:
+        None
+
+    Raises:
+        ValueError: If the formation does not have 11 slots or a capacity is not a positive integer.
+
+    Example:
+        register_formation("5-3-2", {"Goalkeeper": 1, "Centre-back": 3, "Right-back": 1, "Left-back": 1,
+                                     "Pivot": 1, "Midfielder": 2, "Striker": 2})
+    """
+    if any(not isinstance(capacity, int) or capacity < 1 for capacity in role_capacities.values()):
+        raise ValueError(f"Invalid role capacities for formation {name}: {role_capacities}")
+    if sum(role_capacities.values()) != 11:
+        raise ValueError(f"Formation {name} must have 11 slots, not {sum(role_capacities.values())}")
+    FORMATIONS[name] = dict(role_capacities)
+
+def formation_positions(formation=DEFAULT_FORMATION):
+    """
+    Name:
+        formation_positions
+
+    Parameters:
+        formation (str, optional): Name of a registered formation. Defaults to "4-3-3".
+
+    Description:
+        Expands the role capacities of a formation into its list of position slots, with a role repeated
+        once per slot (the format expected by `build_cost_matrix`).
+
+    Expected Output:
+        list: The positions of the formation.
+
+    Raises:
+        ValueError: If the formation is not registered.
+
+    Example:
+        formation_positions("4-3-3")
+        ['Goalkeeper', 'Centre-back', 'Centre-back', 'Right-back', 'Left-back', 'Pivot', ...]
+    """
+    if formation not in FORMATIONS:
+        raise ValueError(f"Unknown formation: {formation}")
+    return [role for role, capacity in FORMATIONS[formation].items() for _ in range(capacity)]
@@ -1,126 +1,119 @@
-from scipy.optimize import linear_sum_assignment
-from functions.hungarian_algorithm import hungarian_algorithm, find_best_players
-import numpy as np
-from datetime import datetime, timedelta
-
-def generate_lineup(players, injury_history, current_date, played_minutes, player_performance, risk_coefficients, age_risks):
-    """
-    Name:
-        generate_lineup
-
-    Parameters:
-        players (dict): Dictionary of players, where each key is the player's name (str) and the value is another dictionary
-                        containing the player's attributes:
-                        {
-                            'number': int,
-                            'age': int,
-                            'positions': list
-                        }
-        injury_history (dict): A dictionary where each key is a player's name (str) and the value is a dictionary
-              containing a list of injuries:
-              {
-                  'player_name': {
-                      'injuries': [
-                          {
-                              'date': str,
-                              'injury_type': str,
-                              'recovery_time': int,
-                              'severity': str,
-                              'minutes_played': int,
-                              'recurrent': str
-                          },
-                          ...
-                      ]
-                  },
-                  ...
-              }
-        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
-        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
-        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
-        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
-
-    Description:
-        Generates an optimal 4-3-3 lineup by solving a bipartite graph matching problem. The weights of the edges
-        are calculated based on the given metrics (performance, minutes played, injury risk, and age risk).
-
-    Expected Output:
-        list: A list of tuples where each tuple contains a position and the assigned player.
-    """
-    # Define the required positions for a 4-3-3 lineup
-    positions = [
-        "Goalkeeper",
-        "Centre-back", "Centre-back",
-        "Right-back", "Left-back",
-        "Pivot", "Attacking-midfielder", "Midfielder",
-        "Striker", "Right-winger", "Left-winger"
-    ]
-
-    # Convert current_date to a datetime object
-    current_date = datetime.strptime(current_date, "%Y-%m-%d")
-
-    # Filter out injured players
-    available_players = []
-    for player in players:
-        is_injured = False
-        if player in injury_history and 'injuries' in injury_history[player]:
-            for injury in injury_history[player]['injuries']:
-                injury_date = datetime.strptime(injury['date'], "%Y-%m-%d")
-                recovery_end_date = injury_date + timedelta(days=injury['recovery_time'])
-                if injury_date <= current_date <= recovery_end_date:
-                    is_injured = True
-                    break
-        if not is_injured:
-            available_players.append(player)
-
-    # Check if there are enough players for each position
-    for position in positions:
-        compatible_players = [player for player in available_players if position in players[player]['positions']]
-        if not compatible_players:
-            raise ValueError(f"No players available for position: {position}")
-
-
-    # Create a cost matrix (rows = players, columns = positions)
-    num_players = len(available_players)
-    num_positions = len(positions)
-    cost_matrix = np.zeros((num_players, num_positions))
-
-    for i, player in enumerate(available_players):
-        for j, position in enumerate(positions):
-            # Calculate the weight for the edge (player -> position)
-            if position in players[player]['positions']:
-                cost_matrix[i, j] = (
-                    (10 - player_performance.get(player, 0)) * 0.5 +  # Weight for performance (higher is better)
-                    played_minutes.get(player, 0) * 0.2 +  # Weight for minutes played
-                    risk_coefficients.get(player, 0) * 0.2 +  # Weight for injury risk
-                    age_risks.get(player, 0) * 0.1  # Weight for age risk
-                )
-            else:
-                cost_matrix[i, j] = np.inf  # Assign a high cost if the player cannot play this position
-
-    # Ask the user whether to use the optimized (library) version or not
-    #use_optimized = input("¿Usar la versión optimizada (librería scipy) para resolver el problema de asignación? (s/n): ").strip().lower()
-    
-    # Verify that there are enough players for each position
-    for position in positions:
-        compatible_players = [player for player in players if position in players[player]['positions']]
-        if not compatible_players:
-            raise ValueError(f"No players available for position: {position}")
-        
-
-    row_ind, col_ind = linear_sum_assignment(cost_matrix)
-    lineup = [(positions[j], available_players[i]) for i, j in zip(row_ind, col_ind) if cost_matrix[i, j] != np.inf]
-
-    return lineup
-
-"""""
-    if use_optimized == 's':
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
-        # Generate the lineup
-        lineup = [(positions[j], available_players[i]) for i, j in zip(row_ind, col_ind) if cost_matrix[i, j] != np.inf]
-    else:
-        # Generar la alineación usando la función alternativa
-        lineup = find_best_players(cost_matrix, positions, available_players)
-
-    # Return the generated lineup
-    return lineup
+from functions.hungarian_algorithm import hungarian_algorithm, find_best_players
+from functions.build_cost_matrix import build_cost_matrix, build_eligibility_edges, calculate_player_metrics
+from functions.min_cost_flow import min_cost_flow
+from functions.formations import DEFAULT_FORMATION, formation_positions
+import numpy as np
+from read_files.injury_index import InjuryIndex, build_injury_index
+from read_files.position_index import build_position_index
+
+# Required positions for a 4-3-3 lineup (see functions/formations.py for the other formations)
+LINEUP_POSITIONS = formation_positions(DEFAULT_FORMATION)
+
+def generate_lineup(players, injury_history, current_date, played_minutes, player_performance, risk_coefficients, age_risks, solver="hungarian", formation=DEFAULT_FORMATION, position_index=None, rotation_penalties=None):
+    """
+    Name:
+        generate_lineup
+
+    Parameters:
+        players (dict): Dictionary of players, where each key is the player's name (str) and the value is another dictionary
+                        containing the player's attributes:
+                        {
+                            'number': int,
+                            'age': int,
+                            'positions': list
+                        }
+        injury_history (dict): A dictionary where each key is a player's name (str) and the value is a dictionary
+              containing a list of injuries:
+              {
+                  'player_name': {
+                      'injuries': [
+                          {
+                              'date': str,
+                              'injury_type': str,
+                              'recovery_time': int,
+                              'severity': str,
+                              'minutes_played': int,
+                              'recurrent': str
+                          },
+                          ...
+                      ]
+                  },
+                  ...
+              }
+              An `InjuryIndex` (see `read_injury_index`) can be passed instead, so the dates are not parsed again.
+        current_date (str): Date of the match (YYYY-MM-DD). Players injured on that date are left out.
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        solver (str, optional): Assignment solver to use:
+            - "hungarian" (default): dense player x position matrix solved with the Hungarian algorithm.
+            - "sparse": min-cost flow on the eligible (player, role) edges, with one capacity per role
+              (e.g. Centre-back = 2) instead of duplicated columns. Preferred for large pooled squads.
+        formation (str, optional): Name of a registered formation (see `FORMATIONS`). Defaults to "4-3-3".
+        position_index (PositionIndex, optional): Position index of the players (see `build_position_index`),
+              built at load time so the positions are not scanned again. Built from `players` if not given.
+        rotation_penalties (dict, optional): Extra cost of each player for their recent starts, e.g.
+              `AppearanceStats.rotation_penalties(window=5, weight=10)`. Defaults to no rotation term.
+
+    Description:
+        Generates an optimal lineup for the formation (4-3-3 by default) by solving a bipartite graph matching problem. The weights of the edges
+        are calculated based on the given metrics (performance, minutes played, injury risk, and age risk), plus the rotation penalty when given.
+        Both solvers return a lineup with the same (minimal) total cost.
+
+    Expected Output:
+        list: A list of tuples where each tuple contains a position and the assigned player.
+    """
+    # Define the required positions for the formation
+    positions = formation_positions(formation)
+
+    # Filter out injured players
+    if not isinstance(injury_history, InjuryIndex):
+        injury_history = build_injury_index(injury_history)
+    player_names = list(players)
+    unavailable = injury_history.unavailable_mask([current_date], player_names)[0]
+    available_players = [player for player, is_injured in zip(player_names, unavailable) if not is_injured]
+
+    # Check if there are enough players for each position (one OR of the available players' eligibility masks)
+    if position_index is None:
+        position_index = build_position_index(players)
+    missing_positions = position_index.missing_positions(positions, available_players)
+    if missing_positions:
+        raise ValueError(f"No players available for position: {missing_positions[0]}")
+
+
+    # Ask the user whether to use the optimized (library) version or not
+    #use_optimized = input("¿Usar la versión optimizada (librería scipy) para resolver el problema de asignación? (s/n): ").strip().lower()
+    
+
+    if solver == "sparse":
+        # Solve on the sparse (player, role) graph with role capacities
+        roles = list(dict.fromkeys(positions))
+        role_capacities = [positions.count(role) for role in roles]
+        edge_players, edge_roles = build_eligibility_edges(players, available_players, roles)
+        metrics = calculate_player_metrics(available_players, played_minutes, player_performance, risk_coefficients, age_risks, rotation_penalties)
+        assignment = min_cost_flow(len(available_players), role_capacities, edge_players, edge_roles, metrics[edge_players])
+        lineup = [(roles[r], available_players[i]) for i, r in assignment]
+    elif solver == "hungarian":
+        # Create a cost matrix (rows = players, columns = positions)
+        cost_matrix = build_cost_matrix(players, available_players, positions, played_minutes, player_performance, risk_coefficients, age_risks, rotation_penalties)
+
+        row_ind, col_ind = hungarian_algorithm(cost_matrix)
+        lineup = [(positions[j], available_players[i]) for i, j in zip(row_ind, col_ind) if cost_matrix[i, j] != np.inf]
+    else:
+        raise ValueError(f"Unknown solver: {solver}")
+
+    return lineup
+
+"""""
+    if use_optimized == 's':
+        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+        # Generate the lineup
+        lineup = [(positions[j], available_players[i]) for i, j in zip(row_ind, col_ind) if cost_matrix[i, j] != np.inf]
+    else:
+        # Generar la alineación usando la función alternativa
+        lineup = find_best_players(cost_matrix, positions, available_players)
+
+    # Return the generated lineup
+    return lineup
 """""
\ No newline at end of file
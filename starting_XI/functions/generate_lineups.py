@@ -0,0 +1,90 @@
+from functions.hungarian_algorithm import hungarian_algorithm
+from functions.build_cost_matrix import build_eligibility_edges, calculate_player_metrics
+from functions.min_cost_flow import min_cost_flow
+from functions.formations import DEFAULT_FORMATION, formation_positions
+from read_files.injury_index import InjuryIndex, build_injury_index
+import numpy as np
+
+def generate_lineups(players, injury_history, match_dates, played_minutes, player_performance, risk_coefficients, age_risks, solver="hungarian", formation=DEFAULT_FORMATION):
+    """
+    Name:
+        generate_lineups
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        injury_history (dict): Injury history as returned by `read_injury_history`, or an `InjuryIndex`.
+        match_dates (list): List of match dates (str, 'YYYY-MM-DD').
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        solver (str, optional): "hungarian" (default) or "sparse", as in `generate_lineup`.
+        formation (str, optional): Name of a registered formation (see `FORMATIONS`). Defaults to "4-3-3".
+
+    Description:
+        Generates one optimal lineup in the formation (4-3-3 by default) per match date, with the same result as calling `generate_lineup`
+        for every date. The work that does not depend on the date is done once for the whole squad:
+            - the metric vector of every player,
+            - the eligibility of every player for every role (and the dense cost matrix for "hungarian"),
+            - the parsing of the injury history into an `InjuryIndex`.
+        Only the availability mask changes between dates. Dates with the same available players share a
+        single solve, so a month of fixtures usually needs just a few assignment problems.
+
+    Expected Output:
+        list: One lineup per date, in the order of `match_dates`. Each lineup is a list of (position, player) tuples.
+
+    Raises:
+        ValueError: If the formation is not registered, or no available player can play one of the positions
+                    on one of the dates.
+
+    Example:
+        generate_lineups(players, injury_history, ["2025-03-01", "2025-03-08"], ...)
+        [
+            [('Goalkeeper', 'Wojciech Szczęsny'), ...],
+            [('Goalkeeper', 'Wojciech Szczęsny'), ...]
+        ]
+    """
+    positions = formation_positions(formation)
+    player_names = list(players)
+
+    # Date-independent work, done once for the whole squad
+    roles = list(dict.fromkeys(positions))
+    role_capacities = [positions.count(role) for role in roles]
+    slot_roles = np.array([roles.index(position) for position in positions])
+    edge_players, edge_roles = build_eligibility_edges(players, player_names, roles)
+    eligible = np.zeros((len(player_names), len(roles)), dtype=bool)
+    eligible[edge_players, edge_roles] = True
+    metrics = calculate_player_metrics(player_names, played_minutes, player_performance, risk_coefficients, age_risks)
+    if solver == "hungarian":
+        cost_matrix = np.where(eligible[:, slot_roles], metrics[:, None], np.inf)
+    elif solver != "sparse":
+        raise ValueError(f"Unknown solver: {solver}")
+
+    # Availability of every player on every date
+    if not isinstance(injury_history, InjuryIndex):
+        injury_history = build_injury_index(injury_history)
+    available = ~injury_history.unavailable_mask(match_dates, player_names)
+
+    # Solve once per distinct availability mask
+    masks, mask_of_date = np.unique(available, axis=0, return_inverse=True)
+    mask_of_date = mask_of_date.reshape(-1)
+    lineups_by_mask = []
+    for k, mask in enumerate(masks):
+        covered_roles = (eligible & mask[:, None]).any(axis=0)
+        if not covered_roles.all():
+            date = match_dates[int(np.flatnonzero(mask_of_date == k)[0])]
+            raise ValueError(f"No players available for position: {roles[int(np.argmin(covered_roles))]} on {date}")
+
+        rows = np.flatnonzero(mask)
+        if solver == "sparse":
+            keep = mask[edge_players]
+            row_of_player = np.cumsum(mask) - 1
+            assignment = min_cost_flow(len(rows), role_capacities, row_of_player[edge_players[keep]], edge_roles[keep], metrics[edge_players[keep]])
+            lineup = [(roles[r], player_names[rows[i]]) for i, r in assignment]
+        else:
+            available_costs = cost_matrix[rows]
+            row_ind, col_ind = hungarian_algorithm(available_costs)
+            lineup = [(positions[j], player_names[rows[i]]) for i, j in zip(row_ind, col_ind) if available_costs[i, j] != np.inf]
+        lineups_by_mask.append(lineup)
+
+    return [list(lineups_by_mask[k]) for k in mask_of_date]
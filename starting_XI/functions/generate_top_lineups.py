@@ -0,0 +1,73 @@
+from functions.build_cost_matrix import build_cost_matrix
+from functions.murty_ranking import rank_assignments
+from functions.generate_lineup import LINEUP_POSITIONS
+from read_files.injury_index import InjuryIndex, build_injury_index
+from read_files.position_index import build_position_index
+
+def generate_top_lineups(players, injury_history, current_date, played_minutes, player_performance, risk_coefficients, age_risks, k=5, position_index=None):
+    """
+    Name:
+        generate_top_lineups
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        injury_history (dict): Injury history as returned by `read_injury_history`, or an `InjuryIndex`.
+        current_date (str): Current date in the format 'YYYY-MM-DD'.
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        k (int, optional): Number of lineups to return. Defaults to 5.
+        position_index (PositionIndex, optional): Position index of the players, as in `generate_lineup`.
+
+    Description:
+        Returns the k best distinct 4-3-3 lineups for the date, with the same costs as `generate_lineup`
+        (whose lineup is the first one). The available players are ranked over the position slots with
+        Murty's partitioning (`rank_assignments`), where every subproblem is solved from its parent's
+        solver state. Slots of the same position (the two Centre-backs) form one group, so two lineups that
+        only swap the Centre-backs are the same lineup and are returned once.
+
+    Expected Output:
+        list: Up to k (total cost, lineup) tuples in increasing order of cost, where each lineup is a list of
+              (position, player) tuples in the order of the positions.
+
+    Raises:
+        ValueError: If no available player can play one of the positions, or there are fewer available
+                    players than positions.
+
+    Example:
+        generate_top_lineups(players, injury_history, "2024-10-01", ..., k=3)
+        [
+            (24.91, [('Goalkeeper', 'Ander Astralaga'), ('Centre-back', 'Jules Koundé'), ...]),
+            (25.03, [('Goalkeeper', 'Ander Astralaga'), ('Centre-back', 'Jules Koundé'), ...]),
+            ...
+        ]
+    """
+    positions = LINEUP_POSITIONS
+
+    # Filter out injured players
+    if not isinstance(injury_history, InjuryIndex):
+        injury_history = build_injury_index(injury_history)
+    player_names = list(players)
+    unavailable = injury_history.unavailable_mask([current_date], player_names)[0]
+    available_players = [player for player, is_injured in zip(player_names, unavailable) if not is_injured]
+
+    # Check if there are enough players for each position
+    if position_index is None:
+        position_index = build_position_index(players)
+    missing_positions = position_index.missing_positions(positions, available_players)
+    if missing_positions:
+        raise ValueError(f"No players available for position: {missing_positions[0]}")
+    if len(available_players) < len(positions):
+        raise ValueError("Not enough available players to fill every position")
+
+    # Rank the assignments of the slots (rows) to the players (columns)
+    cost_matrix = build_cost_matrix(players, available_players, positions, played_minutes, player_performance, risk_coefficients, age_risks).T
+    roles = list(dict.fromkeys(positions))
+    slot_roles = [roles.index(position) for position in positions]
+    ranked = rank_assignments(cost_matrix, k, slot_roles)
+
+    return [
+        (round(total, 4), [(positions[slot], available_players[player]) for slot, player in zip(slots, assigned_players)])
+        for total, slots, assigned_players in ranked
+    ]
@@ -1,110 +1,143 @@
-import numpy as np
-
-def hungarian_algorithm(cost_matrix):
-    """
-    Solve the assignment problem using the Hungarian algorithm (custom implementation).
-
-    Parameters:
-        cost_matrix (ndarray): A 2D numpy array representing the cost matrix.
-
-    Returns:
-        tuple: Two lists representing the row indices and column indices of the optimal assignments.
-    """
-    # Step 1: Subtract the row minimum from each row
-    cost_matrix = cost_matrix.copy()
-    for i in range(cost_matrix.shape[0]):
-        row_min = np.min(cost_matrix[i, :])
-        cost_matrix[i, :] -= row_min
-
-    # Step 2: Subtract the column minimum from each column
-    for j in range(cost_matrix.shape[1]):
-        col_min = np.min(cost_matrix[:, j])
-        cost_matrix[:, j] -= col_min
-
-
-    # Step 3: Cover all zeros with a minimum number of lines
-    def cover_zeros(matrix):
-        """Cover zeros in the matrix using a minimum number of lines."""
-        covered_rows = set()
-        covered_cols = set()
-        while True:
-            # Find uncovered zeros
-            uncovered_zeros = [(i, j) for i in range(matrix.shape[0]) for j in range(matrix.shape[1])
-                               if matrix[i, j] == 0 and i not in covered_rows and j not in covered_cols]
-
-            if not uncovered_zeros:
-                break
-
-            # Choose a zero and cover its row or column
-            zero = uncovered_zeros[0]
-            if sum(matrix[zero[0], :] == 0) <= sum(matrix[:, zero[1]] == 0):
-                covered_rows.add(zero[0])
-            else:
-                covered_cols.add(zero[1])
-
-        return covered_rows, covered_cols
-
-    covered_rows, covered_cols = cover_zeros(cost_matrix)
-
-    while len(covered_rows) + len(covered_cols) < cost_matrix.shape[0]:
-        # Step 4: Adjust the matrix
-        uncovered_vals = [cost_matrix[i, j] for i in range(cost_matrix.shape[0]) for j in range(cost_matrix.shape[1])
-                           if i not in covered_rows and j not in covered_cols]
-        min_uncovered = min(uncovered_vals)
-
-        for i in range(cost_matrix.shape[0]):
-            for j in range(cost_matrix.shape[1]):
-                if i not in covered_rows and j not in covered_cols:
-                    cost_matrix[i, j] -= min_uncovered
-                elif i in covered_rows and j in covered_cols:
-                    cost_matrix[i, j] += min_uncovered
-
-        covered_rows, covered_cols = cover_zeros(cost_matrix)
-
-    # Step 5: Find an optimal assignment
-    row_ind = []
-    col_ind = []
-    assigned_rows = set()
-    assigned_cols = set()
-
-    for i in range(cost_matrix.shape[0]):
-        for j in range(cost_matrix.shape[1]):
-            if cost_matrix[i, j] == 0 and i not in assigned_rows and j not in assigned_cols:
-                row_ind.append(i)
-                col_ind.append(j)
-                assigned_rows.add(i)
-                assigned_cols.add(j)
-
-    return row_ind, col_ind
-
-def find_best_players(cost_matrix, positions, players):
-    """
-    Encuentra al mejor jugador para cada posición basándose en la matriz de costos.
-
-    Parameters:
-        cost_matrix (numpy.ndarray): Matriz de costos (filas = jugadores, columnas = posiciones).
-        positions (list): Lista de posiciones (columnas de la matriz de costos).
-        players (list): Lista de nombres de jugadores (filas de la matriz de costos).
-
-    Returns:
-        list: Lista de tuplas (posición, jugador) con la asignación óptima.
-    """
-    num_players, num_positions = cost_matrix.shape
-    assigned_players = set()  # Para evitar asignar un jugador a múltiples posiciones
-    lineup = []
-
-    for j, position in enumerate(positions):
-        # Encuentra el índice del jugador con el menor costo en la columna j
-        min_cost = np.inf
-        best_player = None
-
-        for i in range(num_players):
-            if i not in assigned_players and cost_matrix[i, j] < min_cost:
-                min_cost = cost_matrix[i, j]
-                best_player = i
-
-        if best_player is not None:
-            lineup.append((position, players[best_player]))
-            assigned_players.add(best_player)
-
+import numpy as np
+
+def augment_row(cost_matrix, u, v, col_to_row, row):
+    """
+    Name:
+        augment_row
+
+    Parameters:
+        cost_matrix (ndarray): A 2D float array with no more rows than columns. np.inf marks forbidden cells.
+        u (ndarray): Row potentials (one per row). Updated in place.
+        v (ndarray): Column potentials (one per column). Updated in place.
+        col_to_row (ndarray): Integer array with the row assigned to each column, or -1 if the column is free.
+                              Updated in place.
+        row (int): Index of the unassigned row to add to the matching.
+
+    Description:
+        Adds one row to a partial optimal assignment by finding a shortest augmenting path with the
+        Jonker-Volgenant / Dijkstra scheme on reduced costs (cost - u - v). Each step of the search scans
+        one row with a vectorized NumPy update, so one call costs O(rows * columns). Forbidden cells are
+        never entered because their reduced cost stays infinite.
+
+        The potentials and the matching stay dual feasible and complementary, so the function can be
+        called again later on the same state (for example to repair an assignment after a change).
+
+    Expected Output:
+        None: `u`, `v` and `col_to_row` are updated in place.
+
+    Raises:
+        ValueError: If the row cannot be assigned to any free column (the cost matrix is infeasible).
+    """
+    num_cols = cost_matrix.shape[1]
+    min_slack = np.full(num_cols, np.inf)  # Shortest reduced distance found to each column
+    way = np.full(num_cols, -1)  # Previous column on the shortest path (-1 = starting row)
+    used = np.zeros(num_cols, dtype=bool)
+    tree_rows = [row]
+
+    current_row = row
+    current_col = -1
+    while True:
+        free = ~used
+        reduced = cost_matrix[current_row] - u[current_row] - v
+        improved = free & (reduced < min_slack)
+        min_slack[improved] = reduced[improved]
+        way[improved] = current_col
+
+        candidates = np.where(free, min_slack, np.inf)
+        next_col = int(np.argmin(candidates))
+        delta = candidates[next_col]
+        if not np.isfinite(delta):
+            raise ValueError("cost matrix is infeasible")
+
+        # Shift the potentials so the next column becomes tight
+        u[tree_rows] += delta
+        v[used] -= delta
+        min_slack[free] -= delta
+
+        used[next_col] = True
+        current_col = next_col
+        if col_to_row[current_col] == -1:
+            break
+        current_row = col_to_row[current_col]
+        tree_rows.append(current_row)
+
+    # Flip the matching along the augmenting path
+    while current_col != -1:
+        previous_col = way[current_col]
+        col_to_row[current_col] = row if previous_col == -1 else col_to_row[previous_col]
+        current_col = previous_col
+
+def hungarian_algorithm(cost_matrix):
+    """
+    Solve the assignment problem using the Hungarian algorithm (custom implementation).
+
+    The matrix may be rectangular. Every row is assigned when there are fewer rows than columns,
+    otherwise every column is assigned. Cells set to np.inf are treated as forbidden assignments.
+    Rows are added one at a time with a shortest augmenting path (see `augment_row`), which gives
+    O(n^2 * m) time for n = min(rows, columns) and m = max(rows, columns).
+
+    The result has the same format as `scipy.optimize.linear_sum_assignment`.
+
+    Parameters:
+        cost_matrix (ndarray): A 2D numpy array representing the cost matrix.
+
+    Returns:
+        tuple: Two arrays representing the row indices (sorted) and column indices of the optimal assignments.
+
+    Raises:
+        ValueError: If the matrix contains NaN or -inf, or if no complete assignment avoids the forbidden cells.
+    """
+    cost_matrix = np.asarray(cost_matrix, dtype=float)
+    if np.isnan(cost_matrix).any() or np.isneginf(cost_matrix).any():
+        raise ValueError("cost matrix contains invalid numeric entries")
+
+    # Work with no more rows than columns
+    transposed = cost_matrix.shape[0] > cost_matrix.shape[1]
+    if transposed:
+        cost_matrix = cost_matrix.T
+    num_rows, num_cols = cost_matrix.shape
+
+    u = np.zeros(num_rows)
+    v = np.zeros(num_cols)
+    col_to_row = np.full(num_cols, -1)
+    for row in range(num_rows):
+        augment_row(cost_matrix, u, v, col_to_row, row)
+
+    col_ind = np.flatnonzero(col_to_row >= 0)
+    row_ind = col_to_row[col_ind]
+    if transposed:
+        row_ind, col_ind = col_ind, row_ind
+    order = np.argsort(row_ind)
+    return row_ind[order], col_ind[order]
+
+def find_best_players(cost_matrix, positions, players):
+    """
+    Encuentra al mejor jugador para cada posición basándose en la matriz de costos.
+
+    Parameters:
+        cost_matrix (numpy.ndarray): Matriz de costos (filas = jugadores, columnas = posiciones).
+        positions (list): Lista de posiciones (columnas de la matriz de costos).
+        players (list): Lista de nombres de jugadores (filas de la matriz de costos).
+
+    Returns:
+        list: Lista de tuplas (posición, jugador) con la asignación óptima.
+    """
+    num_players, num_positions = cost_matrix.shape
+    assigned_players = set()  # Para evitar asignar un jugador a múltiples posiciones
+    lineup = []
+
+    for j, position in enumerate(positions):
+        # Encuentra el índice del jugador con el menor costo en la columna j
+        min_cost = np.inf
+        best_player = None
+
+        for i in range(num_players):
+            if i not in assigned_players and cost_matrix[i, j] < min_cost:
+                min_cost = cost_matrix[i, j]
+                best_player = i
+
+        if best_player is not None:
+            lineup.append((position, players[best_player]))
+            assigned_players.add(best_player)
+
     return lineup
\ No newline at end of file
@@ -1,75 +1,83 @@
-def calculate_coefficient_risk(injury_history):
-    """
-    Name:
-        calculate_coefficient_risk
-
-    Parameters:
-        injury_history (dict): A dictionary where each key is a player's name (str) and the value is a dictionary
-                               containing a list of injuries. Each injury is represented as a dictionary with the following attributes:
-                               - date (str)
-                               - injury_type (str)
-                               - recovery_time (int, in days)
-                               - severity (str)
-                               - minutes_played (int)
-                               - recurrent (str: "Yes" or "No")
-
-    Description:
-        Calculates a risk coefficient for each player based on their injury history. The formula used is:
-        Risk Coefficient = (Total Injuries * Severity Weight) + (Recurrent Injuries * Recurrence Weight) + (Average Recovery Time / 10)
-
-    Expected Output:
-        dict: A dictionary where each key is a player's name (str) and the value is their calculated risk coefficient (float).
-
-    Example Output:
-        {
-            'Marc-André ter Stegen': 45.6,
-            'Iñaki Peña': 22.3,
-            ...
-        }
-    """
-    # Define severity weights
-    severity_weights = {
-        "Mild": 1,
-        "Moderate": 2,
-        "Severe": 3
-    }
-    recurrence_weight = 2  # Weight for recurrent injuries
-
-    risk_coefficients = {}
-
-    for player, data in injury_history.items():
-        injuries = data['injuries']
-        total_injuries = len(injuries)
-        total_severity_weight = 0
-        total_recovery_time = 0
-        recurrent_injuries = 0
-
-        for injury in injuries:
-            severity = injury['severity']
-            recovery_time = injury['recovery_time']
-            recurrent = injury['recurrent']
-
-            # Add severity weight
-            total_severity_weight += severity_weights.get(severity, 0)
-
-            # Add recovery time
-            total_recovery_time += recovery_time
-
-            # Count recurrent injuries
-            if recurrent == "Yes":
-                recurrent_injuries += 1
-
-        # Calculate average recovery time
-        average_recovery_time = total_recovery_time / total_injuries if total_injuries > 0 else 0
-
-        # Calculate risk coefficient
-        risk_coefficient = (
-            (total_injuries * total_severity_weight) +
-            (recurrent_injuries * recurrence_weight) +
-            (average_recovery_time / 10)
-        )
-
-        # Store the result in the dictionary
-        risk_coefficients[player] = round(risk_coefficient, 2)
-
-    return risk_coefficients
\ No newline at end of file
+import numpy as np
+from read_files.injury_records import SEVERITY_CODES, build_injury_records
+
+# Weight of every severity code (index = code in SEVERITY_CODES, 0 = unknown severity)
+SEVERITY_WEIGHTS = np.zeros(max(SEVERITY_CODES.values()) + 1, dtype=np.int64)
+SEVERITY_WEIGHTS[[SEVERITY_CODES["Mild"], SEVERITY_CODES["Moderate"], SEVERITY_CODES["Severe"]]] = [1, 2, 3]
+RECURRENCE_WEIGHT = 2  # Weight for recurrent injuries
+
+def calculate_coefficient_risk(injury_history):
+    """
+    Name:
+        calculate_coefficient_risk
+
+    Parameters:
+        injury_history (dict): A dictionary where each key is a player's name (str) and the value is a dictionary
+                               containing a list of injuries. Each injury is represented as a dictionary with the following attributes:
+                               - date (str)
+                               - injury_type (str)
+                               - recovery_time (int, in days)
+                               - severity (str)
+                               - minutes_played (int)
+                               - recurrent (str: "Yes" or "No")
+
+    Description:
+        Calculates a risk coefficient for each player based on their injury history. The formula used is:
+        Risk Coefficient = (Total Injuries * Severity Weight) + (Recurrent Injuries * Recurrence Weight) + (Average Recovery Time / 10)
+        The history is converted once into a structured array (`build_injury_records`) and the coefficients
+        of all players are computed together by `calculate_coefficient_risk_from_records`.
+
+    Expected Output:
+        dict: A dictionary where each key is a player's name (str) and the value is their calculated risk coefficient (float).
+
+    Example Output:
+        {
+            'Marc-André ter Stegen': 45.6,
+            'Iñaki Peña': 22.3,
+            ...
+        }
+    """
+    return calculate_coefficient_risk_from_records(*build_injury_records(injury_history))
+
+def calculate_coefficient_risk_from_records(player_names, records):
+    """
+    Name:
+        calculate_coefficient_risk_from_records
+
+    Parameters:
+        player_names (list): Names of the players; the player ids of the records are positions in this list.
+        records (ndarray): Injury records of dtype `INJURY_RECORD_DTYPE` (see `build_injury_records`).
+
+    Description:
+        Computes the risk coefficient of every player with grouped reductions over the records instead of a
+        loop over per-player lists: `np.bincount` on the player ids gives the number of injuries, and the
+        same call weighted by the severity weights, the recovery times and the recurrent flags gives the
+        per-player sums. All the sums are of integers, so they are exact, and the final formula and rounding
+        are applied as in the original loop, giving identical coefficients. Players without injuries get 0.
+
+    Expected Output:
+        dict: A dictionary where each key is a player's name (str) and the value is their calculated risk coefficient (float).
+
+    Example:
+        calculate_coefficient_risk_from_records(*build_injury_records(injury_history))
+        {'Marc-André ter Stegen': 45.6, 'Iñaki Peña': 22.3, ...}
+    """
+    num_players = len(player_names)
+    player_ids = records['player_id']
+    total_injuries = np.bincount(player_ids, minlength=num_players)
+    total_severity_weight = np.bincount(player_ids, weights=SEVERITY_WEIGHTS[records['severity']], minlength=num_players)
+    total_recovery_time = np.bincount(player_ids, weights=records['recovery_time'], minlength=num_players)
+    recurrent_injuries = np.bincount(player_ids, weights=records['recurrent'], minlength=num_players)
+
+    # Calculate average recovery time (0 for players without injuries)
+    average_recovery_time = total_recovery_time / np.maximum(total_injuries, 1)
+
+    # Calculate risk coefficient
+    risk_coefficients = (
+        (total_injuries * total_severity_weight) +
+        (recurrent_injuries * RECURRENCE_WEIGHT) +
+        (average_recovery_time / 10)
+    )
+
+    # Python's round, so the results match the per-player computation exactly
+    return {player: round(risk_coefficient, 2) for player, risk_coefficient in zip(player_names, risk_coefficients.tolist())}
@@ -0,0 +1,67 @@
+import os
+from read_files.read_injury_history import read_injury_history, injury_journal_path, JOURNAL_OFFSET_PREFIX
+
+def format_injury_line(injury_data):
+    """Formats an injury dictionary as one line of the injury history ("date, type, days, severity, minutes, recurrent")."""
+    return (
+        f"{injury_data['date']}, {injury_data['injury_type']}, {injury_data['recovery_time']}, "
+        f"{injury_data['severity']}, {injury_data['minutes_played']}, {injury_data['recurrent']}"
+    )
+
+def write_injury_history(file_path, injury_history, journal_offset=0):
+    """
+    Name:
+        write_injury_history
+
+    Parameters:
+        file_path (str): Path to the `injury_history.txt` file to write.
+        injury_history (dict): Injury history as returned by `read_injury_history`.
+        journal_offset (int): Number of journal bytes included in `injury_history`. Written in the first line
+                              so that `read_injury_history` only merges the journal entries after it.
+
+    Description:
+        Writes the injury history in the usual human-readable layout, one section per player:
+            # Player: <name>
+            # Injury History (Last 5 Years)
+            <one line per injury, newest first, or "No recorded injuries">
+        The file is written to a temporary file first and then moved over the old one, so readers always
+        see either the old or the new version.
+
+    Expected Output:
+        None: The function writes `file_path`.
+    """
+    blocks = []
+    for player, data in injury_history.items():
+        block = [f"# Player: {player}", "# Injury History (Last 5 Years)"]
+        block.extend(format_injury_line(injury) for injury in data['injuries'])
+        if not data['injuries']:
+            block.append("No recorded injuries")
+        blocks.append("\n".join(block))
+
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        file.write(f"{JOURNAL_OFFSET_PREFIX} {journal_offset}\n")
+        file.write("\n\n".join(blocks) + "\n")
+    os.replace(temp_path, file_path)
+
+def compact_injury_history(file_path):
+    """
+    Name:
+        compact_injury_history
+
+    Parameters:
+        file_path (str): Path to the `injury_history.txt` file.
+
+    Description:
+        Folds the injury journal into `injury_history.txt`. The journal size is taken first, the history is read
+        merged with the journal up to that size, and the result is written back with `write_injury_history`.
+        Injuries appended to the journal while the compaction runs stay after the recorded offset and are
+        merged by the next read.
+
+    Expected Output:
+        None: The function rewrites `file_path`. The journal itself is never modified.
+    """
+    journal_path = injury_journal_path(file_path)
+    journal_size = os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+    injury_history = read_injury_history(file_path, journal_path, journal_size)
+    write_injury_history(file_path, injury_history, journal_size)
@@ -0,0 +1,178 @@
+from datetime import date
+from functions.injuries.calculate_coeficient_risk import SEVERITY_WEIGHTS, RECURRENCE_WEIGHT
+from read_files.injury_records import SEVERITY_CODES
+
+# An injury counts half as much after this many days
+DEFAULT_HALF_LIFE_DAYS = 365
+
+_EPOCH = date(1970, 1, 1)
+
+def _day(injury_date):
+    # Day number of a 'YYYY-MM-DD' date (days since 1970-01-01, as datetime64[D])
+    return (date.fromisoformat(injury_date) - _EPOCH).days
+
+def _severity_weight(severity):
+    # Weight of a severity name, from the weights of `calculate_coefficient_risk` (0 if unknown)
+    return int(SEVERITY_WEIGHTS[SEVERITY_CODES.get(severity, 0)])
+
+class DecayedInjuryRisk:
+    """
+    Name:
+        DecayedInjuryRisk
+
+    Parameters:
+        half_life_days (float, optional): Days after which an injury weighs half as much. Defaults to 365.
+                                          None disables the decay.
+
+    Description:
+        Time-decayed version of the risk coefficient of `calculate_coefficient_risk`. Every injury is weighted
+        by w = 0.5 ** (age in days / half-life), and only the injuries on or before the date count:
+            Risk Coefficient = (Injuries * Σ w * Severity Weight) + (Σ w * Recurrent * 2) + (Average Recovery Time / 10)
+        Each weight applies once, so one injury weighs half as much after one half-life. The number of
+        injuries is not decayed (it is the multiplier of the original formula), and the average recovery time
+        is the w-weighted mean (Σ w * Recovery Time / Σ w): it follows the most recent injuries but does not
+        fade, since it is an average. With half_life_days=None every weight is 1 and the coefficients are the
+        same as `calculate_coefficient_risk`.
+
+        The state of a player is a reference day (the date of their latest injury), the number of injuries
+        and four decayed sums (weights, severity weights, recurrent injuries, recovery days). Ageing all the
+        injuries of a player by d days multiplies every sum by the same factor 0.5 ** (d / half-life), so:
+            - `add_injury` ages the sums to the newer of the two dates and adds the injury in O(1),
+            - `coefficient` ages the sums to any date after the reference day in closed form. For a date
+              before it, the coefficient is computed again from the player's injuries up to that date (the
+              injuries are appended as they come and only sorted by date when such a date is asked for).
+
+    Example:
+        risk = DecayedInjuryRisk.from_injury_history(injury_history)
+        risk.add_injury("Pedri", {'date': "2025-03-02", 'recovery_time': 21, 'severity': "Moderate", 'recurrent': "No", ...})
+        risk.coefficients("2025-03-09")
+        {'Marc-André ter Stegen': 24.44, 'Iñaki Peña': 5.98, 'Ronald Araujo': 17.09, ..., 'Pedri': 33.65, ...}
+    """
+
+    def __init__(self, half_life_days=DEFAULT_HALF_LIFE_DAYS):
+        self.half_life_days = half_life_days
+        self.state = {}     # player -> [reference day, injuries, weights, severity weight, recurrent injuries, recovery days]
+        self.injuries = {}  # player -> [(day, severity weight, recurrent, recovery days), ...]
+        self._unsorted = set()  # Players whose injuries were not added in date order
+
+    @classmethod
+    def from_injury_history(cls, injury_history, half_life_days=DEFAULT_HALF_LIFE_DAYS):
+        """Builds the model from an injury history as returned by `read_injury_history`."""
+        risk = cls(half_life_days)
+        for player, data in injury_history.items():
+            risk.state.setdefault(player, [0, 0, 0.0, 0.0, 0.0, 0.0])
+            risk.injuries.setdefault(player, [])
+            for injury in data['injuries']:
+                risk.add_injury(player, injury)
+        return risk
+
+    @classmethod
+    def from_records(cls, player_names, records, half_life_days=DEFAULT_HALF_LIFE_DAYS):
+        """
+        Builds the model from structured injury records (see `build_injury_records`) with grouped sums: every
+        player's sums are computed at the date of their latest injury with one `np.bincount` per sum.
+        """
+        import numpy as np
+
+        risk = cls(half_life_days)
+        player_ids = records['player_id']
+        days = records['date'].astype(np.int64)
+        reference_days = np.zeros(len(player_names), dtype=np.int64)
+        if len(records):
+            np.maximum.at(reference_days, player_ids, days)
+        weights = risk._decay(reference_days[player_ids] - days) if half_life_days is not None else np.ones(len(records))
+
+        severity_weights = SEVERITY_WEIGHTS[records['severity']]
+        counts = np.bincount(player_ids, minlength=len(player_names)).tolist()
+        sums = [
+            np.bincount(player_ids, weights=weights * values, minlength=len(player_names)).tolist()
+            for values in (np.ones(len(records)), severity_weights, records['recurrent'], records['recovery_time'])
+        ]
+        for i, player in enumerate(player_names):
+            risk.state[player] = [int(reference_days[i]), counts[i]] + [total[i] for total in sums]
+            risk.injuries[player] = []
+        for player_id, day, severity_weight, recurrent, recovery_time in zip(
+            player_ids.tolist(), days.tolist(), severity_weights.tolist(), records['recurrent'].tolist(), records['recovery_time'].tolist()
+        ):
+            risk.injuries[player_names[player_id]].append((day, severity_weight, int(recurrent), recovery_time))
+        for injuries in risk.injuries.values():
+            injuries.sort()
+        return risk
+
+    def _decay(self, days):
+        # Weight of an injury `days` days old (the same factor ages a whole sum)
+        if self.half_life_days is None:
+            return 1.0
+        return 0.5 ** (days / self.half_life_days)
+
+    def add_injury(self, player, injury):
+        """Adds one injury (a dictionary as in the injury history) to the player's sums in O(1)."""
+        day = _day(injury['date'])
+        severity_weight = _severity_weight(injury['severity'])
+        recurrent = int(injury['recurrent'] == "Yes")
+        injuries = self.injuries.setdefault(player, [])
+        if injuries and day < injuries[-1][0]:
+            self._unsorted.add(player)
+        injuries.append((day, severity_weight, recurrent, injury['recovery_time']))
+
+        state = self.state.get(player)
+        if state is None or not state[1]:
+            state = self.state[player] = [day, 0, 0.0, 0.0, 0.0, 0.0]
+        elif day > state[0]:
+            # Age the sums to the new injury, which then has weight 1
+            factor = self._decay(day - state[0])
+            state[2:] = [total * factor for total in state[2:]]
+            state[0] = day
+
+        weight = self._decay(state[0] - day)
+        state[1] += 1
+        state[2] += weight
+        state[3] += weight * severity_weight
+        state[4] += weight * recurrent
+        state[5] += weight * injury['recovery_time']
+
+    def coefficient(self, player, current_date):
+        """
+        Returns the player's risk coefficient on a date ('YYYY-MM-DD'). On or after the player's latest injury
+        the sums are aged in closed form; before it, only the injuries up to the date are counted.
+        """
+        state = self.state.get(player)
+        if state is None or not state[1]:
+            return 0.0
+        day = _day(current_date)
+        if day >= state[0]:
+            factor = self._decay(day - state[0])
+            injuries, weights = state[1], state[2]
+            severity_weight, recurrent_injuries = state[3] * factor, state[4] * factor
+            recovery_time = state[5]
+        else:
+            # Injuries after the date have not happened yet
+            if player in self._unsorted:
+                self.injuries[player].sort()
+                self._unsorted.discard(player)
+            injuries, weights, severity_weight, recurrent_injuries, recovery_time = 0, 0.0, 0.0, 0.0, 0.0
+            for injury_day, injury_severity, recurrent, injury_recovery in self.injuries[player]:
+                if injury_day > day:
+                    break
+                weight = self._decay(day - injury_day)
+                injuries += 1
+                weights += weight
+                severity_weight += weight * injury_severity
+                recurrent_injuries += weight * recurrent
+                recovery_time += weight * injury_recovery
+            if not injuries:
+                return 0.0
+
+        risk_coefficient = (
+            (injuries * severity_weight) +
+            (recurrent_injuries * RECURRENCE_WEIGHT) +
+            (recovery_time / weights / 10)
+        )
+        return round(risk_coefficient, 2)
+
+    def coefficients(self, current_date, players=None):
+        """
+        Returns {player: risk coefficient} on a date for the given players (by default every player with
+        a history), in the format of `calculate_coefficient_risk`.
+        """
+        return {player: self.coefficient(player, current_date) for player in (self.state if players is None else players)}
@@ -0,0 +1,142 @@
+import numpy as np
+from functions.build_cost_matrix import build_cost_matrix, calculate_player_metrics
+from functions.generate_lineup import LINEUP_POSITIONS
+from functions.hungarian_algorithm import augment_row
+from functions.murty_ranking import augment_released_row
+
+class LineupSolver:
+    """
+    Name:
+        LineupSolver
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        played_minutes (dict): Dictionary with player names as keys and minutes played as values.
+        player_performance (dict): Dictionary with player names as keys and performance scores (1.0-10.0) as values.
+        risk_coefficients (dict): Dictionary with player names as keys and injury risk coefficients as values.
+        age_risks (dict): Dictionary with player names as keys and age risk coefficients as values.
+        unavailable_players (iterable, optional): Players left out from the start (e.g. injured ones).
+        positions (list, optional): Positions to fill. Defaults to the 4-3-3 `LINEUP_POSITIONS`.
+
+    Description:
+        Keeps the optimal lineup and the solver state (the dual potentials and the assignment of the
+        positions x players matrix) between changes, so an injury, a return or a new cost does not rebuild
+        the matrix and solve it again from scratch:
+        - `remove_player`, `add_player` and `update_cost` only change the player's column of the matrix.
+        - The column's potential is lowered if needed to keep the potentials dual feasible, and the row
+          (position) or padding row that lost the player is added back with a single augmenting path
+          (`augment_released_row`). The players outside the lineup are the columns of the zero-cost padding
+          rows of the square problem, as in `rank_assignments`.
+        A change costs O(positions x players) instead of a full solve, and the lineup has the same total cost
+        as `generate_lineup` for the same available players.
+
+    Example:
+        solver = LineupSolver(players, played_minutes, player_performance, risk_coefficients, age_risks)
+        solver.remove_player("Marc-André ter Stegen")  # Injured during the warm-up
+        solver.lineup()
+        [('Goalkeeper', 'Iñaki Peña'), ('Centre-back', 'Pau Cubarsí'), ...]
+    """
+
+    def __init__(self, players, played_minutes, player_performance, risk_coefficients, age_risks, unavailable_players=(), positions=LINEUP_POSITIONS):
+        self.positions = list(positions)
+        self.player_names = list(players)
+        self.player_columns = {player: col for col, player in enumerate(self.player_names)}
+        self.available = np.ones(len(self.player_names), dtype=bool)
+
+        # Costs of every player (positions x players); the matrix keeps np.inf in the unavailable columns
+        # and a last row of zeros for the padding rows
+        self.costs = build_cost_matrix(players, self.player_names, self.positions, played_minutes, player_performance, risk_coefficients, age_risks).T
+        self.matrix = np.vstack([self.costs, np.zeros(len(self.player_names))])
+        for player in unavailable_players:
+            col = self.player_columns[player]
+            self.available[col] = False
+            self.matrix[:-1, col] = np.inf
+
+        # Initial solve. The free columns keep v = 0 = max(v), as the padding rows need
+        num_rows = len(self.positions)
+        if num_rows > len(self.player_names):
+            raise ValueError("Not enough players to fill every position")
+        self.u = np.zeros(num_rows)
+        self.v = np.zeros(len(self.player_names))
+        self.col_to_row = np.full(len(self.player_names), -1)
+        for row in range(num_rows):
+            augment_row(self.matrix[:-1], self.u, self.v, self.col_to_row, row)
+
+    def lineup(self):
+        """Returns the current optimal lineup as a list of (position, player) tuples, in the order of the positions."""
+        row_to_col = np.empty(len(self.positions), dtype=int)
+        cols = np.flatnonzero(self.col_to_row >= 0)
+        row_to_col[self.col_to_row[cols]] = cols
+        return [(position, self.player_names[col]) for position, col in zip(self.positions, row_to_col)]
+
+    def total_cost(self):
+        """Returns the total cost of the current lineup."""
+        cols = np.flatnonzero(self.col_to_row >= 0)
+        return float(self.matrix[self.col_to_row[cols], cols].sum())
+
+    def remove_player(self, player):
+        """Makes a player unavailable (e.g. injured) and repairs the lineup if they were in it."""
+        col = self.player_columns[player]
+        self._set_column(col, np.full(len(self.positions), np.inf))
+        self.available[col] = False
+
+    def add_player(self, player, positions=None, cost=None):
+        """
+        Makes a player available again and repairs the lineup. A player who is not in the squad yet is
+        added with their `positions` (list) and lineup `cost` (float, as in `calculate_player_metrics`).
+        """
+        if player not in self.player_columns:
+            if positions is None or cost is None:
+                raise ValueError(f"New player {player} needs positions and a cost")
+            column = np.array([cost if position in positions else np.inf for position in self.positions])
+
+            # New column held by a new padding row, at the padding rows' potential
+            self.player_columns[player] = len(self.player_names)
+            self.player_names.append(player)
+            self.available = np.append(self.available, False)
+            self.costs = np.column_stack([self.costs, column])
+            self.matrix = np.column_stack([self.matrix, np.append(np.full(len(self.positions), np.inf), 0.0)])
+            self.v = np.append(self.v, np.max(self.v))
+            self.col_to_row = np.append(self.col_to_row, -1)
+
+        col = self.player_columns[player]
+        self._set_column(col, self.costs[:, col])
+        self.available[col] = True
+
+    def update_cost(self, player, cost):
+        """
+        Sets the lineup cost of a player (e.g. after their minutes or performance changed, see
+        `calculate_player_metrics`) and repairs the lineup.
+        """
+        col = self.player_columns[player]
+        self.costs[:, col] = np.where(np.isfinite(self.costs[:, col]), cost, np.inf)
+        if self.available[col]:
+            self._set_column(col, self.costs[:, col])
+
+    def update_player_metrics(self, player, played_minutes, player_performance, risk_coefficients, age_risks):
+        """Recomputes the cost of one player from the metric dictionaries and repairs the lineup."""
+        self.update_cost(player, calculate_player_metrics([player], played_minutes, player_performance, risk_coefficients, age_risks)[0])
+
+    def _set_column(self, col, column):
+        # Replaces the costs of a column and repairs the optimum with one augmenting path
+        row = self.col_to_row[col]
+        padding_cols = self.col_to_row == -1
+        padding_cols[col] = False
+        padding_potential = self.v[col] if row == -1 else (np.max(self.v[padding_cols]) if padding_cols.any() else np.inf)
+
+        # Lower the column's potential so every reduced cost in it stays >= 0
+        new_v = min(padding_potential, np.min(column - self.u))
+        if row == -1 and not new_v < self.v[col]:
+            self.matrix[:-1, col] = column  # Still not worth a place in the lineup
+            return
+
+        state = (self.matrix[:-1, col].copy(), self.u.copy(), self.v.copy(), self.col_to_row.copy())
+        self.matrix[:-1, col] = column
+        if np.isfinite(new_v):
+            self.v[col] = new_v
+        self.col_to_row[col] = -1
+        try:
+            augment_released_row(self.matrix, self.u, self.v, self.col_to_row, row, col)
+        except ValueError:
+            self.matrix[:-1, col], self.u, self.v, self.col_to_row = state
+            raise ValueError("Not enough available players to fill every position") from None
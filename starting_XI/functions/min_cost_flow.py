@@ -0,0 +1,135 @@
+import heapq
+import numpy as np
+
+def min_cost_flow(num_players, role_capacities, edge_players, edge_roles, edge_costs):
+    """
+    Name:
+        min_cost_flow
+
+    Parameters:
+        num_players (int): Number of candidate players. Players are identified by their index (0 .. num_players - 1).
+        role_capacities (list): Number of slots to fill for each role, indexed by role (e.g. [1, 2, 1, ...] when
+                                role 1 is "Centre-back" in a 4-3-3).
+        edge_players (ndarray): Player index of each eligible (player, role) edge.
+        edge_roles (ndarray): Role index of each eligible (player, role) edge.
+        edge_costs (ndarray): Cost of assigning the player of each edge to its role.
+
+    Description:
+        Solves the lineup assignment as a minimum-cost flow on the sparse bipartite graph
+        source -> role (capacity = slots of the role) -> player (one edge per eligible position) -> sink.
+        Instead of duplicating columns for roles with several slots, each role keeps a capacity.
+
+        The flow is built with successive shortest paths: every slot is filled by one Dijkstra search on
+        the residual graph using node potentials (reduced costs), so a previously chosen player can be moved
+        to another role when that lowers the total cost. Each search stops as soon as the sink is reached.
+        Memory is O(edges) and time is O(slots * edges * log(nodes)), independent of players x slots.
+
+    Expected Output:
+        list: A list of (player_index, role_index) tuples, sorted by player index.
+
+    Raises:
+        ValueError: If the slots (or, with fewer players than slots, the players) cannot all be placed
+                    using the eligible edges.
+
+    Example:
+        Two players for one "Goalkeeper" slot (role 0) and one "Striker" slot (role 1):
+        min_cost_flow(2, [1, 1], np.array([0, 1, 1]), np.array([0, 0, 1]), np.array([3.0, 1.0, 2.0]))
+        [(0, 0), (1, 1)]
+    """
+    num_roles = len(role_capacities)
+    edge_players = np.asarray(edge_players, dtype=int)
+    edge_roles = np.asarray(edge_roles, dtype=int)
+    edge_costs = np.asarray(edge_costs, dtype=float)
+
+    # Group the edges by role (compressed adjacency lists)
+    order = np.argsort(edge_roles, kind='stable')
+    role_start = np.searchsorted(edge_roles[order], np.arange(num_roles + 1)).tolist()
+    order = order.tolist()
+    players_of_edge = edge_players.tolist()
+    roles_of_edge = edge_roles.tolist()
+    costs_of_edge = edge_costs.tolist()
+
+    # Nodes: roles (0 .. R-1), players (R .. R+P-1) and the sink (R+P)
+    sink = num_roles + num_players
+    num_nodes = sink + 1
+
+    # Initial potentials keep every reduced cost non-negative, even with negative edge costs
+    potential = [0.0] * num_nodes
+    if len(costs_of_edge):
+        cheapest_edge = np.full(num_players, np.inf)
+        np.minimum.at(cheapest_edge, edge_players, edge_costs)
+        reachable = np.isfinite(cheapest_edge)
+        cheapest_edge[~reachable] = 0.0
+        potential[num_roles:sink] = cheapest_edge.tolist()
+        potential[sink] = float(cheapest_edge[reachable].min())
+
+    capacity = list(role_capacities)
+    matched_edge = [-1] * num_players  # Edge currently used by each player (-1 = not in the lineup)
+
+    # Fill every slot, or place every player when there are fewer players than slots
+    for _ in range(min(sum(capacity), num_players)):
+        dist = [np.inf] * num_nodes
+        previous = [-1] * num_nodes  # Role reached from a player, player reached by an edge, sink reached from a player
+        heap = []
+        for role in range(num_roles):
+            if capacity[role] > 0:
+                dist[role] = 0.0
+                heap.append((0.0, role))
+        heapq.heapify(heap)
+
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            if node == sink:
+                break
+            if node < num_roles:
+                # Role -> player along every eligible edge not already used
+                for k in range(role_start[node], role_start[node + 1]):
+                    edge = order[k]
+                    player = players_of_edge[edge]
+                    if matched_edge[player] == edge:
+                        continue
+                    player_node = num_roles + player
+                    nd = d + costs_of_edge[edge] + potential[node] - potential[player_node]
+                    if nd < dist[player_node]:
+                        dist[player_node] = nd
+                        previous[player_node] = edge
+                        heapq.heappush(heap, (nd, player_node))
+            else:
+                player = node - num_roles
+                edge = matched_edge[player]
+                if edge == -1:
+                    # A free player closes the path to the sink
+                    target = sink
+                    nd = d + potential[node] - potential[sink]
+                else:
+                    # A selected player can give their role back (reverse edge)
+                    target = roles_of_edge[edge]
+                    nd = d - costs_of_edge[edge] + potential[node] - potential[target]
+                if nd < dist[target]:
+                    dist[target] = nd
+                    previous[target] = player
+                    heapq.heappush(heap, (nd, target))
+
+        if dist[sink] == np.inf:
+            raise ValueError("Not enough eligible players to fill every position")
+
+        # Update the potentials (nodes beyond the sink distance are capped so reduced costs stay non-negative)
+        sink_dist = dist[sink]
+        for node in range(num_nodes):
+            potential[node] += min(dist[node], sink_dist)
+
+        # Walk the path back from the sink, moving every player on it to their new role
+        player = previous[sink]
+        while True:
+            edge = previous[num_roles + player]
+            role = roles_of_edge[edge]
+            displaced_player = previous[role]
+            matched_edge[player] = edge
+            if displaced_player == -1:
+                capacity[role] -= 1
+                break
+            player = displaced_player
+
+    return [(player, roles_of_edge[edge]) for player, edge in enumerate(matched_edge) if edge != -1]
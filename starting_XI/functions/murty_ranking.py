@@ -0,0 +1,193 @@
+import heapq
+import numpy as np
+from functions.hungarian_algorithm import augment_row
+
+def augment_released_row(matrix, u, v, col_to_row, row, released_col):
+    """
+    Name:
+        augment_released_row
+
+    Parameters:
+        matrix (ndarray): A (rows + 1) x columns float array: the cost matrix followed by the padding row
+                          (0 for the columns the padding rows may take, np.inf for the others).
+        u (ndarray): Row potentials of the real rows. Updated in place.
+        v (ndarray): Column potentials. Updated in place.
+        col_to_row (ndarray): Row assigned to each column, or -1 if the column is taken by a padding row.
+                              Updated in place.
+        row (int): The row that lost its column, or -1 for a padding row (when a padding column got cheaper
+                   for the real rows and its padding row gave it up).
+        released_col (int): The column the row lost (now the only column without any row).
+
+    Description:
+        Same shortest augmenting path as `augment_row`, on the square problem where the matrix is padded with
+        zero-cost rows that take the unused columns. All the padding rows have the same costs, and dual
+        feasibility makes the padding columns share one potential, so they are handled as a single row: the
+        first time the search reaches a padding column, every padding column is reached at the same distance
+        and the padding row is scanned once instead of once per padding column.
+
+    Expected Output:
+        None: `u`, `v` and `col_to_row` are updated in place.
+
+    Raises:
+        ValueError: If the row cannot be added back (the subproblem has no assignment).
+    """
+    num_cols = matrix.shape[1]
+    min_slack = np.full(num_cols, np.inf)
+    way = np.full(num_cols, -1)
+    used = np.zeros(num_cols, dtype=bool)
+    tree_rows = [row] if row >= 0 else []
+
+    current_col = -1
+    if row >= 0:
+        reduced = matrix[row] - u[row] - v
+    else:
+        # Any potential that keeps the padding row dual feasible will do
+        reduced = matrix[-1] + np.max(v[np.isfinite(matrix[-1])]) - v
+    while True:
+        free = ~used
+        improved = free & (reduced < min_slack)
+        min_slack[improved] = reduced[improved]
+        way[improved] = current_col
+
+        candidates = np.where(free, min_slack, np.inf)
+        next_col = int(np.argmin(candidates))
+        delta = candidates[next_col]
+        if not np.isfinite(delta):
+            raise ValueError("cost matrix is infeasible")
+
+        u[tree_rows] += delta
+        v[used] -= delta
+        min_slack[free] -= delta
+
+        used[next_col] = True
+        current_col = next_col
+        if next_col == released_col:
+            break
+        if col_to_row[next_col] == -1:
+            # Reached the padding rows: the other padding columns are tight at the same distance
+            padding_cols = col_to_row == -1
+            padding_cols[released_col] = False
+            used |= padding_cols
+            reduced = matrix[-1] + v[next_col] - v
+        else:
+            current_row = col_to_row[next_col]
+            tree_rows.append(current_row)
+            reduced = matrix[current_row] - u[current_row] - v
+
+    # Flip the matching along the path (a column after a padding column goes to the padding rows)
+    while current_col != -1:
+        previous_col = way[current_col]
+        col_to_row[current_col] = row if previous_col == -1 else col_to_row[previous_col]
+        current_col = previous_col
+
+def rank_assignments(cost_matrix, k, row_groups=None):
+    """
+    Name:
+        rank_assignments
+
+    Parameters:
+        cost_matrix (ndarray): A 2D float array with no more rows than columns (e.g. positions x players).
+                               np.inf marks forbidden cells.
+        k (int): Number of assignments to return.
+        row_groups (list, optional): Group of every row. Rows of the same group must have the same costs (e.g.
+                                     the two "Centre-back" slots); assignments that only differ by swapping
+                                     columns between rows of a group count once. Defaults to one group per row.
+
+    Description:
+        Ranks the assignments of the rows to distinct columns by total cost with Murty's partitioning:
+        the best assignment is found, then the remaining solutions are split into disjoint subproblems
+        (for its i-th (group, column) pair: keep the pairs before it, forbid this one), the best solution
+        of every subproblem goes into a priority queue, and the cheapest one is the next assignment.
+
+        Subproblems are solved from their parent's solver state instead of from scratch. The problem is
+        treated as a square one padded with zero-cost rows, so the potentials have no sign constraint.
+        Forbidding or forcing cells only raises costs, which keeps the parent's potentials dual feasible;
+        the subproblem then only unassigns one row and adds it back with one augmenting path
+        (`augment_released_row`).
+
+        With the parent's potentials, a subproblem costs at least the parent's cost plus the smallest reduced
+        cost left in the unassigned row. Subproblems are queued with that lower bound and only solved when
+        they reach the front of the queue, so most of them are never solved.
+
+    Expected Output:
+        list: Up to k (total cost, row indices, column indices) tuples, in increasing order of cost. Fewer are
+              returned if there are fewer feasible assignments.
+
+    Raises:
+        ValueError: If there are more rows than columns, or no assignment avoids the forbidden cells.
+
+    Example:
+        rank_assignments(np.array([[1.0, 2.0, 4.0], [2.0, 1.0, 3.0]]), 3)
+        [(2.0, array([0, 1]), array([0, 1])), (4.0, array([0, 1]), array([1, 0])), (4.0, array([0, 1]), array([0, 2]))]
+    """
+    cost_matrix = np.asarray(cost_matrix, dtype=float)
+    num_rows, num_cols = cost_matrix.shape
+    if num_rows > num_cols:
+        raise ValueError("cost matrix has more rows than columns")
+    groups = np.arange(num_rows) if row_groups is None else np.asarray(row_groups)
+    group_rows = [np.flatnonzero(groups == groups[row]) for row in range(num_rows)]
+    rows = np.arange(num_rows)
+
+    # Best assignment. `augment_row` only lowers the potentials of matched columns, so the free columns
+    # keep v = 0 = max(v): they are the columns of the padding rows (with u = 0) in the square problem.
+    u = np.zeros(num_rows)
+    v = np.zeros(num_cols)
+    col_to_row = np.full(num_cols, -1)
+    for row in range(num_rows):
+        augment_row(cost_matrix, u, v, col_to_row, row)
+    matrix = np.vstack([cost_matrix, np.zeros(num_cols)])
+
+    def solution(col_to_row):
+        cols = np.empty(num_rows, dtype=int)
+        matched = np.flatnonzero(col_to_row >= 0)
+        cols[col_to_row[matched]] = matched
+        return float(cost_matrix[rows, cols].sum()), cols
+
+    # Queue of subproblems: (cost or lower bound, tie breaker, solved, columns, matrix, u, v, col_to_row, first free row).
+    # A child is queued unsolved with a lower bound of its cost and only solved when it reaches the front.
+    counter = 0
+    total, cols = solution(col_to_row)
+    queue = [(total, counter, True, cols, matrix, u, v, col_to_row, 0)]
+    ranked = []
+
+    while queue and len(ranked) < k:
+        total, _, solved, cols, matrix, u, v, col_to_row, forced = heapq.heappop(queue)
+        if not solved:
+            # Unassign the row of the forbidden pair and add it back with one augmenting path
+            row = forced
+            u, v, col_to_row = u.copy(), v.copy(), col_to_row.copy()
+            col_to_row[cols[row]] = -1
+            try:
+                augment_released_row(matrix, u, v, col_to_row, row, cols[row])
+            except ValueError:
+                continue  # No assignment in this subproblem
+            total, cols = solution(col_to_row)
+            counter += 1
+            heapq.heappush(queue, (total, counter, True, cols, matrix, u, v, col_to_row, forced))
+            continue
+
+        ranked.append((total, rows.copy(), cols))
+        if len(ranked) == k:
+            break
+
+        # Partition the rest of this subproblem on its free rows; earlier pairs are forced in later children
+        matrix = matrix.copy()
+        for row in range(forced, num_rows):
+            col = cols[row]
+            child = matrix.copy()
+            child[group_rows[row], col] = np.inf
+
+            # Every other assignment costs at least this one plus the reduced cost of the row's new column
+            bound = total + np.min(child[row] - u[row] - v)
+            if np.isfinite(bound):
+                counter += 1
+                heapq.heappush(queue, (bound, counter, False, cols, child, u, v, col_to_row, row))
+
+            # Force (row, col) for the next children: the row keeps this column and nobody else (padding
+            # rows included) can take it
+            kept_cost = matrix[row, col]
+            matrix[row] = np.inf
+            matrix[:, col] = np.inf
+            matrix[row, col] = kept_cost
+
+    return ranked
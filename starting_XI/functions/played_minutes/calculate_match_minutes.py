@@ -0,0 +1,53 @@
+from functions.squad_model import SquadModel
+
+def calculate_match_minutes(lineup, players, substitutions, total_match_time, position_index=None):
+    """
+    Name:
+        calculate_match_minutes
+
+    Parameters:
+        lineup (list):
+            List of (position, player) tuples with the starting lineup of the match.
+        players (dict):
+            Dictionary containing player information. Each key is the player's name, and the value is a dictionary
+            with the player's 'number' and 'positions'.
+        substitutions (list):
+            List of (substituted player, entering player, minute) tuples, in the order they happened.
+        total_match_time (int):
+            Duration of the match in minutes (90 plus the added time of both halves).
+        position_index (PositionIndex, optional):
+            Position index of the players (see `build_position_index`). Built from `players` if not given.
+
+    Description:
+        Computes the minutes each player was on the pitch, without asking anything to the user (it is the
+        core of `register_match_changes` and of the batch mode).
+        - Starters are on the pitch from minute 0, and substitutes from the minute they entered.
+        - A player's time ends when they are substituted or at the end of the match.
+        - Every substitution is validated as in `register_match_changes`: the substituted player must be on the
+          pitch, the entering player must not be, and must be able to play the position.
+
+    Expected Output:
+        tuple: (match_minutes, lineup), where match_minutes is {player: minutes played in this match} and
+               lineup is the list of (position, player) tuples at the end of the match.
+
+    Raises:
+        ValueError: If a substitution is not valid.
+
+    Example:
+        calculate_match_minutes(lineup, players, [("Robert Lewandowski", "Pau Víctor", 70)], 94)
+        ({"Marc-André ter Stegen": 94, ..., "Robert Lewandowski": 70, "Pau Víctor": 24}, [..., ("Striker", "Pau Víctor")])
+    """
+    # The squad model keeps the lineup, the players on the pitch and the minute each one came on (starters: 0)
+    squad = SquadModel(players, lineup, position_index)
+    match_minutes = {}
+
+    for substituted_player, entering_player, minute in substitutions:
+        # Close the substituted player's time on the pitch (the entering player's starts at the minute)
+        since = squad.substitute(substituted_player, entering_player, minute, total_match_time)
+        match_minutes[substituted_player] = match_minutes.get(substituted_player, 0) + minute - since
+
+    # Players on the pitch at the final whistle played until the end of the match
+    for player, since in squad.in_lineup.items():
+        match_minutes[player] = match_minutes.get(player, 0) + total_match_time - since
+
+    return match_minutes, squad.lineup
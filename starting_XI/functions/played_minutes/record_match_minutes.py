@@ -0,0 +1,67 @@
+import os
+from read_files.read_played_minutes import read_played_minutes, minutes_ledger_path, read_ledger_offset
+from functions.played_minutes.update_played_minutes_file import update_played_minutes_file
+
+# Take a new snapshot of the totals once the ledger tail after the last snapshot grows beyond this size (bytes)
+SNAPSHOT_THRESHOLD = 16 * 1024
+
+def record_match_minutes(file_path, match_minutes, match_id=0):
+    """
+    Name:
+        record_match_minutes
+
+    Parameters:
+        file_path (str): 
+            Path to the `played_minutes.txt` file (the snapshot of the totals).
+        match_minutes (dict): 
+            Minutes played in this match only. Each key is the player's name (str) and the value is the
+            minutes the player was on the pitch (int).
+        match_id (int, optional): 
+            Identifier of the match stored with each record (e.g. the lineup number).
+
+    Description:
+        Appends one record per player of the match to the minutes ledger (`played_minutes.ledger`, next to
+        `played_minutes.txt`). The cost only depends on the number of players in the match.
+        - `read_played_minutes` adds the ledger records after the last snapshot to the snapshot totals.
+        - When the ledger tail grows beyond `SNAPSHOT_THRESHOLD` bytes, `snapshot_played_minutes` writes new
+          totals to `played_minutes.txt`.
+
+    Expected Output:
+        None: The function appends to the minutes ledger.
+
+    Example:
+        record_match_minutes("played_minutes.txt", {"Pedri": 70, "Gavi": 24}, match_id=12)
+
+        Appends to `played_minutes.ledger`:
+        ```
+        12,70,Pedri
+        12,24,Gavi
+        ```
+    """
+    records = "".join(f"{match_id},{minutes},{player}\n" for player, minutes in match_minutes.items())
+    with open(minutes_ledger_path(file_path), 'ab') as ledger:
+        ledger.write(records.encode('utf-8'))
+        ledger_size = ledger.tell()
+
+    if ledger_size - read_ledger_offset(file_path) > SNAPSHOT_THRESHOLD and os.path.exists(file_path):
+        snapshot_played_minutes(file_path)
+
+def snapshot_played_minutes(file_path):
+    """
+    Name:
+        snapshot_played_minutes
+
+    Parameters:
+        file_path (str): Path to the `played_minutes.txt` file.
+
+    Description:
+        Rebuilds the totals from the current snapshot plus the ledger tail (up to the ledger size taken at the
+        start) and writes them as the new snapshot. Records appended meanwhile stay after the recorded offset.
+
+    Expected Output:
+        None: The function rewrites `played_minutes.txt`. The ledger itself is never modified.
+    """
+    ledger_path = minutes_ledger_path(file_path)
+    ledger_size = os.path.getsize(ledger_path) if os.path.exists(ledger_path) else 0
+    played_minutes = read_played_minutes(file_path, ledger_path, ledger_size)
+    update_played_minutes_file(file_path, played_minutes, ledger_size)
@@ -1,137 +1,141 @@
-from functions.played_minutes.update_played_minutes_file import update_played_minutes_file
-
-def register_match_changes(lineup, players, played_minutes, played_minutes_file):
-    """
-    Name:
-        update_played_minutes_file
-
-    Parameters:
-        file_path (str): 
-            Path to the `played_minutes.txt` file where the played minutes data will be updated.
-        played_minutes (dict): 
-            Dictionary containing the played minutes for players. Each key is the player's name (str), 
-            and the value is the total minutes played (int).
-
-    Description:
-        This function updates the `played_minutes.txt` file with the new played minutes for players.
-        - If the file already exists, it reads the current played minutes and updates the values for existing players.
-        - If a player is not already in the file, they are added with their played minutes.
-        - The function ensures that the file is properly formatted, with each line containing a player's name and their total played minutes, separated by a comma.
-
-    Expected Output:
-        None: The function writes the updated played minutes directly to the `played_minutes.txt` file.
-
-    Example:
-        Given the following `played_minutes.txt` file:
-        ```
-        Marc-André ter Stegen,90
-        Robert Lewandowski,180
-        ```
-
-        Calling the function:
-        ```
-        update_played_minutes_file(
-            file_path="played_minutes.txt",
-            played_minutes={
-                "Marc-André ter Stegen": 45,
-                "Ferran Torres": 30
-            }
-        )
-        ```
-
-        Will update the file to:
-        ```
-        Marc-André ter Stegen,135
-        Robert Lewandowski,180
-        Ferran Torres,30
-        ```
-
-    Notes:
-        - The function assumes that the file is properly formatted, with each line containing a player's name and their played minutes, separated by a comma.
-        - If the file does not exist, it creates a new file and writes the played minutes.
-        - The function overwrites the file with the updated content.
-    """
-    # Ask for additional time
-    print("Registering changes during the match:")
-    first_half_extra = int(input("Enter additional time for the first half (in minutes): "))
-    second_half_extra = int(input("Enter additional time for the second half (in minutes): "))
-    total_match_time = 45 + first_half_extra + 45 + second_half_extra
-
-    print(f"\nTotal match duration: {total_match_time} minutes.")
-
-    # Register substitutions
-    while True:
-        substitution = input("\nWere there any substitutions during the match? (y/n): ").strip().lower()
-        if substitution != "y":
-            break
-
-        # Show the current lineup
-        print("\nPlayers in the current lineup:")
-        for position, player in lineup:
-            print(f"{player} ({players[player]['number']}) - {position}")
-
-        # Ask for the player who was substituted
-        substituted_number = int(input("\nEnter the number of the player who left: "))
-        substituted_player = None
-        substituted_position = None
-        for position, player in lineup:
-            if players[player]['number'] == substituted_number:
-                substituted_player = player
-                substituted_position = position
-                break
-
-        if not substituted_player:
-            print("Player number not found in the lineup.")
-            continue
-
-        # Show available players for the substitution
-        print("\nAvailable players for substitution:")
-        available_players = [
-            (player, attributes['number']) for player, attributes in players.items()
-            if substituted_position in attributes['positions'] and player not in [p for _, p in lineup]
-        ]
-        for player, number in available_players:
-            print(f"{player} ({number})")
-
-        # Ask for the player who entered
-        entering_number = int(input("\nEnter the number of the player who entered: "))
-        entering_player = None
-        for player, attributes in players.items():
-            if attributes['number'] == entering_number:
-                entering_player = player
-                break
-
-        if not entering_player:
-            print("Player number not found in the player list.")
-            continue
-
-        # Validate positions
-        if substituted_position not in players[entering_player]['positions']:
-            print(f"Player {entering_player} cannot play in the position {substituted_position}.")
-            continue
-
-        # Ask for the minute of the substitution
-        substitution_minute = int(input("\nEnter the minute of the substitution: "))
-        if substitution_minute < 0 or substitution_minute > total_match_time:
-            print("Invalid minute.")
-            continue
-            continue
-
-        # Update played minutes
-        if entering_player not in played_minutes:
-            played_minutes[entering_player] = 0  # Initialize if the player is not already in played_minutes
-        played_minutes[substituted_player] += substitution_minute
-        played_minutes[entering_player] += total_match_time - substitution_minute
-
-        # Update the lineup
-        lineup = [(position, entering_player if player == substituted_player else player) for position, player in lineup]
-
-    # Assign full match time to players who were not substituted
-    for _, player in lineup:
-        if played_minutes[player] == 0:
-            played_minutes[player] = total_match_time
-
-    # Update the played_minutes.txt file
-    update_played_minutes_file(played_minutes_file, played_minutes)
-
+from functions.played_minutes.record_match_minutes import record_match_minutes
+from functions.played_minutes.calculate_match_minutes import calculate_match_minutes
+from functions.squad_model import SquadModel
+
+def register_match_changes(lineup, players, played_minutes, played_minutes_file=None, store=None, match_id=0, position_index=None, squad=None):
+    """
+    Name:
+        register_match_changes
+
+    Parameters:
+        lineup (list): 
+            List of (position, player) tuples with the starting lineup of the match.
+        players (dict): 
+            Dictionary containing player information. Each key is the player's name, and the value is a dictionary
+            with the player's 'number' and 'positions'.
+        played_minutes (dict): 
+            Dictionary containing the played minutes for players before the match. Each key is the player's name (str), 
+            and the value is the total minutes played (int).
+        played_minutes_file (str): 
+            Path to the `played_minutes.txt` file. The match is recorded in the minutes ledger next to it.
+        store (TextSquadStore or SQLiteSquadStore, optional): 
+            Squad data store. If given, the match is recorded with `store.record_match_minutes` instead.
+        match_id (int, optional): 
+            Identifier of the match stored with the ledger records (e.g. the lineup number).
+        position_index (PositionIndex, optional): 
+            Position index of the players (see `build_position_index`), used to list the substitution candidates
+            and validate the entering player. Built from `players` if not given.
+        squad (SquadModel, optional): 
+            Squad model of the players (see `SquadModel`), used to find players by jersey number and to keep the
+            lineup on the pitch. Its lineup is replaced by `lineup`. Built from `players` if not given.
+
+    Description:
+        This function asks for the details of a played match and records the minutes of every player in it.
+        - The user enters the added time of each half and every substitution (player who left, player who entered
+          and the minute of the change). The entering player must be able to play the position.
+        - Each player is credited with the minutes they were actually on the pitch: starters from minute 0, substitutes
+          from the minute they entered, until they left or the end of the match.
+        - Each substitution is validated and applied to the squad model in constant time, without going over the
+          previous substitutions again.
+        - Only the minutes of this match are recorded (one ledger record per player), so the stored totals are never
+          counted twice.
+
+    Expected Output:
+        dict: The played minutes totals including this match.
+
+    Example:
+        With a 94-minute match where Lewandowski (9) starts and is replaced by Pau Víctor (18) at minute 70:
+        ```
+        played_minutes = register_match_changes(lineup, players, {"Robert Lewandowski": 500}, "played_minutes.txt", match_id=12)
+        ```
+
+        Records in `played_minutes.ledger`:
+        ```
+        12,70,Robert Lewandowski
+        12,24,Pau Víctor
+        ...
+        ```
+
+        And returns:
+        ```
+        {"Robert Lewandowski": 570, "Pau Víctor": 24, ...}
+        ```
+    """
+    if squad is None:
+        squad = SquadModel(players, position_index=position_index)
+    squad.set_lineup(lineup)
+
+    # Ask for additional time
+    print("Registering changes during the match:")
+    first_half_extra = int(input("Enter additional time for the first half (in minutes): "))
+    second_half_extra = int(input("Enter additional time for the second half (in minutes): "))
+    total_match_time = 45 + first_half_extra + 45 + second_half_extra
+
+    print(f"\nTotal match duration: {total_match_time} minutes.")
+
+    starting_lineup = lineup
+    substitutions = []
+
+    # Register substitutions
+    while True:
+        substitution = input("\nWere there any substitutions during the match? (y/n): ").strip().lower()
+        if substitution != "y":
+            break
+
+        # Show the current lineup
+        print("\nPlayers in the current lineup:")
+        for position, player in squad.lineup:
+            print(f"{player} ({squad.number(player)}) - {position}")
+
+        # Ask for the player who was substituted
+        substituted_number = int(input("\nEnter the number of the player who left: "))
+        substituted_player = squad.player(substituted_number)
+        substituted_position = squad.position_of(substituted_player)
+
+        if substituted_position is None:
+            print("Player number not found in the lineup.")
+            continue
+
+        # Show available players for the substitution
+        print("\nAvailable players for substitution:")
+        for player in squad.bench(substituted_position):
+            print(f"{player} ({squad.number(player)})")
+
+        # Ask for the player who entered
+        entering_number = int(input("\nEnter the number of the player who entered: "))
+        entering_player = squad.player(entering_number)
+
+        if not entering_player:
+            print("Player number not found in the player list.")
+            continue
+
+        # Validate positions
+        if not squad.position_index.can_play(entering_player, substituted_position):
+            print(f"Player {entering_player} cannot play in the position {substituted_position}.")
+            continue
+
+        # Ask for the minute of the substitution
+        substitution_minute = int(input("\nEnter the minute of the substitution: "))
+
+        # Validate the substitution and update the lineup
+        try:
+            squad.substitute(substituted_player, entering_player, substitution_minute, total_match_time)
+        except ValueError as error:
+            print(error)
+            continue
+        substitutions.append((substituted_player, entering_player, substitution_minute))
+
+    # Minutes of every player in this match
+    match_minutes, _ = calculate_match_minutes(starting_lineup, players, substitutions, total_match_time, squad.position_index)
+
+    # Record this match in the minutes ledger (or the selected data store)
+    if store is not None:
+        store.record_match_minutes(match_minutes, match_id)
+    else:
+        record_match_minutes(played_minutes_file, match_minutes, match_id)
+
+    # Return the updated totals
+    played_minutes = dict(played_minutes)
+    for player, minutes in match_minutes.items():
+        played_minutes[player] = played_minutes.get(player, 0) + minutes
     return played_minutes
\ No newline at end of file
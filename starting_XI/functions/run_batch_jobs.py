@@ -0,0 +1,154 @@
+import json
+import time
+from datetime import datetime
+from functions.formations import DEFAULT_FORMATION
+from functions.appearance_stats import AppearanceStats, DEFAULT_ROTATION_WINDOW
+from functions.played_minutes.calculate_match_minutes import calculate_match_minutes
+from squad_store.squad_data_cache import SquadDataCache
+
+SEVERITIES = ("Mild", "Moderate", "Severe")
+
+def read_batch_jobs(file_path):
+    """
+    Reads a job file: either a JSON list of jobs, or JSONL with one job object per line
+    (empty lines and lines starting with '//' are ignored).
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    if content.lstrip().startswith('['):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip() and not line.strip().startswith('//')]
+
+def injury_from_job(players, injury):
+    # Validates one injury of a job and returns (player name, injury data) as expected by update_injury_history
+    player_name = injury['player']
+    if player_name not in players:
+        raise ValueError(f"Player {player_name} is not in the player list.")
+    # Stored zero-padded ("2024-3-5" becomes "2024-03-05"): the injury index parses the dates as datetime64[D]
+    date = datetime.strptime(injury['date'], "%Y-%m-%d").strftime("%Y-%m-%d")
+    if injury['severity'] not in SEVERITIES:
+        raise ValueError(f"Invalid severity: {injury['severity']} (expected Mild, Moderate or Severe).")
+    recurrent = injury.get('recurrent', "No")
+    if isinstance(recurrent, bool):
+        recurrent = 'Yes' if recurrent else 'No'
+    return player_name, {
+        "date": date,
+        "injury_type": injury['injury_type'],
+        "recovery_time": int(injury['recovery_time']),
+        "severity": injury['severity'],
+        "minutes_played": int(injury.get('minutes_played', 0)),
+        "recurrent": recurrent
+    }
+
+def run_batch_job(store, cache, job, appearances=None):
+    """
+    Runs one job (see `run_batch_jobs`) and returns its result dictionary. Raises ValueError or KeyError
+    if the job is not valid; the injuries registered before the error are kept. `appearances` (an
+    `AppearanceStats`) is used by jobs with a "rotation_weight" and is brought up to date with the store.
+    """
+    result = {}
+    players = cache.get('players')
+
+    # Register the injuries of the job
+    for injury in job.get('injuries', []):
+        store.update_injury_history(*injury_from_job(players, injury))
+    result['injuries_registered'] = len(job.get('injuries', []))
+
+    if not job.get('generate', True):
+        return result
+
+    # Generate the lineup with the cached data (NumPy is loaded with the first lineup)
+    from functions.generate_lineup import generate_lineup
+    datetime.strptime(job['date'], "%Y-%m-%d")
+    rotation_penalties = None
+    if job.get('rotation_weight'):
+        appearances = appearances or AppearanceStats()
+        appearances.sync(store)
+        rotation_penalties = appearances.rotation_penalties(int(job.get('rotation_window', DEFAULT_ROTATION_WINDOW)), float(job['rotation_weight']))
+    lineup = generate_lineup(
+        players, cache.get('injury_index'), job['date'], cache.get('played_minutes'), cache.get('player_performance'),
+        cache.get('injury_risk').coefficients(job['date'], players), cache.get('age_risks'), solver=job.get('solver', "hungarian"),
+        formation=job.get('formation', DEFAULT_FORMATION), position_index=cache.get('position_index'),
+        rotation_penalties=rotation_penalties
+    )
+    result['lineup'] = [list(slot) for slot in lineup]
+
+    # Minutes of the match, from its added time and substitutions (validated before anything is saved)
+    match = job.get('match')
+    if match is not None:
+        total_match_time = 90 + int(match.get('first_half_extra', 0)) + int(match.get('second_half_extra', 0))
+        substitutions = [(sub['out'], sub['in'], int(sub['minute'])) for sub in match.get('substitutions', [])]
+        match_minutes, final_lineup = calculate_match_minutes(lineup, players, substitutions, total_match_time, cache.get('position_index'))
+        result['match_minutes'] = match_minutes
+        result['final_lineup'] = [list(slot) for slot in final_lineup]
+
+    if job.get('save', True):
+        lineup_number = store.count_lineups() + 1
+        store.save_lineup(lineup, lineup_number)
+        result['lineup_number'] = lineup_number
+        if match is not None:
+            store.record_match_minutes(match_minutes, lineup_number)
+
+    return result
+
+def run_batch_jobs(store, jobs, output):
+    """
+    Name:
+        run_batch_jobs
+
+    Parameters:
+        store (TextSquadStore, SnapshotSquadStore or SQLiteSquadStore): Squad data store.
+        jobs (list): List of job dictionaries (see Description).
+        output (file): Text stream where the results are written as JSONL (e.g. sys.stdout).
+
+    Description:
+        Runs the steps of `main.py` without asking anything to the user, for every job in one process.
+        The squad data is read through a shared `SquadDataCache`, so only the files written by the previous
+        jobs are parsed again. Each job is a dictionary with the keys:
+            - "id" (optional): copied to the result.
+            - "injuries" (optional): list of injuries to register first, each with "player", "date",
+              "injury_type", "recovery_time", "severity", "minutes_played" and "recurrent" ("Yes"/"No").
+            - "date": date of the match (YYYY-MM-DD), used to discard injured players.
+            - "generate" (optional, default true): set to false to only register the injuries.
+            - "solver" (optional): "hungarian" (default) or "sparse".
+            - "formation" (optional): a registered formation (default "4-3-3").
+            - "rotation_weight" (optional): extra cost per start of a player in the last "rotation_window"
+              lineups (5 or 10, default 5). No rotation term by default.
+            - "save" (optional, default true): save the lineup and record the match minutes.
+            - "match" (optional): "first_half_extra", "second_half_extra" and "substitutions", a list of
+              {"out": player, "in": player, "minute": int}.
+
+        One JSON line is written per job, with the job number ("job", from 1), its "id", the "lineup",
+        "lineup_number", "match_minutes" and "final_lineup" (when they apply), and "error" (null on success).
+        A job that fails only writes its error; the following jobs still run.
+
+    Expected Output:
+        dict: Summary with the number of jobs, the number of failed jobs and the elapsed seconds.
+
+    Example:
+        jobs.jsonl:
+        ```
+        {"id": "md1", "date": "2024-10-01", "match": {"second_half_extra": 4, "substitutions": [{"out": "Pedri", "in": "Gavi", "minute": 70}]}}
+        {"id": "md2", "date": "2024-10-05", "injuries": [{"player": "Gavi", "date": "2024-10-03", "injury_type": "Knee", "recovery_time": 20, "severity": "Moderate", "minutes_played": 0, "recurrent": "No"}]}
+        ```
+
+        python main.py --batch jobs.jsonl
+        {"job": 1, "id": "md1", "injuries_registered": 0, "lineup": [["Goalkeeper", "Iñaki Peña"], ...], "lineup_number": 5, ..., "error": null}
+        ...
+    """
+    cache = SquadDataCache(store)
+    appearances = AppearanceStats()
+    start = time.perf_counter()
+    failed = 0
+
+    for job_number, job in enumerate(jobs, start=1):
+        result = {'job': job_number, 'id': job.get('id')}
+        try:
+            result.update(run_batch_job(store, cache, job, appearances))
+            result['error'] = None
+        except (ValueError, KeyError, TypeError) as error:
+            failed += 1
+            result['error'] = f"{type(error).__name__}: {error}"
+        output.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    return {'jobs': len(jobs), 'failed': failed, 'seconds': round(time.perf_counter() - start, 3)}
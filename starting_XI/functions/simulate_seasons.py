@@ -0,0 +1,281 @@
+import os
+import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functions.generate_lineup import generate_lineup
+from functions.played_minutes.calculate_match_minutes import calculate_match_minutes
+from functions.injuries.calculate_coeficient_risk import calculate_coefficient_risk
+from functions.calculate_age_risk import calculate_age_risk
+from read_files.injury_index import build_injury_index
+from read_files.position_index import build_position_index
+
+# Default rotation policy of a simulated season
+DEFAULT_POLICY = {
+    'solver': "hungarian",
+    'substitutions': 3,          # Substitutions per match (fewer if no eligible player is on the bench)
+    'substitution_minutes': (55, 85),
+}
+
+# Per-player results of every simulated season (one row per season)
+SEASON_METRICS = ('minutes', 'starts', 'injuries', 'stability')
+
+def weekly_fixtures(start_date, matches=38, days_between=7):
+    """Returns a fixture list of `matches` dates ('YYYY-MM-DD'), one every `days_between` days from `start_date`."""
+    dates = np.datetime64(start_date, 'D') + np.arange(matches) * days_between
+    return np.datetime_as_string(dates).tolist()
+
+def build_injury_model(players, injury_history):
+    """
+    Name:
+        build_injury_model
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        injury_history (dict): Injury history as returned by `read_injury_history`.
+
+    Description:
+        Turns the injury history into the per-player injury model used by the simulation:
+            - The squad injury rate per minute is the number of injuries divided by the minutes played
+              before them (the 'minutes_played' of every injury).
+            - Each player's rate is that squad rate scaled by their risk coefficient from
+              `calculate_coefficient_risk`: rate = squad rate * (1 + risk) / (1 + average squad risk).
+            - New injuries (type, recovery time and severity) are drawn from the player's own past injuries,
+              or from the whole squad's injuries for players without any.
+
+    Expected Output:
+        dict: {'squad_rate': float, 'average_risk': float, 'risk_coefficients': {player: float},
+               'injury_samples': {player: list of (injury type, recovery days, severity)}}
+    """
+    risk_coefficients = calculate_coefficient_risk(injury_history)
+    injuries = [injury for data in injury_history.values() for injury in data['injuries']]
+    minutes_before_injury = sum(injury['minutes_played'] for injury in injuries)
+    squad_rate = len(injuries) / minutes_before_injury if minutes_before_injury else 0.0
+    squad_risks = [risk_coefficients.get(player, 0.0) for player in players]
+    squad_samples = [(injury['injury_type'], injury['recovery_time'], injury['severity']) for injury in injuries] or [("Unknown", 0, "Mild")]
+
+    return {
+        'squad_rate': squad_rate,
+        'average_risk': sum(squad_risks) / len(squad_risks) if squad_risks else 0.0,
+        'risk_coefficients': risk_coefficients,
+        'injury_samples': {
+            player: [(injury['injury_type'], injury['recovery_time'], injury['severity'])
+                     for injury in injury_history.get(player, {'injuries': []})['injuries']] or squad_samples
+            for player in players
+        }
+    }
+
+def _draw_substitutions(rng, lineup, position_index, available, policy):
+    # Random substitutions: a random outfield player on the pitch leaves for a random eligible player of the bench
+    first_minute, last_minute = policy['substitution_minutes']
+    minutes = np.sort(rng.integers(first_minute, last_minute + 1, size=policy['substitutions'])).tolist()
+    on_pitch = dict((player, position) for position, player in lineup)
+    used = set(on_pitch)
+    substitutions = []
+    for minute in minutes:
+        outfield = [player for player, position in on_pitch.items() if position != "Goalkeeper"]
+        substituted_player = outfield[rng.integers(len(outfield))]
+        position = on_pitch[substituted_player]
+        bench = [player for player in position_index.players_for(position) if player in available and player not in used]
+        if not bench:
+            continue
+        entering_player = bench[rng.integers(len(bench))]
+        substitutions.append((substituted_player, entering_player, minute))
+        del on_pitch[substituted_player]
+        on_pitch[entering_player] = position
+        used.add(entering_player)
+    return substitutions
+
+def simulate_season(rng, squad, fixtures, policy=None):
+    """
+    Name:
+        simulate_season
+
+    Parameters:
+        rng (numpy.random.Generator): Random generator of this season.
+        squad (dict): Season inputs: 'players', 'injury_history', 'injury_index', 'position_index', 'played_minutes',
+                      'player_performance', 'age_risks' and 'injury_model' (see `build_injury_model`).
+        fixtures (list): Match dates ('YYYY-MM-DD'), in order.
+        policy (dict, optional): Rotation policy (see `DEFAULT_POLICY`).
+
+    Description:
+        Plays one season, match by match, with the same steps as `main.py`:
+            1. `generate_lineup` picks the lineup for the date, without the players injured so far (in the
+               history or in this season) and with the minutes accumulated so far.
+            2. Random substitutions are drawn and the minutes of the match are computed with
+               `calculate_match_minutes`, as `register_match_changes` does.
+            3. Every player who played m minutes is injured with probability 1 - exp(-rate * m). The
+               injury is drawn from their history; it is added to their history and their risk coefficient
+               (and rate) is recalculated. The player misses the matches until the end of the recovery.
+        A match where no valid lineup exists (not enough available players) is counted as unfilled.
+
+    Expected Output:
+        dict: Arrays aligned with `squad['players']`: 'minutes' and 'starts' in the season, 'injuries' in
+              the season, 'stability' (share of consecutive matches where the player's starting status
+              did not change), plus 'team_stability' (average share of starters kept from one match to the
+              next) and 'unfilled_matches'.
+    """
+    policy = dict(DEFAULT_POLICY, **(policy or {}))
+    players = squad['players']
+    player_names = list(players)
+    position_of = {name: i for i, name in enumerate(player_names)}
+    model = squad['injury_model']
+
+    played_minutes = dict(squad['played_minutes'])
+    risk_coefficients = dict(model['risk_coefficients'])
+    injuries = {}
+    injured_until = {}
+    no_injuries = build_injury_index({})  # Injuries are already filtered out of the available players
+
+    season_minutes = np.zeros(len(player_names))
+    starts = np.zeros((len(fixtures), len(player_names)), dtype=bool)
+    season_injuries = np.zeros(len(player_names))
+    unfilled_matches = 0
+
+    # Players unavailable on each fixture because of injuries already in the history
+    unavailable = squad['injury_index'].unavailable_mask(fixtures, player_names)
+
+    for match, date in enumerate(fixtures):
+        day = np.datetime64(date, 'D')
+        available = {
+            name: attributes for i, (name, attributes) in enumerate(players.items())
+            if not unavailable[match, i] and not (name in injured_until and injured_until[name] >= day)
+        }
+        try:
+            lineup = generate_lineup(
+                available, no_injuries, date, played_minutes, squad['player_performance'], risk_coefficients,
+                squad['age_risks'], policy['solver'], position_index=squad['position_index']
+            )
+        except ValueError:
+            unfilled_matches += 1
+            continue
+        starts[match, [position_of[player] for _, player in lineup]] = True
+
+        # Minutes of the match
+        total_match_time = 90 + int(rng.integers(0, 4)) + int(rng.integers(1, 8))
+        substitutions = _draw_substitutions(rng, lineup, squad['position_index'], available, policy)
+        match_minutes, _ = calculate_match_minutes(lineup, players, substitutions, total_match_time, squad['position_index'])
+
+        # Injuries of the match
+        for player, minutes in match_minutes.items():
+            played_minutes[player] = played_minutes.get(player, 0) + minutes
+            season_minutes[position_of[player]] += minutes
+            rate = model['squad_rate'] * (1 + risk_coefficients.get(player, 0.0)) / (1 + model['average_risk'])
+            if rng.random() < 1 - math.exp(-rate * minutes):
+                samples = model['injury_samples'][player]
+                injury_type, recovery_time, severity = samples[rng.integers(len(samples))]
+                injured_until[player] = day + recovery_time
+                season_injuries[position_of[player]] += 1
+
+                # The new injury raises the player's risk coefficient for the rest of the season
+                history = injuries.setdefault(player, list(squad['injury_history'].get(player, {'injuries': []})['injuries']))
+                history.insert(0, {
+                    'date': date, 'injury_type': injury_type, 'recovery_time': recovery_time,
+                    'severity': severity, 'minutes_played': int(played_minutes[player]), 'recurrent': "No"
+                })
+                risk_coefficients[player] = calculate_coefficient_risk({player: {'injuries': history}})[player]
+
+    # Lineup stability
+    changes = (starts[1:] != starts[:-1]).sum(axis=0)
+    kept = (starts[1:] & starts[:-1]).sum(axis=1)
+    return {
+        'minutes': season_minutes,
+        'starts': starts.sum(axis=0).astype(float),
+        'injuries': season_injuries,
+        'stability': 1 - changes / max(len(fixtures) - 1, 1),
+        'team_stability': float(kept.mean() / 11) if len(kept) else 1.0,
+        'unfilled_matches': unfilled_matches
+    }
+
+# Season inputs of a worker process, set once by _init_worker
+_WORKER_SQUAD = None
+
+def _init_worker(squad):
+    global _WORKER_SQUAD
+    _WORKER_SQUAD = dict(squad, injury_index=build_injury_index(squad['injury_history']), position_index=build_position_index(squad['players']))
+
+def _simulate_seasons_chunk(seed_sequences, fixtures, policy):
+    # Runs in a worker process: one season per seed sequence
+    results = [simulate_season(np.random.default_rng(seed_sequence), _WORKER_SQUAD, fixtures, policy) for seed_sequence in seed_sequences]
+    return {key: np.array([result[key] for result in results]) for key in results[0]}
+
+def simulate_seasons(players, injury_history, played_minutes, player_performance, fixtures, seasons=1000, policy=None, seed=0, workers=None):
+    """
+    Name:
+        simulate_seasons
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        injury_history (dict): Injury history as returned by `read_injury_history`.
+        played_minutes (dict): Minutes played by each player before the season.
+        player_performance (dict): Performance scores (1.0-10.0) of the players.
+        fixtures (list): Match dates ('YYYY-MM-DD'), e.g. `weekly_fixtures("2025-08-17", 38)`.
+        seasons (int, optional): Number of independent seasons to simulate. Defaults to 1000.
+        policy (dict, optional): Rotation policy (see `DEFAULT_POLICY`).
+        seed (int, optional): Seed of the whole simulation.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Description:
+        Monte Carlo simulation of many seasons (see `simulate_season`) in a `ProcessPoolExecutor`.
+        Every season gets its own random generator from `np.random.SeedSequence(seed).spawn(seasons)`, so
+        the results only depend on the seed, not on the number of workers or on how the seasons are split.
+        The squad data is sent once to every worker (pool initializer), and the seasons in chunks.
+
+    Expected Output:
+        dict: {'players': list of names, 'minutes' / 'starts' / 'injuries' / 'stability': arrays of shape
+               (seasons, players), 'team_stability' / 'unfilled_matches': arrays of shape (seasons,)}.
+               Use `summarize_seasons` to get the distributions per player.
+
+    Raises:
+        ValueError: If `seasons` or `workers` is less than 1.
+
+    Example:
+        results = simulate_seasons(players, injury_history, played_minutes, player_performance,
+                                   weekly_fixtures("2025-08-17", 38), seasons=2000, seed=7)
+        summarize_seasons(results)['players']['Pedri']['minutes']
+        {'mean': 2410.3, 'std': 512.8, 'p5': 1480.0, 'p50': 2475.0, 'p95': 3102.0}
+    """
+    if seasons < 1:
+        raise ValueError(f"The number of seasons must be at least 1: {seasons}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"The number of workers must be at least 1: {workers}")
+
+    squad = {
+        'players': players,
+        'injury_history': injury_history,
+        'played_minutes': played_minutes,
+        'player_performance': player_performance,
+        'age_risks': calculate_age_risk(players),
+        'injury_model': build_injury_model(players, injury_history),
+    }
+    workers = workers or os.cpu_count() or 1
+    seed_sequences = np.random.SeedSequence(seed).spawn(seasons)
+    chunk_size = max(1, math.ceil(seasons / (workers * 4)))
+    chunks = [seed_sequences[i:i + chunk_size] for i in range(0, seasons, chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(squad,)) as executor:
+        chunk_results = list(executor.map(_simulate_seasons_chunk, chunks, [fixtures] * len(chunks), [policy] * len(chunks)))
+
+    results = {key: np.concatenate([chunk[key] for chunk in chunk_results]) for key in chunk_results[0]}
+    results['players'] = list(players)
+    return results
+
+def summarize_seasons(results):
+    """
+    Returns the distribution of every metric of `simulate_seasons`: for each player and metric (minutes,
+    starts, injuries, stability) and for the team stability, the mean, standard deviation and the
+    5th, 50th and 95th percentiles over the seasons.
+    """
+    def distribution(values):
+        p5, p50, p95 = np.percentile(values, [5, 50, 95], axis=0)
+        return {'mean': values.mean(axis=0), 'std': values.std(axis=0), 'p5': p5, 'p50': p50, 'p95': p95}
+
+    distributions = {metric: distribution(results[metric]) for metric in SEASON_METRICS}
+    return {
+        'seasons': len(results['team_stability']),
+        'players': {
+            player: {metric: {key: round(float(values[i]), 3) for key, values in distributions[metric].items()} for metric in SEASON_METRICS}
+            for i, player in enumerate(results['players'])
+        },
+        'team_stability': {key: round(float(value), 3) for key, value in distribution(results['team_stability']).items()},
+        'unfilled_matches': float(results['unfilled_matches'].mean())
+    }
@@ -0,0 +1,88 @@
+from read_files.position_index import build_position_index
+
+class SquadModel:
+    """
+    Name:
+        SquadModel
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+        lineup (list, optional): Lineup on the pitch as (position, player) tuples. Defaults to no lineup.
+        position_index (PositionIndex, optional): Position index of the players (see `build_position_index`).
+                                                  Built from `players` if not given.
+
+    Description:
+        Squad lookups for the injury and substitution flows, kept as indexes instead of scanning the players:
+        - `number_to_player` and `player_to_number` find a player by jersey number (and back) in O(1). If two
+          players share a number, the first one in `players` is found, as the former linear scan did.
+        - `in_lineup` holds the players on the pitch with the minute each one came on (starters: 0), and every
+          player on the pitch remembers their slot in `lineup`.
+
+        `substitute` validates a change and updates the lineup, the slots and `in_lineup` together in O(1),
+        so a match with many events is processed in linear time. `set_lineup` starts a new match with the
+        same indexes.
+
+    Example:
+        squad = SquadModel(players, lineup)
+        squad.player(9)
+        'Robert Lewandowski'
+        squad.substitute("Robert Lewandowski", "Pau Víctor", 70)
+        0
+        squad.lineup[-1]
+        ('Striker', 'Pau Víctor')
+    """
+
+    def __init__(self, players, lineup=(), position_index=None):
+        self.players = players
+        self.position_index = position_index or build_position_index(players)
+        self.number_to_player = {}
+        for name, attributes in players.items():
+            self.number_to_player.setdefault(attributes['number'], name)
+        self.player_to_number = {name: attributes['number'] for name, attributes in players.items()}
+        self.set_lineup(lineup)
+
+    def set_lineup(self, lineup):
+        """Puts a starting lineup on the pitch (every player from minute 0)."""
+        self.lineup = list(lineup)
+        self.in_lineup = {player: 0 for _, player in self.lineup}
+        self._slots = {player: slot for slot, (_, player) in enumerate(self.lineup)}
+
+    def player(self, number):
+        """Returns the player with a jersey number, or None if no player has it."""
+        return self.number_to_player.get(number)
+
+    def number(self, player):
+        """Returns the jersey number of a player, or None if the player is not in the squad."""
+        return self.player_to_number.get(player)
+
+    def position_of(self, player):
+        """Returns the position of a player on the pitch, or None if the player is not on the pitch."""
+        slot = self._slots.get(player)
+        return self.lineup[slot][0] if slot is not None else None
+
+    def bench(self, position):
+        """Returns the players off the pitch who can play a position, in the order of the position index."""
+        return [player for player in self.position_index.players_for(position) if player not in self.in_lineup]
+
+    def substitute(self, substituted_player, entering_player, minute=0, total_match_time=None):
+        """
+        Replaces a player on the pitch and returns the minute the substituted player had come on.
+        Raises ValueError (and changes nothing) if the substitution is not valid.
+        """
+        position = self.position_of(substituted_player)
+        if position is None:
+            raise ValueError(f"Player {substituted_player} is not on the pitch.")
+        if entering_player not in self.players:
+            raise ValueError(f"Player {entering_player} is not in the player list.")
+        if entering_player in self.in_lineup:
+            raise ValueError(f"Player {entering_player} is already on the pitch.")
+        if not self.position_index.can_play(entering_player, position):
+            raise ValueError(f"Player {entering_player} cannot play in the position {position}.")
+        if minute < self.in_lineup[substituted_player] or (total_match_time is not None and minute > total_match_time):
+            raise ValueError(f"Invalid minute for the substitution of {substituted_player}: {minute}.")
+
+        slot = self._slots.pop(substituted_player)
+        self.lineup[slot] = (position, entering_player)
+        self._slots[entering_player] = slot
+        self.in_lineup[entering_player] = minute
+        return self.in_lineup.pop(substituted_player)
@@ -0,0 +1,120 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functions.formations import DEFAULT_FORMATION
+from functions.run_batch_jobs import run_batch_job
+from squad_store.open_squad_store import open_squad_store, DATABASE_FILE
+from squad_store.squad_data_cache import SquadDataCache
+from squad_store.text_squad_store import PLAYERS_FILE
+
+def discover_squads(workspace_dir):
+    """
+    Name:
+        discover_squads
+
+    Parameters:
+        workspace_dir (str): Directory containing one squad data directory per team (at any depth).
+
+    Description:
+        Finds the squad data directories under the workspace: every directory with a `players.txt` file or a
+        `starting_XI.db` database is a squad, and its subdirectories are not searched. Each squad is named
+        after its path relative to the workspace (with '/' separators), or after the workspace itself if
+        the workspace is a squad directory.
+
+    Expected Output:
+        dict: {squad name: squad directory}, sorted by name.
+
+    Example:
+        discover_squads("workspace")
+        {'barca_atletic': 'workspace/barca_atletic', 'first_team': 'workspace/first_team', 'women': 'workspace/women'}
+    """
+    squads = {}
+    for directory, subdirectories, files in os.walk(workspace_dir):
+        subdirectories.sort()
+        if PLAYERS_FILE in files or DATABASE_FILE in files:
+            name = os.path.relpath(directory, workspace_dir).replace(os.sep, '/')
+            squads[os.path.basename(os.path.abspath(directory)) if name == '.' else name] = directory
+            subdirectories.clear()
+    return dict(sorted(squads.items()))
+
+def generate_squad_lineup(squad, data_dir, job, backend="text"):
+    """
+    Generates the lineup of one squad: runs `job` (see `run_batch_jobs`) on its own store and cache.
+    Returns the job result with the squad name, the elapsed seconds and "error" (None on success).
+    """
+    start = time.perf_counter()
+    result = {'squad': squad, 'data_dir': data_dir}
+    try:
+        store = open_squad_store(backend, data_dir)
+        result.update(run_batch_job(store, SquadDataCache(store), job))
+        result['error'] = None
+    except (ValueError, KeyError, TypeError, OSError) as error:
+        result['error'] = f"{type(error).__name__}: {error}"
+    result['seconds'] = round(time.perf_counter() - start, 4)
+    return result
+
+def generate_workspace_lineups(workspace_dir, date, backend="text", solver="hungarian", formation=DEFAULT_FORMATION, save=False, workers=None):
+    """
+    Name:
+        generate_workspace_lineups
+
+    Parameters:
+        workspace_dir (str): Workspace directory with one squad data directory per team (see `discover_squads`).
+        date (str): Date of the matches (YYYY-MM-DD), used to discard injured players.
+        backend (str, optional): Data backend of every squad ("text", "snapshot" or "sqlite"). Defaults to "text".
+        solver (str, optional): "hungarian" (default) or "sparse".
+        formation (str, optional): Formation of every lineup. Defaults to "4-3-3".
+        save (bool, optional): Save each lineup in its squad's lineup archive. Defaults to False.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Description:
+        Generates the lineup of every squad in the workspace. Squads are independent (each one has its own
+        files, store and cache), so they are spread over a `ProcessPoolExecutor`: the total time grows with
+        the number of squads per core instead of with the number of squads. With one worker, or a single
+        squad, the lineups are generated in this process.
+
+        A squad that fails (missing files, no valid lineup...) gets its error in the result; the other squads
+        are not affected.
+
+    Expected Output:
+        dict: Combined report with "date", "squads" (one result per squad, in name order, with "squad",
+              "lineup", "lineup_number" when saved, "seconds" and "error"), "failed" and the total "seconds".
+
+    Example:
+        report = generate_workspace_lineups("workspace", "2025-02-01")
+        report['squads'][0]
+        {'squad': 'barca_atletic', 'lineup': [['Goalkeeper', 'Diego Kochen'], ...], 'seconds': 0.21, 'error': None, ...}
+    """
+    start = time.perf_counter()
+    squads = discover_squads(workspace_dir)
+    job = {'date': date, 'solver': solver, 'formation': formation, 'save': save}
+    workers = min(workers or os.cpu_count() or 1, max(len(squads), 1))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(generate_squad_lineup, squads, squads.values(), [job] * len(squads), [backend] * len(squads)))
+    else:
+        results = [generate_squad_lineup(squad, data_dir, job, backend) for squad, data_dir in squads.items()]
+
+    return {
+        'date': date,
+        'formation': formation,
+        'squads': results,
+        'failed': sum(result['error'] is not None for result in results),
+        'seconds': round(time.perf_counter() - start, 4)
+    }
+
+def format_workspace_report(report):
+    """Returns the combined report of `generate_workspace_lineups` as text, one block per squad."""
+    lines = [f"Lineups for {report['date']} ({report['formation']}), {len(report['squads'])} squads:"]
+    for result in report['squads']:
+        lines.append("")
+        if result['error'] is not None:
+            lines.append(f"{result['squad']}: FAILED ({result['error']})")
+            continue
+        saved = f", saved as lineup {result['lineup_number']}" if 'lineup_number' in result else ""
+        lines.append(f"{result['squad']} ({result['seconds']} s{saved}):")
+        lines.extend(f"  {position}: {player}" for position, player in result['lineup'])
+    lines.append("")
+    lines.append(f"{len(report['squads']) - report['failed']} lineups generated, {report['failed']} failed, in {report['seconds']} s")
+    return "\n".join(lines)
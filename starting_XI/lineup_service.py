@@ -0,0 +1,229 @@
+import os
+import sys
+import json
+import asyncio
+import argparse
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from functions.formations import DEFAULT_FORMATION
+from functions.generate_lineup import generate_lineup
+from functions.played_minutes.calculate_match_minutes import calculate_match_minutes
+from functions.run_batch_jobs import injury_from_job
+from squad_store.open_squad_store import open_squad_store
+from squad_store.squad_data_cache import SquadDataCache
+
+# Service settings
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DATA_BACKEND = "text"
+HOST = "127.0.0.1"
+PORT = 8765
+SOLVER_WORKERS = 4
+# Number of generated lineups kept in memory (per data version, date, solver and formation)
+LINEUP_CACHE_SIZE = 256
+
+HTTP_STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+class LineupService:
+    """
+    Name:
+        LineupService
+
+    Parameters:
+        backend (str): Data backend ("text", "snapshot" or "sqlite"), as in `open_squad_store`.
+        data_dir (str): Squad data directory.
+        solver_workers (int, optional): Number of threads that solve lineups.
+
+    Description:
+        Keeps the squad data warm in memory and answers lineup, injury and minutes requests without
+        starting a process per request.
+        - The store and its `SquadDataCache` live in a single dedicated thread, so every read and write of the
+          data runs there (SQLite connections can only be used from the thread that opened them).
+        - Lineups are solved in a pool of worker threads, so the event loop never blocks on a solve.
+        - Writes (saving lineups, registering injuries and match minutes) run one at a time under an
+          `asyncio.Lock`, so for example two saved lineups can never get the same number.
+        - Generated lineups are kept for the current data versions, date, solver and formation: repeated requests
+          are answered without solving until a data file changes.
+
+    Example:
+        python lineup_service.py --port 8765
+
+        curl "http://127.0.0.1:8765/lineup?date=2024-10-01"
+        {"date": "2024-10-01", "formation": "4-3-3", "lineup": [["Goalkeeper", "Iñaki Peña"], ...]}
+    """
+
+    def __init__(self, backend=DATA_BACKEND, data_dir=DATA_DIR, solver_workers=SOLVER_WORKERS):
+        self.store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="squad-store")
+        self.solver_executor = ThreadPoolExecutor(max_workers=solver_workers, thread_name_prefix="lineup-solver")
+        self.write_lock = asyncio.Lock()
+        self.lineup_cache = {}
+        self.store = self.store_executor.submit(open_squad_store, backend, data_dir).result()
+        self.cache = SquadDataCache(self.store)
+
+    async def _in_store(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.store_executor, function, *args)
+
+    def _lineup_inputs(self):
+        # Runs in the store thread: the cached data needed by generate_lineup, with the versions it depends on
+        datasets = ('players', 'played_minutes', 'injury_history', 'player_performance')
+        versions = tuple(self.cache.version(dataset) for dataset in datasets)
+        inputs = [self.cache.get(name) for name in ('players', 'injury_index', 'played_minutes', 'player_performance', 'injury_risk', 'age_risks', 'position_index')]
+        return versions, inputs
+
+    async def lineup(self, date, solver="hungarian", formation=DEFAULT_FORMATION):
+        """Returns the optimal lineup for a date and formation as a list of (position, player) tuples (nothing is saved)."""
+        datetime.strptime(date, "%Y-%m-%d")
+        versions, (players, injury_index, played_minutes, player_performance, injury_risk, age_risks, position_index) = await self._in_store(self._lineup_inputs)
+        key = (versions, date, solver, formation)
+        if key not in self.lineup_cache:
+            risk_coefficients = injury_risk.coefficients(date, players)
+            self.lineup_cache[key] = await asyncio.get_running_loop().run_in_executor(
+                self.solver_executor, generate_lineup, players, injury_index, date, played_minutes,
+                player_performance, risk_coefficients, age_risks, solver, formation, position_index
+            )
+            if len(self.lineup_cache) > LINEUP_CACHE_SIZE:
+                del self.lineup_cache[next(iter(self.lineup_cache))]
+        return self.lineup_cache[key]
+
+    async def save_lineup(self, date, solver="hungarian", formation=DEFAULT_FORMATION):
+        """Generates the lineup for a date and formation and saves it as the next lineup. Returns (lineup number, lineup)."""
+        async with self.write_lock:
+            lineup = await self.lineup(date, solver, formation)
+            lineup_number = await self._in_store(self.store.count_lineups) + 1
+            await self._in_store(self.store.save_lineup, lineup, lineup_number)
+        return lineup_number, lineup
+
+    async def register_injury(self, injury):
+        """Registers an injury given as in the batch jobs ({"player", "date", "injury_type", ...})."""
+        async with self.write_lock:
+            players = await self._in_store(self.cache.get, 'players')
+            player_name, injury_data = injury_from_job(players, injury)
+            await self._in_store(self.store.update_injury_history, player_name, injury_data)
+        return player_name, injury_data
+
+    async def register_match(self, match):
+        """
+        Records the minutes of a played match. `match` has the "lineup" ([[position, player], ...]),
+        "lineup_number", "first_half_extra", "second_half_extra" and "substitutions" ([{"out", "in", "minute"}]).
+        """
+        async with self.write_lock:
+            players = await self._in_store(self.cache.get, 'players')
+            position_index = await self._in_store(self.cache.get, 'position_index')
+            lineup = [tuple(slot) for slot in match['lineup']]
+            total_match_time = 90 + int(match.get('first_half_extra', 0)) + int(match.get('second_half_extra', 0))
+            substitutions = [(sub['out'], sub['in'], int(sub['minute'])) for sub in match.get('substitutions', [])]
+            match_minutes, _ = calculate_match_minutes(lineup, players, substitutions, total_match_time, position_index)
+            await self._in_store(self.store.record_match_minutes, match_minutes, match.get('lineup_number', 0))
+        return match_minutes
+
+    async def handle_request(self, method, target, body):
+        """Routes one request. Returns (HTTP status, JSON-serializable payload)."""
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        data = json.loads(body) if body else {}
+
+        if url.path == "/health":
+            return 200, {"status": "ok"}
+        if url.path == "/lineup" and method == "GET":
+            formation = query.get('formation', DEFAULT_FORMATION)
+            lineup = await self.lineup(query['date'], query.get('solver', "hungarian"), formation)
+            return 200, {"date": query['date'], "formation": formation, "lineup": lineup}
+        if url.path == "/lineups" and method == "GET" and 'number' in query:
+            lineup_number, lineup = await self._in_store(self.store.read_lineup, int(query['number']))
+            return 200, {"lineup_number": lineup_number, "lineup": lineup}
+        if url.path == "/lineups" and method == "GET" and 'last' in query:
+            lineups = await self._in_store(self.store.read_last_lineups, int(query['last']))
+            return 200, {"lineups": [{"lineup_number": number, "lineup": lineup} for number, lineup in lineups]}
+        if url.path == "/lineups" and method == "GET":
+            return 200, {"lineups": await self._in_store(self.cache.get, 'lineups')}
+        if url.path == "/lineups" and method == "POST":
+            formation = data.get('formation', DEFAULT_FORMATION)
+            lineup_number, lineup = await self.save_lineup(data['date'], data.get('solver', "hungarian"), formation)
+            return 200, {"date": data['date'], "formation": formation, "lineup_number": lineup_number, "lineup": lineup}
+        if url.path == "/injuries" and method == "POST":
+            player_name, injury_data = await self.register_injury(data)
+            return 200, {"player": player_name, "injury": injury_data}
+        if url.path == "/matches" and method == "POST":
+            return 200, {"match_minutes": await self.register_match(data)}
+        if url.path in ("/lineup", "/lineups", "/injuries", "/matches"):
+            return 405, {"error": f"Method {method} not allowed for {url.path}"}
+        return 404, {"error": f"Unknown path: {url.path}"}
+
+    async def handle_connection(self, reader, writer):
+        """Serves the HTTP/1.1 requests of one connection (kept alive until the client closes it)."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                try:
+                    request_line, *header_lines = head.decode('latin-1').split("\r\n")
+                    method, target, version = request_line.split(" ", 2)
+                    headers = {}
+                    for line in header_lines:
+                        if ":" in line:
+                            name, value = line.split(":", 1)
+                            headers[name.strip().lower()] = value.strip()
+                    body = await reader.readexactly(int(headers.get('content-length', 0)))
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    # The client closed the connection before sending the whole body
+                    break
+                except ValueError as error:
+                    # Malformed request line or Content-Length: the rest of the stream cannot be trusted
+                    status, payload = 400, {"error": f"Malformed request: {error}"}
+                    keep_alive = False
+                else:
+                    try:
+                        status, payload = await self.handle_request(method, target, body)
+                    except (ValueError, KeyError, TypeError) as error:
+                        status, payload = 400, {"error": f"{type(error).__name__}: {error}"}
+                    except IndexError as error:
+                        status, payload = 404, {"error": str(error)}
+                    except Exception as error:
+                        status, payload = 500, {"error": f"{type(error).__name__}: {error}"}
+                    keep_alive = version == "HTTP/1.1" and headers.get('connection', '').lower() != "close"
+
+                content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_STATUS[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def serve(self, host=HOST, port=PORT):
+        """Warms the cache and serves requests until the task is cancelled."""
+        await self._in_store(self._lineup_inputs)
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"Lineup service listening on http://{host}:{port}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.solver_executor.shutdown()
+        self.store_executor.shutdown()
+
+async def run_service(backend, data_dir, host, port):
+    service = LineupService(backend, data_dir)
+    try:
+        await service.serve(host, port)
+    finally:
+        service.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local HTTP service for the Starting XI Lineup Generator")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--data-dir", default=DATA_DIR, help="squad data directory (default: data/)")
+    parser.add_argument("--backend", default=DATA_BACKEND, choices=["text", "snapshot", "sqlite"], help="data backend")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run_service(args.backend, args.data_dir, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -1,80 +1,172 @@
-# Import necessary functions
-from functions.played_minutes.register_match_changes import register_match_changes
-from read_files.read_players import read_players
-from read_files.read_played_minutes import read_played_minutes
-from read_files.read_injury_history import read_injury_history
-from read_files.read_player_performance import read_player_performance
-from read_files.read_lineups import read_lineups
-from functions.save_lineup import save_lineup
-from functions.injuries.calculate_coeficient_risk import calculate_coefficient_risk
-from functions.calculate_age_risk import calculate_age_risk
-from functions.generate_lineup import generate_lineup
-from functions.injuries.register_injury import register_injury
-
-
-def main():
-    # File paths
-    players_file = r'c:\Users\galgu\Respaldo\CETI\Cuarto Semestre\Algoritmia\Tercer Parcial\starting_XI\data\players.txt'
-    played_minutes_file = r'c:\Users\galgu\Respaldo\CETI\Cuarto Semestre\Algoritmia\Tercer Parcial\starting_XI\data\played_minutes.txt'
-    injury_history_file = r'c:\Users\galgu\Respaldo\CETI\Cuarto Semestre\Algoritmia\Tercer Parcial\starting_XI\data\injury_history.txt'
-    player_performance_file = r'c:\Users\galgu\Respaldo\CETI\Cuarto Semestre\Algoritmia\Tercer Parcial\starting_XI\data\player_performance.txt'
-    lineups_file = r'c:\Users\galgu\Respaldo\CETI\Cuarto Semestre\Algoritmia\Tercer Parcial\starting_XI\data\lineups.txt'
-
-    print("Welcome to the Starting XI Lineup Generator for FC Barcelona!\n")
-
-    # Ask for the current date to discard injured players
-    current_date = input("Enter the current date (YYYY-MM-DD): ").strip()
-
-    while True:
-
-        # Read existing lineups
-        lineups = read_lineups(lineups_file)
-        print(f"\nThere are {len(lineups)} lineups already created.\n")
-        if lineups:
-            view_lineups = input("Do you want to view the existing lineups? (y/n): ").strip().lower()
-            if view_lineups == "y":
-                for i, lineup in enumerate(lineups, start=1):
-                    print(f"\n{lineup}")
-
-        # Ask if a new lineup should be generated
-        generate = input("\nGenerate a new lineup? (y/n): ").strip().lower()
-        if generate != "y":
-            print("Exiting program.")
-            break
-
-        # Read data
-        print("\nReading data...")
-        players = read_players(players_file)
-        played_minutes = read_played_minutes(played_minutes_file)
-        injury_history = read_injury_history(injury_history_file)
-        player_performance = read_player_performance(player_performance_file)
-
-        # Ask if there are injured players
-        injured = input("\nAre there injured players? (y/n): ").strip().lower()
-        if injured == "y":
-            register_injury(players, injury_history_file)
-
-        # Calculate coefficients
-        print("\nCalculating coefficients...")
-        risk_coefficients = calculate_coefficient_risk(injury_history)
-        age_risks = calculate_age_risk(players)
-
-        # Generate lineup
-        print("\nGenerating new lineup...")
-        lineup = generate_lineup(players, injury_history, current_date, played_minutes, player_performance, risk_coefficients, age_risks)
-
-        # Show generated lineup
-        print("\nGenerated Lineup (4-3-3):")
-        for position, player in lineup:
-            print(f"{position}: {player}")
-
-        # Save the lineup
-        lineup_number = len(lineups) + 1
-        save_lineup(lineups_file, lineup, lineup_number)
-        print(f"\nLineup {lineup_number} saved successfully!\n")
-
-        # Register changes and update played minutes
-        played_minutes = register_match_changes(lineup, players, played_minutes, played_minutes_file)
-
-if __name__ == "__main__":
-    main()
+# Import necessary functions (the interactive flow imports its own modules in main(), and generate_lineup,
+# which loads NumPy, is imported when the first lineup is generated, so short invocations start quickly)
+import os
+import sys
+import argparse
+import contextlib
+from squad_store.open_squad_store import open_squad_store
+from functions.formations import DEFAULT_FORMATION, FORMATIONS
+from read_files.lineup_archive import format_lineup
+
+# Data settings
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DATA_BACKEND = "text"  # "text" (files in DATA_DIR), "snapshot" (text files read through DATA_DIR/squad.snapshot) or "sqlite" (DATA_DIR/starting_XI.db, imported from the text files)
+
+# Rotation settings: extra cost per start in the last ROTATION_WINDOW lineups (0 = no rotation term)
+ROTATION_WEIGHT = 0
+ROTATION_WINDOW = 5
+
+
+def show_lineups(backend=DATA_BACKEND, data_dir=DATA_DIR, last=None):
+    # Print the saved lineups (or only the last ones) and exit (python main.py --show-lineups [--last N])
+    store = open_squad_store(backend, data_dir)
+    print(f"There are {store.count_lineups()} lineups already created.")
+    if last is not None:
+        lineups = [format_lineup(lineup, lineup_number).strip() for lineup_number, lineup in store.read_last_lineups(last)]
+    else:
+        lineups = store.read_lineups()
+    for lineup in lineups:
+        print(f"\n{lineup}")
+
+def run_batch(jobs_file, output_file=None, backend=DATA_BACKEND, data_dir=DATA_DIR):
+    # Run the jobs of a JSON/JSONL file without prompts and write one JSON result per job (python main.py --batch jobs.jsonl)
+    from functions.run_batch_jobs import read_batch_jobs, run_batch_jobs
+    store = open_squad_store(backend, data_dir)
+    jobs = read_batch_jobs(jobs_file)
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as output:
+            summary = run_batch_jobs(store, jobs, output)
+    else:
+        # Messages of the readers go to stderr, so stdout only has the JSON results
+        with contextlib.redirect_stdout(sys.stderr):
+            summary = run_batch_jobs(store, jobs, sys.__stdout__)
+    print(f"{summary['jobs']} jobs ({summary['failed']} failed) in {summary['seconds']} s", file=sys.stderr)
+    return summary['failed'] == 0
+
+def run_workspace(workspace_dir, date, output_file=None, backend=DATA_BACKEND, formation=DEFAULT_FORMATION, save=False, workers=None):
+    # Generate the lineups of every squad directory under workspace_dir in parallel and print a combined report (python main.py --workspace DIR --date YYYY-MM-DD)
+    import json
+    from functions.squad_workspace import generate_workspace_lineups, format_workspace_report
+    with contextlib.redirect_stdout(sys.stderr):
+        report = generate_workspace_lineups(workspace_dir, date, backend, formation=formation, save=save, workers=workers)
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+    print(format_workspace_report(report))
+    return report['failed'] == 0
+
+def main(backend=DATA_BACKEND, data_dir=DATA_DIR, formation=DEFAULT_FORMATION, rotation_weight=ROTATION_WEIGHT, rotation_window=ROTATION_WINDOW):
+    from functions.played_minutes.register_match_changes import register_match_changes
+    from functions.injuries.register_injury import register_injury
+    from functions.squad_model import SquadModel
+    from squad_store.squad_data_cache import SquadDataCache
+
+    # Open the squad data
+    store = open_squad_store(backend, data_dir)
+    cache = SquadDataCache(store)
+
+    print("Welcome to the Starting XI Lineup Generator for FC Barcelona!\n")
+
+    # Ask for the current date to discard injured players
+    current_date = input("Enter the current date (YYYY-MM-DD): ").strip()
+
+    # Time-decayed injury risk, built once and updated with every registered injury
+    injury_risk = None
+    appearances = None
+
+    while True:
+
+        # Count existing lineups (from the lineup index; the lineups are only read if the user wants to see them)
+        lineup_count = store.count_lineups()
+        print(f"\nThere are {lineup_count} lineups already created.\n")
+        if lineup_count:
+            view_lineups = input("Do you want to view the existing lineups? (y/n): ").strip().lower()
+            if view_lineups == "y":
+                for i, lineup in enumerate(cache.get('lineups'), start=1):
+                    print(f"\n{lineup}")
+
+        # Ask if a new lineup should be generated
+        generate = input("\nGenerate a new lineup? (y/n): ").strip().lower()
+        if generate != "y":
+            print("Exiting program.")
+            break
+
+        # Read data (only the files that changed since the last lineup are parsed again)
+        print("\nReading data...")
+        players = cache.get('players')
+        position_index = cache.get('position_index')
+        squad = SquadModel(players, position_index=position_index)
+
+        # Ask if there are injured players
+        injured = input("\nAre there injured players? (y/n): ").strip().lower()
+        if injury_risk is None:
+            from functions.injuries.decayed_injury_risk import DecayedInjuryRisk
+            injury_risk = DecayedInjuryRisk.from_records(*cache.get('injury_records'))
+        if injured == "y":
+            registered = register_injury(players, store=store, squad=squad)
+            if registered:
+                injury_risk.add_injury(*registered)
+
+        played_minutes = cache.get('played_minutes')
+        player_performance = cache.get('player_performance')
+        injury_index = cache.get('injury_index')
+
+        # Calculate coefficients
+        print("\nCalculating coefficients...")
+        risk_coefficients = injury_risk.coefficients(current_date, players)
+        age_risks = cache.get('age_risks')
+
+        # Rotation term from the starts of the last lineups (only the lineups saved since the previous one are read)
+        rotation_penalties = None
+        if rotation_weight:
+            if appearances is None:
+                from functions.appearance_stats import AppearanceStats
+                appearances = AppearanceStats(windows=(rotation_window,))
+            appearances.sync(store)
+            rotation_penalties = appearances.rotation_penalties(rotation_window, rotation_weight)
+
+        # Generate lineup
+        print("\nGenerating new lineup...")
+        from functions.generate_lineup import generate_lineup
+        lineup = generate_lineup(players, injury_index, current_date, played_minutes, player_performance, risk_coefficients, age_risks, formation=formation, position_index=position_index, rotation_penalties=rotation_penalties)
+
+        # Show generated lineup
+        print(f"\nGenerated Lineup ({formation}):")
+        for position, player in lineup:
+            print(f"{position}: {player}")
+
+        # Save the lineup
+        lineup_number = lineup_count + 1
+        store.save_lineup(lineup, lineup_number)
+        print(f"\nLineup {lineup_number} saved successfully!\n")
+
+        # Register changes and update played minutes
+        played_minutes = register_match_changes(lineup, players, played_minutes, store=store, match_id=lineup_number, squad=squad)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Starting XI Lineup Generator for FC Barcelona")
+    parser.add_argument("--show-lineups", action="store_true", help="print the saved lineups and exit")
+    parser.add_argument("--last", type=int, metavar="N", help="with --show-lineups, print only the last N lineups")
+    parser.add_argument("--batch", metavar="JOBS", help="run the jobs of a JSON/JSONL file without prompts")
+    parser.add_argument("--output", metavar="FILE", help="write the batch results to FILE instead of the standard output (with --workspace, the JSON report)")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="squad data directory (default: data/)")
+    parser.add_argument("--backend", default=DATA_BACKEND, choices=["text", "snapshot", "sqlite"], help="data backend")
+    parser.add_argument("--formation", default=DEFAULT_FORMATION, choices=list(FORMATIONS), help="formation of the generated lineups (default: 4-3-3)")
+    parser.add_argument("--workspace", metavar="DIR", help="generate the lineups of every squad directory under DIR in parallel and exit")
+    parser.add_argument("--date", help="with --workspace, date of the matches (YYYY-MM-DD)")
+    parser.add_argument("--save", action="store_true", help="with --workspace, save each lineup in its squad's lineups")
+    parser.add_argument("--workers", type=int, default=None, help="with --workspace, worker processes (default: number of CPUs)")
+    parser.add_argument("--rotation-weight", type=float, default=ROTATION_WEIGHT, help="extra cost per recent start of a player (default: 0, no rotation)")
+    parser.add_argument("--rotation-window", type=int, default=ROTATION_WINDOW, help="number of recent lineups counted for the rotation (default: 5)")
+    args = parser.parse_args()
+
+    if args.show_lineups:
+        show_lineups(args.backend, args.data_dir, args.last)
+    elif args.workspace:
+        if not args.date:
+            parser.error("--workspace requires --date")
+        sys.exit(0 if run_workspace(args.workspace, args.date, args.output, args.backend, args.formation, args.save, args.workers) else 1)
+    elif args.batch:
+        sys.exit(0 if run_batch(args.batch, args.output, args.backend, args.data_dir) else 1)
+    else:
+        main(args.backend, args.data_dir, args.formation, args.rotation_weight, args.rotation_window)
@@ -0,0 +1,119 @@
+import numpy as np
+
+# Dates are stored as day numbers shifted to be non-negative, so they fit in the low 32 bits of a key
+_DAY_OFFSET = 2 ** 31
+
+class InjuryIndex:
+    """
+    Name:
+        InjuryIndex
+
+    Parameters:
+        player_names (list): Names of the players in the index. Player ids are positions in this list.
+        player_ids (ndarray): Player id of every injury.
+        starts (ndarray): Injury date of every injury (datetime64[D]).
+        ends (ndarray): Last day of recovery of every injury (datetime64[D]), i.e. injury date + recovery time.
+
+    Description:
+        Sorted per-player interval index over the injury history, used to answer availability queries
+        without parsing dates again. A player is unavailable on a date D if start <= D <= end for any of
+        their injuries (both ends inclusive, as in `generate_lineup`).
+
+        Intervals are sorted by (player, start) and every interval stores the latest recovery end of
+        the player's intervals up to it. For a player and a date, the last interval starting on or before
+        the date is found with a binary search; the player is unavailable if that running end reaches the
+        date. All players and all dates of a query are searched at once with `np.searchsorted`.
+
+        Use `build_injury_index` to create an index from the dictionary returned by `read_injury_history`.
+    """
+
+    def __init__(self, player_names, player_ids, starts, ends):
+        self.player_names = list(player_names)
+        self.player_id = {name: i for i, name in enumerate(self.player_names)}
+
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        starts = np.asarray(starts, dtype='datetime64[D]')
+        ends = np.asarray(ends, dtype='datetime64[D]')
+        order = np.lexsort((starts, player_ids))
+        self.player_ids = player_ids[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+
+        # Search keys (player, start) and running recovery end per player, packed as (player, day) integers
+        self._keys = self._pack(self.player_ids, self.starts)
+        self._running_ends = np.maximum.accumulate(self._pack(self.player_ids, self.ends)) if len(order) else self._keys
+
+    @staticmethod
+    def _pack(player_ids, dates):
+        return (player_ids << 32) | (dates.astype(np.int64) + _DAY_OFFSET)
+
+    def unavailable_mask(self, match_dates, player_names):
+        """
+        Returns a boolean matrix of shape (len(match_dates), len(player_names)) telling which player is
+        unavailable on which date. Dates are strings ('YYYY-MM-DD') or datetime64 values. Players that are
+        not in the index are always available.
+        """
+        dates = np.asarray(match_dates, dtype='datetime64[D]').reshape(-1)
+        ids = np.array([self.player_id.get(name, -1) for name in player_names], dtype=np.int64)
+        unavailable = np.zeros((len(dates), len(ids)), dtype=bool)
+        known = np.flatnonzero(ids >= 0)
+        if not len(self._keys) or not len(known):
+            return unavailable
+
+        queries = self._pack(ids[known][None, :], dates[:, None])
+        last_start = np.searchsorted(self._keys, queries, side='right') - 1
+        found = last_start >= 0
+        last_start[~found] = 0
+        found &= self.player_ids[last_start] == ids[known][None, :]
+        unavailable[:, known] = found & (self._running_ends[last_start] >= queries)
+        return unavailable
+
+    def unavailable_on(self, date, player_names=None):
+        """
+        Returns the list of players (from `player_names`, or every player in the index) that are
+        unavailable on the given date.
+        """
+        if player_names is None:
+            player_names = self.player_names
+        player_names = list(player_names)
+        mask = self.unavailable_mask([date], player_names)[0]
+        return [name for name, unavailable in zip(player_names, mask) if unavailable]
+
+    def is_unavailable(self, player_name, date):
+        """Returns True if the player is injured (or still recovering) on the given date."""
+        return bool(self.unavailable_mask([date], [player_name])[0, 0])
+
+def build_injury_index(injury_history):
+    """
+    Name:
+        build_injury_index
+
+    Parameters:
+        injury_history (dict): Injury history as returned by `read_injury_history`:
+                               {'player_name': {'injuries': [{'date': str, 'recovery_time': int, ...}, ...]}, ...}
+
+    Description:
+        Parses the date of every injury once and builds an `InjuryIndex` with datetime64 start and end
+        arrays (end = injury date + recovery time in days).
+
+    Expected Output:
+        InjuryIndex: The interval index over all the injuries of all the players.
+
+    Example:
+        index = build_injury_index(read_injury_history("injury_history.txt"))
+        index.unavailable_on("2024-10-01")
+        ['Marc-André ter Stegen', 'Iñaki Peña', 'Ronald Araujo', ...]
+    """
+    player_names = list(injury_history)
+    player_ids = []
+    dates = []
+    recovery_times = []
+    for i, player in enumerate(player_names):
+        for injury in injury_history[player].get('injuries', []):
+            player_ids.append(i)
+            dates.append(injury['date'])
+            recovery_times.append(injury['recovery_time'])
+
+    starts = np.array(dates, dtype='datetime64[D]')
+    ends = starts + np.array(recovery_times, dtype='timedelta64[D]')
+    return InjuryIndex(player_names, player_ids, starts, ends)
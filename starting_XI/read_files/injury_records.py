@@ -0,0 +1,54 @@
+import numpy as np
+
+# One injury per record; text attributes are stored as small codes
+INJURY_RECORD_DTYPE = np.dtype([
+    ('player_id', np.int32),
+    ('date', 'datetime64[D]'),
+    ('recovery_time', np.int32),
+    ('severity', np.int8),
+    ('minutes_played', np.int32),
+    ('recurrent', np.bool_)
+])
+
+# Severity codes (0 = unknown severity)
+SEVERITY_CODES = {
+    "Mild": 1,
+    "Moderate": 2,
+    "Severe": 3
+}
+
+def build_injury_records(injury_history):
+    """
+    Name:
+        build_injury_records
+
+    Parameters:
+        injury_history (dict): Injury history as returned by `read_injury_history`:
+                               {'player_name': {'injuries': [{'date': str, 'recovery_time': int, ...}, ...]}, ...}
+
+    Description:
+        Converts the injury history into a structured NumPy array with one record per injury:
+        (player_id, date, recovery_time, severity code, minutes_played, recurrent flag). Player ids are
+        positions in the returned list of names, which keeps the order of `injury_history` (players without
+        injuries included). Severities are coded with `SEVERITY_CODES` (0 for an unknown severity) and the
+        recurrent flag is True for "Yes".
+
+    Expected Output:
+        tuple: (player names, records), where records is an array of dtype `INJURY_RECORD_DTYPE`.
+
+    Example:
+        player_names, records = build_injury_records(read_injury_history("injury_history.txt"))
+        records[:2]
+        array([(0, '2023-01-15', 30, 2, 1200, False), (0, '2024-03-10', 45, 3, 800, True)], dtype=...)
+    """
+    player_names = list(injury_history)
+    injuries = [(i, injury) for i, player in enumerate(player_names) for injury in injury_history[player].get('injuries', [])]
+
+    records = np.empty(len(injuries), dtype=INJURY_RECORD_DTYPE)
+    records['player_id'] = [i for i, _ in injuries]
+    records['date'] = np.array([injury['date'] for _, injury in injuries], dtype='datetime64[D]')
+    records['recovery_time'] = [injury['recovery_time'] for _, injury in injuries]
+    records['severity'] = [SEVERITY_CODES.get(injury['severity'], 0) for _, injury in injuries]
+    records['minutes_played'] = [injury['minutes_played'] for _, injury in injuries]
+    records['recurrent'] = [injury['recurrent'] == "Yes" for _, injury in injuries]
+    return player_names, records
@@ -0,0 +1,210 @@
+import os
+import struct
+
+# Sidecar index: one little-endian int64 per lineup with the byte offset of its record in lineups.txt
+OFFSET_SIZE = 8
+RECORD_HEADER = b"Lineup "
+
+def lineup_index_path(file_path):
+    """Returns the path of the offset index that belongs to a lineups file (e.g. lineups.idx)."""
+    return os.path.splitext(file_path)[0] + '.idx'
+
+def format_lineup(lineup, lineup_number):
+    """Returns the text record of a lineup, as written in lineups.txt ("Lineup N:\\nPosition: Player\\n...\\n\\n")."""
+    return f"Lineup {lineup_number}:\n" + "".join(f"{position}: {player}\n" for position, player in lineup) + "\n"
+
+def parse_lineup(lineup_text):
+    """
+    Parses one lineup string as returned by `read_lineups` ("Lineup N:\\nPosition: Player\\n...")
+    into (lineup_number, [(position, player), ...]).
+    """
+    lines = lineup_text.strip().splitlines()
+    lineup_number = int(lines[0].replace("Lineup", "").rstrip(':').strip())
+    lineup = []
+    for line in lines[1:]:
+        if line.strip():
+            position, player = line.split(':', maxsplit=1)
+            lineup.append((position.strip(), player.strip()))
+    return lineup_number, lineup
+
+def _is_header(line):
+    # "Lineup N:" line that starts a record
+    return line.startswith(RECORD_HEADER) and line.rstrip().endswith(b":")
+
+class LineupArchive:
+    """
+    Name:
+        LineupArchive
+
+    Parameters:
+        file_path (str): Path to the `lineups.txt` file. The offset index is kept next to it (`lineups.idx`).
+
+    Description:
+        Random access to the saved lineups without reading `lineups.txt` as a whole. The text file keeps the
+        format written by `save_lineup` (one "Lineup N:" record per lineup), and the sidecar index stores the
+        byte offset of every record as an int64, so:
+            - `count` is the size of the index divided by 8,
+            - `get` seeks to one record and parses only that record,
+            - `last` reads the index tail and the matching tail of the text file.
+
+        `append` writes the record to the text file first and its offset to the index after it. A reader only
+        sees the lineups in the index, so a lineup is never half visible. Every access checks the index
+        against the text file:
+            - the index is rebuilt if it is missing, older than the text file, or its last offset is no longer
+              the start of a record (e.g. after the file was edited or rewritten),
+            - records after the last indexed one (an append interrupted before the index was updated) are
+              added to the index.
+        Only `append` and `reindex` write the index file. The read-only methods (`count`, `get`, `last`) never
+        create or change it: when it is missing or out of date they scan the text file and keep the offsets
+        in memory (until the text file changes).
+
+    Example:
+        archive = LineupArchive("lineups.txt")
+        archive.count()
+        3
+        archive.get(2)
+        (2, [('Goalkeeper', 'Iñaki Peña'), ('Left-back', 'Alejandro Balde'), ...])
+        archive.last(2)
+        [(2, [...]), (3, [...])]
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.index_path = lineup_index_path(file_path)
+        self._offsets = None        # Offsets kept in memory when the index file is not up to date
+        self._offsets_key = None    # (modification time, size) of the text file they were read from
+
+    def count(self):
+        """Returns the number of saved lineups."""
+        return self._check_index() // OFFSET_SIZE
+
+    def get(self, number):
+        """Returns the lineup saved in place `number` (1 = first) as (lineup_number, [(position, player), ...])."""
+        count = self.count()
+        if not 1 <= number <= count:
+            raise IndexError(f"There is no lineup {number} (there are {count} lineups).")
+        return self._read_records(number - 1, number)[0]
+
+    def last(self, count):
+        """Returns the last `count` lineups (oldest first) as (lineup_number, [(position, player), ...]) pairs."""
+        total = self.count()
+        return self._read_records(max(total - count, 0), total) if count > 0 else []
+
+    def append(self, lineup, lineup_number):
+        """Appends a lineup record to the text file and its offset to the index."""
+        self._check_index(write=True)
+        with open(self.file_path, 'a+b') as file:
+            offset = file.seek(0, os.SEEK_END)
+            if offset and (file.seek(offset - 1), file.read(1))[1] != b"\n":
+                # The file was edited by hand and does not end with a newline
+                file.write(b"\n")
+                offset += 1
+            file.write(format_lineup(lineup, lineup_number).encode('utf-8'))
+        with open(self.index_path, 'ab') as index:
+            index.write(struct.pack('<q', offset))
+
+    def reindex(self):
+        """Rebuilds the index from the text file. Returns the number of lineups."""
+        offsets = self._scan_records(0)
+        self._offsets = self._offsets_key = None
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'wb') as index:
+            index.write(struct.pack(f'<{len(offsets)}q', *offsets))
+        os.replace(temp_path, self.index_path)
+        return len(offsets)
+
+    def _read_offsets(self, start, end):
+        # Offsets of the records start..end-1 (0-based)
+        if self._offsets is not None:
+            return self._offsets[start:end]
+        with open(self.index_path, 'rb') as index:
+            index.seek(start * OFFSET_SIZE)
+            data = index.read((end - start) * OFFSET_SIZE)
+        return list(struct.unpack(f'<{len(data) // OFFSET_SIZE}q', data))
+
+    def _read_records(self, start, end):
+        # Parses the records start..end-1 (0-based) with one read of the text file
+        if start >= end:
+            return []
+        offsets = self._read_offsets(start, end + 1)
+        with open(self.file_path, 'rb') as file:
+            file.seek(offsets[0])
+            data = file.read(offsets[-1] - offsets[0]) if len(offsets) > end - start else file.read()
+        if len(offsets) == end - start:
+            offsets.append(offsets[0] + len(data))
+        return [
+            parse_lineup(data[offsets[i] - offsets[0]:offsets[i + 1] - offsets[0]].decode('utf-8'))
+            for i in range(end - start)
+        ]
+
+    def _scan_records(self, start):
+        # Offsets of the records that start at or after byte `start` of the text file
+        offsets = []
+        try:
+            with open(self.file_path, 'rb') as file:
+                file.seek(start)
+                position = start
+                for line in file:
+                    if _is_header(line):
+                        offsets.append(position)
+                    position += len(line)
+        except FileNotFoundError:
+            pass
+        return offsets
+
+    def _check_index(self, write=False):
+        # Makes the index match the text file and returns its size in bytes. Read-only calls (write=False)
+        # leave the index file as it is and keep the matching offsets in memory instead.
+        try:
+            text_stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            text_stat = None
+        try:
+            index_stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            index_stat = None
+
+        text_key = (text_stat.st_mtime_ns, text_stat.st_size) if text_stat is not None else None
+        if not write and self._offsets is not None and self._offsets_key == text_key:
+            return len(self._offsets) * OFFSET_SIZE
+        self._offsets = self._offsets_key = None
+
+        if index_stat is None or (text_stat is not None and text_stat.st_mtime_ns > index_stat.st_mtime_ns):
+            return self._rebuild(write, text_key)
+        size = index_stat.st_size - index_stat.st_size % OFFSET_SIZE
+        if size == 0:
+            if text_stat is not None and text_stat.st_size > 0:
+                return self._rebuild(write, text_key)
+            return 0
+        if text_stat is None:
+            return self._rebuild(write, text_key)
+
+        # The last indexed offset must still be the start of a record
+        last_offset = self._read_offsets(size // OFFSET_SIZE - 1, size // OFFSET_SIZE)[0]
+        with open(self.file_path, 'rb') as file:
+            file.seek(last_offset)
+            header = file.readline()
+        if last_offset >= text_stat.st_size or not _is_header(header):
+            return self._rebuild(write, text_key)
+
+        # Records appended after the last indexed one
+        new_offsets = self._scan_records(last_offset)[1:]
+        if new_offsets or size != index_stat.st_size:
+            if not write:
+                self._offsets = self._read_offsets(0, size // OFFSET_SIZE) + new_offsets
+                self._offsets_key = text_key
+                return len(self._offsets) * OFFSET_SIZE
+            with open(self.index_path, 'r+b') as index:
+                index.truncate(size)
+                index.seek(size)
+                index.write(struct.pack(f'<{len(new_offsets)}q', *new_offsets))
+            size += len(new_offsets) * OFFSET_SIZE
+        return size
+
+    def _rebuild(self, write, text_key):
+        # Rebuilds the index file, or (read-only) only the offsets in memory
+        if write:
+            return self.reindex() * OFFSET_SIZE
+        self._offsets = self._scan_records(0)
+        self._offsets_key = text_key
+        return len(self._offsets) * OFFSET_SIZE
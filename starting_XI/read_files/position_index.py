@@ -0,0 +1,97 @@
+class PositionIndex:
+    """
+    Name:
+        PositionIndex
+
+    Parameters:
+        player_names (list): Names of the players in the index.
+        role_names (list): Position names; the role code of a position is its place in this list.
+        masks (list): Eligibility bitmask of every player (bit c set if the player can play role c).
+
+    Description:
+        Interned positions for eligibility checks without scanning the players' position lists:
+        - every position name has an integer role code (`role_codes`),
+        - every player has an eligibility bitmask (`masks`), so "can this player play X" is one bit test
+          and "can these players cover the formation" is an OR of masks,
+        - every role has the list of its players (`players_by_role`, in the order of `player_names`), so the
+          candidates for a position are an index lookup.
+
+        Use `build_position_index` to create an index from the dictionary returned by `read_players`.
+
+    Example:
+        index = build_position_index(players)
+        index.can_play("Pedri", "Midfielder")
+        True
+        index.players_for("Goalkeeper")
+        ['Marc-André ter Stegen', 'Iñaki Peña', ...]
+    """
+
+    def __init__(self, player_names, role_names, masks):
+        self.player_names = list(player_names)
+        self.role_names = list(role_names)
+        self.role_codes = {role: code for code, role in enumerate(self.role_names)}
+        self.masks = dict(zip(self.player_names, masks))
+        self.players_by_role = [
+            [player for player in self.player_names if self.masks[player] >> code & 1]
+            for code in range(len(self.role_names))
+        ]
+
+    def role_mask(self, positions):
+        """Returns the bitmask of a list of positions (positions that nobody plays are left out)."""
+        mask = 0
+        for position in positions:
+            code = self.role_codes.get(position)
+            if code is not None:
+                mask |= 1 << code
+        return mask
+
+    def can_play(self, player, position):
+        """Returns True if the player can play the position."""
+        code = self.role_codes.get(position)
+        return code is not None and bool(self.masks.get(player, 0) >> code & 1)
+
+    def players_for(self, position):
+        """Returns the players who can play a position, in the order of the index."""
+        code = self.role_codes.get(position)
+        return self.players_by_role[code] if code is not None else []
+
+    def missing_positions(self, positions, available_players):
+        """Returns the positions (in order, without repetitions) that none of the available players can play."""
+        covered = 0
+        for player in available_players:
+            covered |= self.masks.get(player, 0)
+        missing = []
+        for position in dict.fromkeys(positions):
+            code = self.role_codes.get(position)
+            if code is None or not covered >> code & 1:
+                missing.append(position)
+        return missing
+
+def build_position_index(players):
+    """
+    Name:
+        build_position_index
+
+    Parameters:
+        players (dict): Dictionary of players with their attributes ('number', 'age', 'positions').
+
+    Description:
+        Interns every position to a role code (in order of first appearance) and builds the eligibility
+        bitmask of every player, walking every player's position list once.
+
+    Expected Output:
+        PositionIndex: The index over all the players.
+
+    Example:
+        index = build_position_index(read_players("players.txt"))
+        index.role_codes
+        {'Goalkeeper': 0, 'Centre-back': 1, 'Right-back': 2, ...}
+    """
+    role_codes = {}
+    masks = []
+    for attributes in players.values():
+        mask = 0
+        for position in attributes['positions']:
+            mask |= 1 << role_codes.setdefault(position, len(role_codes))
+        masks.append(mask)
+    return PositionIndex(players, role_codes, masks)
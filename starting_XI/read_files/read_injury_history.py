@@ -1,91 +1,249 @@
-def read_injury_history(file_path):
-    """
-    Name:
-        read_injury_history
-
-    Parameters:
-        file_path (str): Path to the text file containing injury history information.
-
-    Description:
-        Reads a text file containing football players' injury history,
-        processes each player's data to extract their injuries, and stores each player
-        as a dictionary. Each player is represented as a key, and the value is another
-        dictionary containing a list of injuries. Each injury is represented as a dictionary
-        with the following attributes:
-            - Date (str)
-            - Injury Type (str)
-            - Recovery Time (int, in days)
-            - Severity (str)
-            - Minutes Played Before Injury (int)
-            - Recurrent (str: "Yes" or "No")
-
-    Expected Output:
-        dict: A dictionary where each key is a player's name (str) and the value is a dictionary
-              containing a list of injuries:
-              {
-                  'player_name': {
-                      'injuries': [
-                          {
-                              'date': str,
-                              'injury_type': str,
-                              'recovery_time': int,
-                              'severity': str,
-                              'minutes_played': int,
-                              'recurrent': str
-                          },
-                          ...
-                      ]
-                  },
-                  ...
-              }
-
-    Example Output:
-        {
-            'Marc-André ter Stegen': {
-                'injuries': [
-                    {'date': '2024-09-23', 'injury_type': 'Patellar Tendon Rupture', 'recovery_time': 214, 'severity': 'Severe', 'minutes_played': 1800, 'recurrent': 'No'},
-                    {'date': '2023-11-05', 'injury_type': 'Back Injury', 'recovery_time': 86, 'severity': 'Moderate', 'minutes_played': 2500, 'recurrent': 'No'},
-                    ...
-                ]
-            },
-            'Toni Fernández': {
-                'injuries': []
-            },
-            ...
-        }
-    """
-    players = {}
-    current_player = None
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        for line in file:
-            line = line.strip()
-            # Ignore empty lines or comments
-            if not line or line.startswith('//'):
-                continue
-
-            # Detect player name
-            if line.startswith("# Player:"):
-                current_player = line.replace("# Player:", "").strip()
-                players[current_player] = {'injuries': []}
-            elif line == "No recorded injuries":
-                # Handle players with no injuries
-                players[current_player]['injuries'] = []
-            elif not line.startswith("#"):
-                # Process injury data
-                try:
-                    date, injury_type, recovery_time, severity, minutes_played, recurrent = line.split(',', maxsplit=5)
-                    recovery_time = int(recovery_time.strip())
-                    minutes_played = int(minutes_played.strip())
-                    players[current_player]['injuries'].append({
-                        'date': date.strip(),
-                        'injury_type': injury_type.strip(),
-                        'recovery_time': recovery_time,
-                        'severity': severity.strip(),
-                        'minutes_played': minutes_played,
-                        'recurrent': recurrent.strip()
-                    })
-                except ValueError:
-                    print(f"Error processing line: {line}")
-
-    return players
\ No newline at end of file
+import os
+import sys
+from read_files.record_stream import RejectedRecords, iter_log_lines
+
+# First line of a compacted injury history: how many bytes of the journal are already included
+JOURNAL_OFFSET_PREFIX = "// Injury journal offset:"
+
+def read_injury_history(file_path, journal_path=None, journal_end=None, rejected=None):
+    """
+    Name:
+        read_injury_history
+
+    Parameters:
+        file_path (str): Path to the text file containing injury history information.
+        journal_path (str, optional): Path to the append-only injury journal. Defaults to the journal next to
+                                      `file_path` (see `injury_journal_path`).
+        journal_end (int, optional): Stop reading the journal at this byte offset (used by compaction).
+        rejected (RejectedRecords, optional): Collector for the lines that cannot be parsed. If not given,
+                                              one summary line is written to stderr when lines were skipped.
+
+    Description:
+        Thin wrapper over the streaming readers `iter_injury_history` and `iter_injury_journal`.
+        Reads a text file containing football players' injury history,
+        processes each player's data to extract their injuries, and stores each player
+        as a dictionary. Each player is represented as a key, and the value is another
+        dictionary containing a list of injuries. Each injury is represented as a dictionary
+        with the following attributes:
+            - Date (str)
+            - Injury Type (str)
+            - Recovery Time (int, in days)
+            - Severity (str)
+            - Minutes Played Before Injury (int)
+            - Recurrent (str: "Yes" or "No")
+
+    Expected Output:
+        dict: A dictionary where each key is a player's name (str) and the value is a dictionary
+              containing a list of injuries:
+              {
+                  'player_name': {
+                      'injuries': [
+                          {
+                              'date': str,
+                              'injury_type': str,
+                              'recovery_time': int,
+                              'severity': str,
+                              'minutes_played': int,
+                              'recurrent': str
+                          },
+                          ...
+                      ]
+                  },
+                  ...
+              }
+
+        Injuries registered since the last compaction are kept in the injury journal. They are merged in the
+        same pass: the journal tail is read first, then each player's journal entries are placed before the
+        injuries of their section (newest first), and players that only appear in the journal are added at
+        the end. The result is the same as if every injury had been written into the file.
+
+    Example Output:
+        {
+            'Marc-André ter Stegen': {
+                'injuries': [
+                    {'date': '2024-09-23', 'injury_type': 'Patellar Tendon Rupture', 'recovery_time': 214, 'severity': 'Severe', 'minutes_played': 1800, 'recurrent': 'No'},
+                    {'date': '2023-11-05', 'injury_type': 'Back Injury', 'recovery_time': 86, 'severity': 'Moderate', 'minutes_played': 2500, 'recurrent': 'No'},
+                    ...
+                ]
+            },
+            'Toni Fernández': {
+                'injuries': []
+            },
+            ...
+        }
+    """
+    collector = rejected if rejected is not None else RejectedRecords()
+    if journal_path is None:
+        journal_path = injury_journal_path(file_path)
+    pending = read_injury_journal(journal_path, read_journal_offset(file_path), journal_end, collector)
+
+    players = {}
+    for player, injury in iter_injury_history(file_path, collector):
+        if injury is None:
+            players[player] = {'injuries': pending.pop(player, [])}
+        else:
+            players[player]['injuries'].append(injury)
+
+    # Players registered only in the journal go at the end
+    for player, injuries in pending.items():
+        players[player] = {'injuries': injuries}
+
+    if rejected is None and collector.count:
+        print(collector.summary(), file=sys.stderr)
+    return players
+
+def iter_injury_history(file_path, rejected=None):
+    """
+    Name:
+        iter_injury_history
+
+    Parameters:
+        file_path (str): Path to the text file containing injury history information.
+        rejected (RejectedRecords, optional): Collector for the lines that cannot be parsed. Bad lines are
+                                              skipped silently if not given.
+
+    Description:
+        Streams the injury history file one line at a time, without building any structure, so files of any
+        size are read with bounded memory (group the records with `iter_chunks` to process them in chunks).
+        Yields (player name, injury) records in file order:
+            - (player, None) for every "# Player:" section, so players without injuries are seen too,
+            - (player, injury dictionary) for every injury line of the section, parsed by `parse_injury_line`.
+        Injury lines that cannot be parsed, or that appear before any player section, go to `rejected`.
+        The injury journal is not included (see `iter_injury_journal`).
+
+    Expected Output:
+        generator: (str, dict or None) records.
+
+    Example:
+        for player, injury in iter_injury_history("injury_history.txt"):
+            ...
+        ('Marc-André ter Stegen', None)
+        ('Marc-André ter Stegen', {'date': '2024-09-23', 'injury_type': 'Patellar Tendon Rupture', ...})
+    """
+    current_player = None
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            # Ignore empty lines or comments
+            if not line or line.startswith('//'):
+                continue
+
+            # Detect player name
+            if line.startswith("# Player:"):
+                current_player = line.replace("# Player:", "").strip()
+                yield current_player, None
+            elif line == "No recorded injuries" or line.startswith("#"):
+                # Players with no injuries keep an empty list
+                continue
+            elif current_player is None:
+                if rejected is not None:
+                    rejected.add(file_path, line_number, line, "injury line before any player section")
+            else:
+                # Process injury data
+                try:
+                    injury = parse_injury_line(line)
+                except ValueError as error:
+                    if rejected is not None:
+                        rejected.add(file_path, line_number, line, error)
+                    continue
+                yield current_player, injury
+
+def parse_injury_line(line):
+    """
+    Parses one injury line ("date, injury type, recovery days, severity, minutes played, recurrent")
+    into an injury dictionary. Raises ValueError if the line is malformed.
+    """
+    date, injury_type, recovery_time, severity, minutes_played, recurrent = line.split(',', maxsplit=5)
+    return {
+        'date': date.strip(),
+        'injury_type': injury_type.strip(),
+        'recovery_time': int(recovery_time.strip()),
+        'severity': severity.strip(),
+        'minutes_played': int(minutes_played.strip()),
+        'recurrent': recurrent.strip()
+    }
+
+def injury_journal_path(file_path):
+    """Returns the path of the injury journal that belongs to an injury history file (e.g. injury_history.journal)."""
+    return os.path.splitext(file_path)[0] + '.journal'
+
+def read_journal_offset(file_path):
+    """
+    Returns the number of journal bytes already compacted into the injury history file, read from its
+    first line ("// Injury journal offset: N"). Files without that line start at offset 0.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            first_line = file.readline().strip()
+    except FileNotFoundError:
+        return 0
+    if first_line.startswith(JOURNAL_OFFSET_PREFIX):
+        return int(first_line[len(JOURNAL_OFFSET_PREFIX):].strip())
+    return 0
+
+def read_injury_journal(journal_path, start=0, end=None, rejected=None):
+    """
+    Name:
+        read_injury_journal
+
+    Parameters:
+        journal_path (str): Path to the injury journal. A missing journal is treated as empty.
+        start (int): Byte offset where reading starts (entries before it are already compacted).
+        end (int, optional): Byte offset where reading stops. Defaults to the end of the journal.
+        rejected (RejectedRecords, optional): Collector for the entries that cannot be parsed.
+
+    Description:
+        Reads the journal entries between `start` and `end` with `iter_injury_journal`. Each entry is one line
+        with the player's name and an injury line separated by a tab, appended in the order the injuries
+        were registered.
+
+    Expected Output:
+        dict: {player name: [injury dict, ...]} with each player's entries newest first.
+    """
+    entries = {}
+    for player, injury in iter_injury_journal(journal_path, start, end, rejected):
+        entries.setdefault(player, []).append(injury)
+
+    for injuries in entries.values():
+        injuries.reverse()
+    return entries
+
+def iter_injury_journal(journal_path, start=0, end=None, rejected=None):
+    """
+    Streams the journal entries between the byte offsets `start` and `end` (defaults to the end of the
+    journal) as (player name, injury dictionary) records, in the order they were registered. A missing
+    journal yields nothing. Entries that cannot be parsed go to `rejected` with their byte offset.
+    """
+    for offset, line in iter_log_lines(journal_path, start, end):
+        try:
+            player, injury_line = line.split('\t', maxsplit=1)
+            injury = parse_injury_line(injury_line)
+        except ValueError as error:
+            if rejected is not None:
+                rejected.add(journal_path, offset, line, error)
+            continue
+        yield player.strip(), injury
+
+def read_injury_index(file_path):
+    """
+    Name:
+        read_injury_index
+
+    Parameters:
+        file_path (str): Path to the text file containing injury history information.
+
+    Description:
+        Reads the injury history with `read_injury_history` and parses it once into an `InjuryIndex`
+        (sorted per-player intervals with datetime64 start/end arrays), ready for availability queries.
+
+    Expected Output:
+        InjuryIndex: The interval index over all the injuries in the file.
+
+    Example Output:
+        index = read_injury_index("injury_history.txt")
+        index.unavailable_mask(["2024-10-01", "2025-02-01"], ["Marc-André ter Stegen", "Pedri"])
+        array([[ True,  True],
+               [ True, False]])
+    """
+    from read_files.injury_index import build_injury_index  # NumPy is only loaded when an index is built
+    return build_injury_index(read_injury_history(file_path))
@@ -1,44 +1,142 @@
-def read_played_minutes(file_path):
-    """
-    Name:
-        read_played_minutes
-
-    Parameters:
-        file_path (str): Path to the text file containing played minutes information.
-
-    Description:
-        Reads a text file containing the minutes played by each player and stores the data
-        in a dictionary where the keys are the player names and the values are the minutes played.
-
-    Expected Output:
-        dict: A dictionary where each key is a player's name (str) and the value is the minutes played (int).
-
-    Example Output:
-        {
-            'Marc-André ter Stegen': 0,
-            'Iñaki Peña': 0,
-            'Ronald Araujo': 0,
-            ...
-        }
-    """
-    played_minutes = {}
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        for line in file:
-            line = line.strip()
-            # Ignore empty lines or comments
-            if not line or line.startswith('//'):
-                continue
-
-            try:
-                # Split the line into player name and minutes played
-                name, minutes = line.split(',', maxsplit=1)
-                played_minutes[name.strip()] = int(minutes.strip())
-            except ValueError:
-                print(f"Error processing line: {line}")
-
-    return played_minutes
-
-# Example usage
-file_path = r'c:\Users\galgu\Respaldo\CETI\Cuarto Semestre\Algoritmia\Tercer Parcial\starting_XI\data\played_minutes.txt'
-played_minutes = read_played_minutes(file_path)
\ No newline at end of file
+import os
+import sys
+from read_files.record_stream import RejectedRecords, iter_chunks, iter_log_lines
+
+# First line of a played minutes snapshot: how many bytes of the minutes ledger are already included
+LEDGER_OFFSET_PREFIX = "// Minutes ledger offset:"
+
+def read_played_minutes(file_path, ledger_path=None, ledger_end=None, rejected=None):
+    """
+    Name:
+        read_played_minutes
+
+    Parameters:
+        file_path (str): Path to the text file containing played minutes information.
+        ledger_path (str, optional): Path to the match-by-match minutes ledger. Defaults to the ledger next to
+                                     `file_path` (see `minutes_ledger_path`).
+        ledger_end (int, optional): Stop reading the ledger at this byte offset (used when taking a snapshot).
+        rejected (RejectedRecords, optional): Collector for the lines that cannot be parsed. If not given,
+                                              one summary line is written to stderr when lines were skipped.
+
+    Description:
+        Thin wrapper over the streaming readers `iter_played_minutes` and `read_minutes_ledger`.
+        Reads a text file containing the minutes played by each player and stores the data
+        in a dictionary where the keys are the player names and the values are the minutes played.
+
+        The file is a snapshot of the totals. Matches recorded after the snapshot are in the minutes ledger
+        (one record per player per match); their per-player sums are added to the snapshot totals.
+        Players that only appear in the ledger are added at the end.
+
+    Expected Output:
+        dict: A dictionary where each key is a player's name (str) and the value is the minutes played (int).
+
+    Example Output:
+        {
+            'Marc-André ter Stegen': 0,
+            'Iñaki Peña': 0,
+            'Ronald Araujo': 0,
+            ...
+        }
+    """
+    collector = rejected if rejected is not None else RejectedRecords()
+    played_minutes = dict(iter_played_minutes(file_path, collector))
+
+    # Add the matches recorded in the ledger after the snapshot
+    if ledger_path is None:
+        ledger_path = minutes_ledger_path(file_path)
+    for name, minutes in read_minutes_ledger(ledger_path, read_ledger_offset(file_path), ledger_end, collector).items():
+        played_minutes[name] = played_minutes.get(name, 0) + minutes
+
+    if rejected is None and collector.count:
+        print(collector.summary(), file=sys.stderr)
+    return played_minutes
+
+def iter_played_minutes(file_path, rejected=None):
+    """
+    Streams the played minutes snapshot one line at a time as (player name, minutes) records, without
+    building any structure. Lines that cannot be parsed go to `rejected` with their line number. The
+    minutes ledger is not included (see `iter_minutes_ledger`).
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            # Ignore empty lines or comments
+            if not line or line.startswith('//'):
+                continue
+
+            try:
+                # Split the line into player name and minutes played
+                name, minutes = line.split(',', maxsplit=1)
+                record = (name.strip(), int(minutes.strip()))
+            except ValueError as error:
+                if rejected is not None:
+                    rejected.add(file_path, line_number, line, error)
+                continue
+            yield record
+
+def minutes_ledger_path(file_path):
+    """Returns the path of the minutes ledger that belongs to a played minutes file (e.g. played_minutes.ledger)."""
+    return os.path.splitext(file_path)[0] + '.ledger'
+
+def read_ledger_offset(file_path):
+    """
+    Returns the number of ledger bytes already included in the played minutes snapshot, read from its
+    first line ("// Minutes ledger offset: N"). Files without that line start at offset 0.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            first_line = file.readline().strip()
+    except FileNotFoundError:
+        return 0
+    if first_line.startswith(LEDGER_OFFSET_PREFIX):
+        return int(first_line[len(LEDGER_OFFSET_PREFIX):].strip())
+    return 0
+
+def read_minutes_ledger(ledger_path, start=0, end=None, rejected=None):
+    """
+    Name:
+        read_minutes_ledger
+
+    Parameters:
+        ledger_path (str): Path to the minutes ledger. A missing ledger is treated as empty.
+        start (int): Byte offset where reading starts (records before it are already in the snapshot).
+        end (int, optional): Byte offset where reading stops. Defaults to the end of the ledger.
+        rejected (RejectedRecords, optional): Collector for the records that cannot be parsed.
+
+    Description:
+        Sums the minutes of every player over the ledger records between `start` and `end`. Each record is one
+        line "match id,minutes,player name", written by `record_match_minutes`. The records are streamed by
+        `iter_minutes_ledger` and summed in chunks (`iter_chunks`) with one `np.bincount` per chunk, so the
+        memory used depends on the number of players, not on the length of the ledger.
+
+    Expected Output:
+        dict: {player name: minutes}, with the players in the order they first appear in the ledger.
+    """
+    player_id = {}
+    totals = None
+    for chunk in iter_chunks(iter_minutes_ledger(ledger_path, start, end, rejected)):
+        import numpy as np  # Imported on first use, so importing this module stays cheap
+        for _, _, name in chunk:
+            player_id.setdefault(name, len(player_id))
+        ids = np.fromiter((player_id[name] for _, _, name in chunk), dtype=np.int64, count=len(chunk))
+        chunk_totals = np.bincount(ids, weights=[record_minutes for _, record_minutes, _ in chunk], minlength=len(player_id)).astype(np.int64)
+        if totals is not None:
+            chunk_totals[:len(totals)] += totals
+        totals = chunk_totals
+    return dict(zip(player_id, totals.tolist())) if totals is not None else {}
+
+def iter_minutes_ledger(ledger_path, start=0, end=None, rejected=None):
+    """
+    Streams the ledger records between the byte offsets `start` and `end` (defaults to the end of the ledger)
+    as (match id, minutes, player name) tuples of (int, int, str), reading one line at a time. Records that
+    cannot be parsed go to `rejected` with their byte offset.
+    """
+    for offset, line in iter_log_lines(ledger_path, start, end):
+        try:
+            match_id, record_minutes, name = line.split(',', maxsplit=2)
+            record = (int(match_id), int(record_minutes), name.strip())
+        except ValueError as error:
+            if rejected is not None:
+                rejected.add(ledger_path, offset, line, error)
+            continue
+        yield record
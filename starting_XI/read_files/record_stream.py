@@ -0,0 +1,91 @@
+from itertools import islice
+
+# Records per chunk yielded by `iter_chunks`
+CHUNK_SIZE = 10000
+
+# Rejected lines kept as samples by default (all of them are counted)
+REJECTED_SAMPLES = 100
+
+class RejectedRecords:
+    """
+    Name:
+        RejectedRecords
+
+    Parameters:
+        max_samples (int, optional): Number of rejected lines kept for inspection. Defaults to 100.
+
+    Description:
+        Collects the lines the streaming readers could not parse, instead of printing one message per line.
+        Every rejected line is counted per source file, but only the first `max_samples` are kept, so the
+        memory used does not grow with the number of bad lines. Each sample is a tuple
+        (source, location, line, reason), where the location is the line number in a text file, or the byte
+        offset of the line in the injury journal and the minutes ledger.
+
+    Example:
+        rejected = RejectedRecords()
+        injury_history = read_injury_history("injury_history.txt", rejected=rejected)
+        rejected.count
+        2
+        rejected.samples[0]
+        ('injury_history.txt', 14, '2024-01-10, Knee, ten, Mild, 0, No', "invalid literal for int() with base 10: 'ten'")
+    """
+
+    def __init__(self, max_samples=REJECTED_SAMPLES):
+        self.max_samples = max_samples
+        self.count = 0
+        self.counts = {}
+        self.samples = []
+
+    def add(self, source, location, line, reason):
+        """Records one rejected line."""
+        self.count += 1
+        self.counts[source] = self.counts.get(source, 0) + 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append((source, location, line, str(reason)))
+
+    def __len__(self):
+        return self.count
+
+    def summary(self):
+        """Returns a one-line description of the rejected lines per source ('' if there are none)."""
+        return "; ".join(
+            f"{count} malformed {'line' if count == 1 else 'lines'} skipped in {source}" for source, count in self.counts.items()
+        )
+
+def iter_chunks(records, chunk_size=CHUNK_SIZE):
+    """
+    Groups the records of a streaming reader into lists of at most `chunk_size` records, so a large file can
+    be processed chunk by chunk with bounded memory.
+
+    Example:
+        for chunk in iter_chunks(iter_injury_history("league_injuries.txt")):
+            ...
+    """
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def iter_log_lines(file_path, start=0, end=None):
+    """
+    Streams the non-empty lines of an append-only log (the injury journal or the minutes ledger) between the
+    byte offsets `start` and `end` (defaults to the end of the file) as (byte offset, line) pairs, reading
+    one line at a time. A missing file yields nothing.
+    """
+    try:
+        file = open(file_path, 'rb')
+    except FileNotFoundError:
+        return
+
+    with file:
+        file.seek(start)
+        offset = start
+        for raw_line in file:
+            if end is not None and offset >= end:
+                break
+            line = raw_line.decode('utf-8', 'replace').strip()
+            if line:
+                yield offset, line
+            offset += len(raw_line)
@@ -0,0 +1,39 @@
+import os
+import sys
+import json
+import argparse
+from functions.simulate_seasons import simulate_seasons, summarize_seasons, weekly_fixtures
+from squad_store.open_squad_store import open_squad_store
+
+# Simulation settings
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DATA_BACKEND = "text"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of full seasons with the lineup generator")
+    parser.add_argument("--seasons", type=int, default=1000, help="number of simulated seasons (default: 1000)")
+    parser.add_argument("--start-date", default="2025-08-17", help="date of the first match (YYYY-MM-DD)")
+    parser.add_argument("--matches", type=int, default=38, help="number of matches, one per week (default: 38)")
+    parser.add_argument("--substitutions", type=int, default=3, help="substitutions per match (default: 3)")
+    parser.add_argument("--solver", default="hungarian", choices=["hungarian", "sparse"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--output", metavar="FILE", help="write the JSON summary to FILE instead of the standard output")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="squad data directory (default: data/)")
+    parser.add_argument("--backend", default=DATA_BACKEND, choices=["text", "snapshot", "sqlite"], help="data backend")
+    args = parser.parse_args()
+
+    store = open_squad_store(args.backend, args.data_dir)
+    results = simulate_seasons(
+        store.read_players(), store.read_injury_history(), store.read_played_minutes(), store.read_player_performance(),
+        weekly_fixtures(args.start_date, args.matches), seasons=args.seasons, seed=args.seed, workers=args.workers,
+        policy={'solver': args.solver, 'substitutions': args.substitutions}
+    )
+    summary = summarize_seasons(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+    else:
+        json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+        print()
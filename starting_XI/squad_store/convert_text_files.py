@@ -0,0 +1,115 @@
+import os
+from read_files.read_injury_history import injury_journal_path
+from read_files.read_played_minutes import minutes_ledger_path
+from read_files.lineup_archive import LineupArchive, parse_lineup
+from functions.played_minutes.update_played_minutes_file import update_played_minutes_file
+from functions.injuries.compact_injury_history import write_injury_history
+from squad_store.sqlite_squad_store import SQLiteSquadStore
+from squad_store.text_squad_store import (
+    TextSquadStore, PLAYERS_FILE, PLAYED_MINUTES_FILE, INJURY_HISTORY_FILE, PLAYER_PERFORMANCE_FILE, LINEUPS_FILE
+)
+
+def read_player_sections(file_path):
+    """
+    Returns {player name: section} for players.txt, where the section is the last '# ...' comment
+    before the player's line (e.g. 'Goalkeepers'), so an export can rebuild the same grouping.
+    """
+    sections = {}
+    section = None
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith('#'):
+                section = line.lstrip('#').strip()
+            elif line and not line.startswith('//'):
+                sections[line.split(',', maxsplit=1)[0].strip()] = section
+    return sections
+
+def import_text_files(data_dir, db_path):
+    """
+    Name:
+        import_text_files
+
+    Parameters:
+        data_dir (str): Directory containing the squad text files.
+        db_path (str): Path of the SQLite database to fill. Existing rows in the database are replaced.
+
+    Description:
+        Reads the five text files (players, played minutes, injury history, performance and lineups) with
+        the existing readers and loads them into a `SQLiteSquadStore`. Missing files are skipped.
+
+    Expected Output:
+        SQLiteSquadStore: The store opened on `db_path`, with the imported data.
+    """
+    text_store = TextSquadStore(data_dir)
+    store = SQLiteSquadStore(db_path)
+
+    if os.path.exists(text_store.players_file):
+        store.load_players(text_store.read_players(), read_player_sections(text_store.players_file))
+    if os.path.exists(text_store.played_minutes_file):
+        store.load_played_minutes(text_store.read_played_minutes())
+    if os.path.exists(text_store.injury_history_file):
+        store.load_injury_history(text_store.read_injury_history())
+    if os.path.exists(text_store.player_performance_file):
+        store.load_player_performance(text_store.read_player_performance())
+    store.load_lineups([parse_lineup(lineup) for lineup in text_store.read_lineups()])
+
+    return store
+
+def export_text_files(store, data_dir):
+    """
+    Name:
+        export_text_files
+
+    Parameters:
+        store (SQLiteSquadStore): Store to export.
+        data_dir (str): Directory where the text files are written. Existing files are overwritten.
+
+    Description:
+        Writes the content of the store back to the five text files, in the same formats that the
+        `read_files` functions read (players grouped by their original section comments, injury history
+        with one '# Player:' block per player, and so on).
+
+    Expected Output:
+        None: The files are written to `data_dir`.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+
+    # players.txt
+    players = store.read_players()
+    sections = store.player_sections()
+    lines = []
+    current_section = None
+    for name, attributes in players.items():
+        section = sections.get(name)
+        if section and section != current_section:
+            if lines:
+                lines.append("")
+            lines.append(f"# {section}")
+            current_section = section
+        lines.append(f"{name}, {attributes['number']}, {attributes['age']}, [{', '.join(attributes['positions'])}]")
+    with open(os.path.join(data_dir, PLAYERS_FILE), 'w', encoding='utf-8') as file:
+        file.write("\n".join(lines) + "\n")
+
+    # played_minutes.txt (any existing minutes ledger in data_dir is marked as already included)
+    played_minutes_file = os.path.join(data_dir, PLAYED_MINUTES_FILE)
+    ledger_path = minutes_ledger_path(played_minutes_file)
+    ledger_size = os.path.getsize(ledger_path) if os.path.exists(ledger_path) else 0
+    update_played_minutes_file(played_minutes_file, store.read_played_minutes(), ledger_size)
+
+    # injury_history.txt (any existing journal in data_dir is marked as already included)
+    injury_history_file = os.path.join(data_dir, INJURY_HISTORY_FILE)
+    journal_path = injury_journal_path(injury_history_file)
+    journal_size = os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+    write_injury_history(injury_history_file, store.read_injury_history(), journal_size)
+
+    # player_performance.txt
+    with open(os.path.join(data_dir, PLAYER_PERFORMANCE_FILE), 'w', encoding='utf-8') as file:
+        for player, score in store.read_player_performance().items():
+            file.write(f"{player}, {score:g}\n")
+
+    # lineups.txt (and its offset index)
+    with open(os.path.join(data_dir, LINEUPS_FILE), 'w', encoding='utf-8') as file:
+        for lineup in store.read_lineups():
+            file.write(lineup + "\n\n")
+    LineupArchive(os.path.join(data_dir, LINEUPS_FILE)).reindex()
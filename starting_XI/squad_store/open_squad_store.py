@@ -0,0 +1,43 @@
+import os
+from squad_store.text_squad_store import TextSquadStore
+
+# Name of the SQLite database inside a squad data directory
+DATABASE_FILE = 'starting_XI.db'
+
+def open_squad_store(backend, data_dir):
+    """
+    Name:
+        open_squad_store
+
+    Parameters:
+        backend (str): "text" to use the text files directly, "snapshot" to read them through a compiled
+                       binary snapshot, or "sqlite" to use the embedded database.
+        data_dir (str): Directory containing the squad data files.
+
+    Description:
+        Opens the squad data store for the selected backend. With "snapshot", the text files are compiled
+        into `data_dir/squad.snapshot` (again whenever they change) and read from it. With "sqlite", the database
+        `data_dir/starting_XI.db` is used; the first time it is created, it is filled from the text files
+        with `import_text_files`.
+
+    Expected Output:
+        TextSquadStore, SnapshotSquadStore or SQLiteSquadStore: A store with the read_* / save_lineup / update_* methods.
+
+    Raises:
+        ValueError: If the backend is not "text", "snapshot" or "sqlite".
+    """
+    if backend == "text":
+        return TextSquadStore(data_dir)
+    if backend == "snapshot":
+        # Imported here so the text backend does not load NumPy
+        from squad_store.snapshot_squad_store import SnapshotSquadStore
+        return SnapshotSquadStore(data_dir)
+    if backend == "sqlite":
+        # Imported here so the text backend does not load sqlite3
+        from squad_store.sqlite_squad_store import SQLiteSquadStore
+        from squad_store.convert_text_files import import_text_files
+        db_path = os.path.join(data_dir, DATABASE_FILE)
+        if not os.path.exists(db_path):
+            return import_text_files(data_dir, db_path)
+        return SQLiteSquadStore(db_path)
+    raise ValueError(f"Unknown data backend: {backend}")
@@ -0,0 +1,81 @@
+import os
+from squad_store.text_squad_store import TextSquadStore
+from squad_store.squad_snapshot import SNAPSHOT_FILE, SquadSnapshot, file_stats, load_squad_snapshot, write_squad_snapshot
+
+# Datasets compiled into the snapshot (lineups are always read from lineups.txt)
+SNAPSHOT_DATASETS = ['players', 'played_minutes', 'injury_history', 'player_performance']
+
+class SnapshotSquadStore(TextSquadStore):
+    """
+    Name:
+        SnapshotSquadStore
+
+    Parameters:
+        data_dir (str): Directory containing the squad text files.
+
+    Description:
+        Text file store that reads players, played minutes, injuries and performance from a compiled binary
+        snapshot (`data/squad.snapshot`, see `write_squad_snapshot`) instead of parsing the text files.
+        The text files (with the minutes ledger and the injury journal) stay the source of data, and every
+        write goes to them as in `TextSquadStore`.
+
+        When any source file changed since the snapshot was written (modification time or size), the
+        snapshot is compiled again from the text files before reading. A warm start with unchanged files
+        only maps the snapshot into memory.
+    """
+
+    backend = "snapshot"
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self.snapshot_file = os.path.join(data_dir, SNAPSHOT_FILE)
+        self._snapshot = None
+
+    def snapshot_sources(self):
+        """Returns the text files the snapshot is compiled from."""
+        return [path for dataset in SNAPSHOT_DATASETS for path in self.source_files(dataset)]
+
+    def load_snapshot(self):
+        """Returns the up-to-date `SquadSnapshot`, compiling it first if it is missing or out of date."""
+        sources = self.snapshot_sources()
+        if self._snapshot is not None and self._snapshot.sources == file_stats(sources):
+            return self._snapshot
+
+        # Release the previous map before the file can be replaced
+        self._snapshot = None
+        snapshot = load_squad_snapshot(self.snapshot_file, sources)
+        if snapshot is None:
+            # Stats are taken before reading, so a write during the rebuild marks the snapshot as out of date
+            stats = file_stats(sources)
+            write_squad_snapshot(
+                self.snapshot_file,
+                super().read_players(),
+                super().read_played_minutes(),
+                super().read_injury_history(),
+                super().read_player_performance(),
+                stats
+            )
+            snapshot = SquadSnapshot(self.snapshot_file)
+        self._snapshot = snapshot
+        return snapshot
+
+    def read_players(self):
+        return self.load_snapshot().read_players()
+
+    def read_played_minutes(self):
+        return self.load_snapshot().read_played_minutes()
+
+    def read_injury_history(self):
+        return self.load_snapshot().read_injury_history()
+
+    def read_player_performance(self):
+        return self.load_snapshot().read_player_performance()
+
+    def read_injury_index(self):
+        return self.load_snapshot().injury_index()
+
+    def read_injury_records(self):
+        return self.load_snapshot().injury_records()
+
+    def read_position_index(self):
+        return self.load_snapshot().position_index()
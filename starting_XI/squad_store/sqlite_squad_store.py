@@ -0,0 +1,280 @@
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    number INTEGER NOT NULL,
+    age INTEGER NOT NULL,
+    positions TEXT NOT NULL,
+    section TEXT
+);
+CREATE INDEX IF NOT EXISTS players_number ON players (number);
+
+CREATE TABLE IF NOT EXISTS injury_players (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS injuries (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL REFERENCES injury_players (name),
+    seq INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    injury_type TEXT NOT NULL,
+    recovery_time INTEGER NOT NULL,
+    severity TEXT NOT NULL,
+    minutes_played INTEGER NOT NULL,
+    recurrent TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS injuries_player ON injuries (player, seq);
+CREATE INDEX IF NOT EXISTS injuries_date ON injuries (date);
+
+CREATE TABLE IF NOT EXISTS played_minutes (
+    player TEXT PRIMARY KEY,
+    minutes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS minutes_ledger (
+    id INTEGER PRIMARY KEY,
+    match_id INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    minutes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS minutes_ledger_player ON minutes_ledger (player);
+
+CREATE TABLE IF NOT EXISTS player_performance (
+    player TEXT PRIMARY KEY,
+    score REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS lineups (
+    number INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS lineup_slots (
+    lineup_number INTEGER NOT NULL REFERENCES lineups (number),
+    slot INTEGER NOT NULL,
+    position TEXT NOT NULL,
+    player TEXT NOT NULL,
+    PRIMARY KEY (lineup_number, slot)
+);
+CREATE INDEX IF NOT EXISTS lineup_slots_player ON lineup_slots (player);
+
+CREATE TABLE IF NOT EXISTS dataset_versions (
+    dataset TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+class SQLiteSquadStore:
+    """
+    Name:
+        SQLiteSquadStore
+
+    Parameters:
+        db_path (str): Path to the SQLite database file. It is created (with its tables) if it does not exist.
+
+    Description:
+        Squad data store backed by an embedded SQLite database with one indexed table per dataset
+        (players, injuries, played minutes, performance and lineups). The read methods return exactly the
+        same structures as the `read_files` functions, and every write is a small transactional insert or
+        update of the affected rows instead of a full-file rewrite.
+
+        Rows keep their insertion order (rowid), so exporting back to text files reproduces the original
+        layout. Use `import_text_files` / `export_text_files` to convert from and to the text formats.
+
+        Every dataset has a version counter in the `dataset_versions` table, increased by each writer in the
+        same transaction as its rows. `SquadDataCache` checks these counters (`dataset_version`) instead of
+        the database file, so saving a lineup only invalidates the lineups, and a write from another
+        connection is seen as soon as it is committed.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def describe(self):
+        """Returns a short description of where the data is stored (for messages)."""
+        return self.db_path
+
+    def dataset_version(self, dataset):
+        """Returns the version counter of a dataset (0 if it was never written), used by `SquadDataCache`."""
+        row = self.connection.execute("SELECT version FROM dataset_versions WHERE dataset = ?", (dataset,)).fetchone()
+        return row[0] if row else 0
+
+    def _bump_version(self, dataset):
+        # Called inside the writer's transaction, so the rows and the new version are committed together
+        self.connection.execute("INSERT OR IGNORE INTO dataset_versions (dataset, version) VALUES (?, 0)", (dataset,))
+        self.connection.execute("UPDATE dataset_versions SET version = version + 1 WHERE dataset = ?", (dataset,))
+
+    # Readers (same output as the read_files functions)
+
+    def read_players(self):
+        rows = self.connection.execute("SELECT name, number, age, positions FROM players ORDER BY rowid")
+        return {
+            name: {'number': number, 'age': age, 'positions': [pos.strip() for pos in positions.split(',')]}
+            for name, number, age, positions in rows
+        }
+
+    def read_played_minutes(self):
+        # Imported totals plus the per-match records of the ledger (players only in the ledger go last)
+        played_minutes = {player: minutes for player, minutes in self.connection.execute("SELECT player, minutes FROM played_minutes ORDER BY rowid")}
+        rows = self.connection.execute("SELECT player, SUM(minutes) FROM minutes_ledger GROUP BY player ORDER BY MIN(id)")
+        for player, minutes in rows:
+            played_minutes[player] = played_minutes.get(player, 0) + minutes
+        return played_minutes
+
+    def read_injury_history(self):
+        players = {name: {'injuries': []} for name, in self.connection.execute("SELECT name FROM injury_players ORDER BY rowid")}
+        rows = self.connection.execute(
+            "SELECT player, date, injury_type, recovery_time, severity, minutes_played, recurrent "
+            "FROM injuries ORDER BY player, seq"
+        )
+        for player, date, injury_type, recovery_time, severity, minutes_played, recurrent in rows:
+            players[player]['injuries'].append({
+                'date': date,
+                'injury_type': injury_type,
+                'recovery_time': recovery_time,
+                'severity': severity,
+                'minutes_played': minutes_played,
+                'recurrent': recurrent
+            })
+        return players
+
+    def read_player_performance(self):
+        rows = self.connection.execute("SELECT player, score FROM player_performance ORDER BY rowid")
+        return {player: score for player, score in rows}
+
+    def read_lineups(self):
+        lineups = []
+        current_number = None
+        lines = []
+        rows = self.connection.execute("SELECT lineup_number, position, player FROM lineup_slots ORDER BY lineup_number, slot")
+        for lineup_number, position, player in rows:
+            if lineup_number != current_number:
+                if lines:
+                    lineups.append("\n".join(lines))
+                current_number = lineup_number
+                lines = [f"Lineup {lineup_number}:"]
+            lines.append(f"{position}: {player}")
+        if lines:
+            lineups.append("\n".join(lines))
+        return lineups
+
+    def count_lineups(self):
+        return self.connection.execute("SELECT COUNT(*) FROM lineups").fetchone()[0]
+
+    def read_lineup(self, number):
+        # `number` is the place of the lineup in the archive (1 = first), as in LineupArchive.get
+        count = self.count_lineups()
+        if not 1 <= number <= count:
+            raise IndexError(f"There is no lineup {number} (there are {count} lineups).")
+        return self._read_lineup_records(number - 1, 1)[0]
+
+    def read_last_lineups(self, count):
+        return self._read_lineup_records(max(self.count_lineups() - count, 0), count) if count > 0 else []
+
+    def _read_lineup_records(self, offset, limit):
+        # (lineup_number, [(position, player), ...]) of `limit` lineups from place `offset`, in saved order
+        lineups = {}
+        rows = self.connection.execute(
+            "SELECT s.lineup_number, s.position, s.player FROM "
+            "(SELECT number FROM lineups ORDER BY number LIMIT ? OFFSET ?) AS l "
+            "JOIN lineup_slots AS s ON s.lineup_number = l.number ORDER BY s.lineup_number, s.slot",
+            (limit, offset)
+        )
+        for lineup_number, position, player in rows:
+            lineups.setdefault(lineup_number, []).append((position, player))
+        return list(lineups.items())
+
+    # Writers (one transaction each, touching only the affected rows)
+
+    def save_lineup(self, lineup, lineup_number):
+        with self.connection:
+            self._bump_version('lineups')
+            self.connection.execute("INSERT INTO lineups (number) VALUES (?)", (lineup_number,))
+            self.connection.executemany(
+                "INSERT INTO lineup_slots (lineup_number, slot, position, player) VALUES (?, ?, ?, ?)",
+                [(lineup_number, slot, position, player) for slot, (position, player) in enumerate(lineup)]
+            )
+
+    def update_injury_history(self, player_name, injury_data):
+        # New injuries go first in the player's history, as in update_injury_history
+        with self.connection:
+            self._bump_version('injury_history')
+            self.connection.execute("INSERT OR IGNORE INTO injury_players (name) VALUES (?)", (player_name,))
+            first_seq = self.connection.execute("SELECT MIN(seq) FROM injuries WHERE player = ?", (player_name,)).fetchone()[0]
+            self.connection.execute(
+                "INSERT INTO injuries (player, seq, date, injury_type, recovery_time, severity, minutes_played, recurrent) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (player_name, 0 if first_seq is None else first_seq - 1, injury_data['date'], injury_data['injury_type'],
+                 injury_data['recovery_time'], injury_data['severity'], injury_data['minutes_played'], injury_data['recurrent'])
+            )
+
+    def record_match_minutes(self, match_minutes, match_id=0):
+        # One ledger row per player of the match, as in record_match_minutes
+        with self.connection:
+            self._bump_version('played_minutes')
+            self.connection.executemany(
+                "INSERT INTO minutes_ledger (match_id, player, minutes) VALUES (?, ?, ?)",
+                [(match_id, player, minutes) for player, minutes in match_minutes.items()]
+            )
+
+    # Bulk loaders used by import_text_files
+
+    def load_players(self, players, sections=None):
+        sections = sections or {}
+        with self.connection:
+            self._bump_version('players')
+            self.connection.execute("DELETE FROM players")
+            self.connection.executemany(
+                "INSERT INTO players (name, number, age, positions, section) VALUES (?, ?, ?, ?, ?)",
+                [(name, attributes['number'], attributes['age'], ', '.join(attributes['positions']), sections.get(name))
+                 for name, attributes in players.items()]
+            )
+
+    def load_injury_history(self, injury_history):
+        with self.connection:
+            self._bump_version('injury_history')
+            self.connection.execute("DELETE FROM injuries")
+            self.connection.execute("DELETE FROM injury_players")
+            self.connection.executemany("INSERT INTO injury_players (name) VALUES (?)", [(name,) for name in injury_history])
+            self.connection.executemany(
+                "INSERT INTO injuries (player, seq, date, injury_type, recovery_time, severity, minutes_played, recurrent) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(name, seq, injury['date'], injury['injury_type'], injury['recovery_time'], injury['severity'],
+                  injury['minutes_played'], injury['recurrent'])
+                 for name, data in injury_history.items() for seq, injury in enumerate(data['injuries'])]
+            )
+
+    def load_played_minutes(self, played_minutes):
+        with self.connection:
+            self._bump_version('played_minutes')
+            self.connection.execute("DELETE FROM minutes_ledger")
+            self.connection.execute("DELETE FROM played_minutes")
+            self.connection.executemany("INSERT INTO played_minutes (player, minutes) VALUES (?, ?)", played_minutes.items())
+
+    def load_player_performance(self, player_performance):
+        with self.connection:
+            self._bump_version('player_performance')
+            self.connection.execute("DELETE FROM player_performance")
+            self.connection.executemany("INSERT INTO player_performance (player, score) VALUES (?, ?)", player_performance.items())
+
+    def load_lineups(self, lineups):
+        """Loads lineups given as (lineup_number, [(position, player), ...]) pairs."""
+        with self.connection:
+            self._bump_version('lineups')
+            self.connection.execute("DELETE FROM lineup_slots")
+            self.connection.execute("DELETE FROM lineups")
+            self.connection.executemany("INSERT INTO lineups (number) VALUES (?)", [(number,) for number, _ in lineups])
+            self.connection.executemany(
+                "INSERT INTO lineup_slots (lineup_number, slot, position, player) VALUES (?, ?, ?, ?)",
+                [(number, slot, position, player) for number, lineup in lineups for slot, (position, player) in enumerate(lineup)]
+            )
+
+    def player_sections(self):
+        """Returns {player name: section comment} as imported from players.txt (e.g. 'Goalkeepers')."""
+        return {name: section for name, section in self.connection.execute("SELECT name, section FROM players ORDER BY rowid")}
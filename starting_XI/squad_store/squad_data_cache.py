@@ -0,0 +1,171 @@
+import os
+import hashlib
+from functions.calculate_age_risk import calculate_age_risk
+
+# Datasets read from the store, with the store method that parses each one
+DATASETS = {
+    'players': 'read_players',
+    'played_minutes': 'read_played_minutes',
+    'injury_history': 'read_injury_history',
+    'player_performance': 'read_player_performance',
+    'lineups': 'read_lineups',
+}
+
+def _build_injury_index(injury_history):
+    # NumPy (used by the index) is only loaded when the index is first requested
+    from read_files.injury_index import build_injury_index
+    return build_injury_index(injury_history)
+
+def _build_injury_records(injury_history):
+    from read_files.injury_records import build_injury_records
+    return build_injury_records(injury_history)
+
+def _build_injury_risk(injury_records):
+    from functions.injuries.decayed_injury_risk import DecayedInjuryRisk
+    return DecayedInjuryRisk.from_records(*injury_records)
+
+def _build_position_index(players):
+    from read_files.position_index import build_position_index
+    return build_position_index(players)
+
+def _calculate_coefficient_risk(injury_records):
+    from functions.injuries.calculate_coeficient_risk import calculate_coefficient_risk_from_records
+    return calculate_coefficient_risk_from_records(*injury_records)
+
+# Values computed from one dataset (or from another derived value): name -> (source, function)
+DERIVED_VALUES = {
+    'injury_index': ('injury_history', _build_injury_index),
+    'injury_records': ('injury_history', _build_injury_records),
+    'risk_coefficients': ('injury_records', _calculate_coefficient_risk),
+    'injury_risk': ('injury_records', _build_injury_risk),
+    'position_index': ('players', _build_position_index),
+    'age_risks': ('players', calculate_age_risk),
+}
+
+class SquadDataCache:
+    """
+    Name:
+        SquadDataCache
+
+    Parameters:
+        store (TextSquadStore or SQLiteSquadStore): Store the data is read from.
+
+    Description:
+        Keeps the parsed squad data and the values derived from it (injury index, risk coefficients,
+        position index and age risks) in memory between lineup generations, and only reads again what changed on disk.
+
+        Every dataset remembers the fingerprint of its source files (`store.source_files`) when it was read:
+            - If the modification time and size of every file are unchanged, the cached data is returned
+              without opening any file.
+            - If they changed, the files are hashed. When the content hash is also unchanged (e.g. a file
+              that was only touched), the new times are stored and the cached data is kept.
+            - Otherwise the dataset is read again, and the values derived from it are recomputed the next
+              time they are requested.
+
+        Stores that keep a version counter per dataset (`store.dataset_version`, e.g. the SQLite store, where
+        every dataset lives in the same database file) are checked with the counter instead: a dataset is
+        read again only when its own counter changed, so a write to one table does not invalidate the others.
+
+        The returned structures are shared with the cache and must not be modified by the caller.
+
+    Example:
+        cache = SquadDataCache(store)
+        players = cache.get('players')                   # Parses players.txt
+        age_risks = cache.get('age_risks')               # Computed from the cached players
+        players = cache.get('players')                   # No file is read
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._data = {}
+        self._stats = {}
+        self._hashes = {}
+        self._versions = {}
+        self._derived = {}
+
+    def get(self, name):
+        """Returns a dataset (see `DATASETS`) or a derived value (see `DERIVED_VALUES`), reading it only if needed."""
+        if name in DERIVED_VALUES:
+            dataset, function = DERIVED_VALUES[name]
+            data = self.get(dataset)
+            version = self._derived[dataset][0] if dataset in DERIVED_VALUES else self._versions[dataset]
+            cached = self._derived.get(name)
+            if cached is None or cached[0] != version:
+                # Stores that keep the value precompiled (e.g. the snapshot's injury index) provide a reader for it
+                reader = getattr(self.store, f"read_{name}", None)
+                cached = (version, reader() if reader else function(data))
+                self._derived[name] = cached
+            return cached[1]
+
+        if name not in DATASETS:
+            raise ValueError(f"Unknown dataset: {name}")
+        self.refresh(name)
+        return self._data[name]
+
+    def version(self, dataset):
+        """
+        Returns the version of a dataset (increased every time it is read again), after checking its files.
+        Values computed from the cached data can be reused while the versions they depend on are unchanged.
+        """
+        self.get(dataset)
+        return self._versions[dataset]
+
+    def refresh(self, dataset):
+        """
+        Reads the dataset again if its source files (or its version counter in the store) changed since it was cached.
+        Returns True if the dataset was read, False if the cached data is still valid.
+        """
+        dataset_version = getattr(self.store, 'dataset_version', None)
+        if dataset_version is not None:
+            source_version = dataset_version(dataset)
+            if dataset in self._data and source_version == self._stats[dataset]:
+                return False
+            self._data[dataset] = getattr(self.store, DATASETS[dataset])()
+            self._stats[dataset] = source_version
+            self._hashes[dataset] = None
+            self._versions[dataset] = self._versions.get(dataset, 0) + 1
+            return True
+
+        files = self.store.source_files(dataset)
+        stats = [self._file_stat(path) for path in files]
+        if dataset in self._data and stats == self._stats[dataset]:
+            return False
+
+        content_hash = self._content_hash(files)
+        self._stats[dataset] = stats
+        if dataset in self._data and content_hash == self._hashes[dataset]:
+            return False
+
+        self._data[dataset] = getattr(self.store, DATASETS[dataset])()
+        self._hashes[dataset] = content_hash
+        self._versions[dataset] = self._versions.get(dataset, 0) + 1
+        return True
+
+    def invalidate(self, dataset=None):
+        """Forgets one dataset (or all of them), so the next `get` reads it again."""
+        for name in [dataset] if dataset else list(self._data):
+            self._data.pop(name, None)
+            self._stats.pop(name, None)
+            self._hashes.pop(name, None)
+
+    @staticmethod
+    def _file_stat(path):
+        # (modification time, size) of a file, or None if it does not exist
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _content_hash(files):
+        digest = hashlib.blake2b(digest_size=16)
+        for path in files:
+            try:
+                with open(path, 'rb') as file:
+                    for chunk in iter(lambda: file.read(1 << 20), b''):
+                        digest.update(chunk)
+            except FileNotFoundError:
+                digest.update(b'\0missing')
+            digest.update(b'\0' + path.encode('utf-8'))
+        return digest.hexdigest()
@@ -0,0 +1,275 @@
+import os
+import json
+import numpy as np
+from read_files.injury_index import InjuryIndex
+from read_files.injury_records import INJURY_RECORD_DTYPE, SEVERITY_CODES
+from read_files.position_index import PositionIndex
+
+# Name of the compiled snapshot inside a squad data directory
+SNAPSHOT_FILE = 'squad.snapshot'
+# First bytes of every snapshot file (format name and version)
+SNAPSHOT_MAGIC = b'SXISNAP1'
+# Arrays start at multiples of this many bytes, so every array can be viewed in place
+ALIGNMENT = 64
+
+def file_stats(paths):
+    """Returns {path: [mtime in ns, size]} for the given files ([] for files that do not exist)."""
+    stats = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stats[path] = [stat.st_mtime_ns, stat.st_size]
+        except FileNotFoundError:
+            stats[path] = []
+    return stats
+
+def _codes(values, vocabulary):
+    # Replaces every value by its position in the vocabulary, adding new values at the end
+    index = {value: i for i, value in enumerate(vocabulary)}
+    for value in values:
+        if value not in index:
+            index[value] = len(vocabulary)
+            vocabulary.append(value)
+    return np.array([index[value] for value in values], dtype=np.int32)
+
+def write_squad_snapshot(snapshot_path, players, played_minutes, injury_history, player_performance, sources=None):
+    """
+    Name:
+        write_squad_snapshot
+
+    Parameters:
+        snapshot_path (str): Path of the snapshot file to write.
+        players (dict): Players as returned by `read_players`.
+        played_minutes (dict): Played minutes as returned by `read_played_minutes`.
+        injury_history (dict): Injury history as returned by `read_injury_history`.
+        player_performance (dict): Performance scores as returned by `read_player_performance`.
+        sources (dict, optional): Stats of the source files ({path: [mtime in ns, size]}, see `file_stats`),
+                                  stored to detect when the snapshot is out of date.
+
+    Description:
+        Compiles the squad data into a single binary file with one column per attribute:
+            - every player name gets an integer id (names are stored once, as UTF-8 bytes plus offsets),
+            - numbers, ages, minutes and performance scores are numeric arrays indexed through the ids of
+              each dataset (which keep the order of the text files),
+            - positions are stored as a per-player bitmask, plus the ordered position codes of every player,
+            - injuries are stored as interval arrays (player id, injury day, recovery days, ...) with the
+              text attributes (type, severity, recurrent) encoded as codes into small vocabularies.
+
+        Layout: 8 magic bytes, the JSON header length (8 bytes, little endian), the JSON header (sources,
+        vocabularies and the dtype/shape/offset of every array), and the arrays, each aligned to 64 bytes.
+        The file is written to a temporary file and then moved over the old one.
+
+    Expected Output:
+        None: The snapshot is written to `snapshot_path`.
+
+    Raises:
+        ValueError: If an injury date is not a valid 'YYYY-MM-DD' date, or there are more than 64 positions.
+    """
+    names = list(dict.fromkeys([*players, *played_minutes, *injury_history, *player_performance]))
+    player_id = {name: i for i, name in enumerate(names)}
+    encoded_names = [name.encode('utf-8') for name in names]
+
+    position_names = list(dict.fromkeys(position for attributes in players.values() for position in attributes['positions']))
+    if len(position_names) > 64:
+        raise ValueError("A snapshot supports at most 64 different positions")
+    position_lists = [attributes['positions'] for attributes in players.values()]
+    position_codes = _codes([position for positions in position_lists for position in positions], position_names)
+    position_offsets = np.cumsum([0] + [len(positions) for positions in position_lists], dtype=np.int64)
+    position_masks = np.zeros(len(players), dtype=np.uint64)
+    np.bitwise_or.at(position_masks, np.repeat(np.arange(len(players)), np.diff(position_offsets)), np.uint64(1) << position_codes.astype(np.uint64))
+
+    injuries = [(player_id[name], injury) for name, data in injury_history.items() for injury in data['injuries']]
+    injury_types, severities, recurrent_values = [], [], []
+
+    arrays = {
+        'name_bytes': np.frombuffer(b''.join(encoded_names), dtype=np.uint8),
+        'name_offsets': np.cumsum([0] + [len(name) for name in encoded_names], dtype=np.int64),
+        'player_ids': np.array([player_id[name] for name in players], dtype=np.int32),
+        'numbers': np.array([attributes['number'] for attributes in players.values()], dtype=np.int64),
+        'ages': np.array([attributes['age'] for attributes in players.values()], dtype=np.int64),
+        'position_offsets': position_offsets,
+        'position_codes': position_codes,
+        'position_masks': position_masks,
+        'minutes_ids': np.array([player_id[name] for name in played_minutes], dtype=np.int32),
+        'minutes': np.array(list(played_minutes.values()), dtype=np.int64),
+        'performance_ids': np.array([player_id[name] for name in player_performance], dtype=np.int32),
+        'performance': np.array(list(player_performance.values()), dtype=np.float64),
+        'injury_player_order': np.array([player_id[name] for name in injury_history], dtype=np.int32),
+        'injury_players': np.array([pid for pid, _ in injuries], dtype=np.int32),
+        'injury_days': np.array([injury['date'] for _, injury in injuries], dtype='datetime64[D]').astype(np.int64),
+        'injury_recovery': np.array([injury['recovery_time'] for _, injury in injuries], dtype=np.int64),
+        'injury_minutes': np.array([injury['minutes_played'] for _, injury in injuries], dtype=np.int64),
+        'injury_types': _codes([injury['injury_type'] for _, injury in injuries], injury_types),
+        'injury_severities': _codes([injury['severity'] for _, injury in injuries], severities),
+        'injury_recurrent': _codes([injury['recurrent'] for _, injury in injuries], recurrent_values),
+    }
+
+    header = {
+        'sources': sources or {},
+        'position_names': position_names,
+        'injury_types': injury_types,
+        'severities': severities,
+        'recurrent_values': recurrent_values,
+        'arrays': {}
+    }
+    offset = 0
+    for name, array in arrays.items():
+        header['arrays'][name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+
+    temp_path = snapshot_path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(len(header_bytes).to_bytes(8, 'little'))
+        file.write(header_bytes)
+        data_start = -(-file.tell() // ALIGNMENT) * ALIGNMENT
+        for name, array in arrays.items():
+            file.seek(data_start + header['arrays'][name]['offset'])
+            file.write(array.tobytes())
+        file.truncate(data_start + offset)
+    os.replace(temp_path, snapshot_path)
+
+class SquadSnapshot:
+    """
+    Name:
+        SquadSnapshot
+
+    Parameters:
+        snapshot_path (str): Path of a snapshot written by `write_squad_snapshot`.
+
+    Description:
+        Opens a squad snapshot with a single memory map. The header is decoded and every column is a
+        read-only NumPy view into the map (`self.arrays`), so loading does no per-line parsing and its cost
+        does not grow with the history. The methods rebuild the same dictionaries as the `read_files`
+        functions, `injury_index` and `injury_records` build an `InjuryIndex` and the structured injury
+        records straight from the interval arrays, and `position_index` builds a `PositionIndex` from the
+        stored position bitmasks.
+
+    Raises:
+        ValueError: If the file is not a squad snapshot.
+    """
+
+    def __init__(self, snapshot_path):
+        self.snapshot_path = snapshot_path
+        buffer = np.memmap(snapshot_path, dtype=np.uint8, mode='r')
+        if bytes(buffer[:8]) != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a squad snapshot: {snapshot_path}")
+        header_length = int.from_bytes(bytes(buffer[8:16]), 'little')
+        self.header = json.loads(bytes(buffer[16:16 + header_length]).decode('utf-8'))
+        data_start = -(-(16 + header_length) // ALIGNMENT) * ALIGNMENT
+
+        self.arrays = {}
+        for name, spec in self.header['arrays'].items():
+            dtype = np.dtype(spec['dtype'])
+            start = data_start + spec['offset']
+            count = int(np.prod(spec['shape']))
+            self.arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec['shape'])
+
+        offsets = self.arrays['name_offsets'].tolist()
+        name_bytes = self.arrays['name_bytes'].tobytes()
+        self.player_names = [name_bytes[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+    @property
+    def sources(self):
+        """Stats of the source files when the snapshot was written ({path: [mtime in ns, size]})."""
+        return self.header['sources']
+
+    def _names(self, ids):
+        return [self.player_names[i] for i in ids.tolist()]
+
+    def read_players(self):
+        position_names = self.header['position_names']
+        codes = self.arrays['position_codes'].tolist()
+        offsets = self.arrays['position_offsets'].tolist()
+        return {
+            name: {'number': number, 'age': age, 'positions': [position_names[code] for code in codes[offsets[i]:offsets[i + 1]]]}
+            for i, (name, number, age) in enumerate(zip(self._names(self.arrays['player_ids']), self.arrays['numbers'].tolist(), self.arrays['ages'].tolist()))
+        }
+
+    def read_played_minutes(self):
+        return dict(zip(self._names(self.arrays['minutes_ids']), self.arrays['minutes'].tolist()))
+
+    def read_player_performance(self):
+        return dict(zip(self._names(self.arrays['performance_ids']), self.arrays['performance'].tolist()))
+
+    def read_injury_history(self):
+        injury_history = {name: {'injuries': []} for name in self._names(self.arrays['injury_player_order'])}
+        injury_types = self.header['injury_types']
+        severities = self.header['severities']
+        recurrent_values = self.header['recurrent_values']
+        columns = zip(
+            self._names(self.arrays['injury_players']),
+            np.datetime_as_string(self.arrays['injury_days'].astype('datetime64[D]')).tolist(),
+            self.arrays['injury_types'].tolist(),
+            self.arrays['injury_recovery'].tolist(),
+            self.arrays['injury_severities'].tolist(),
+            self.arrays['injury_minutes'].tolist(),
+            self.arrays['injury_recurrent'].tolist()
+        )
+        for name, date, injury_type, recovery_time, severity, minutes_played, recurrent in columns:
+            injury_history[name]['injuries'].append({
+                'date': date,
+                'injury_type': injury_types[injury_type],
+                'recovery_time': recovery_time,
+                'severity': severities[severity],
+                'minutes_played': minutes_played,
+                'recurrent': recurrent_values[recurrent]
+            })
+        return injury_history
+
+    def injury_index(self):
+        """Returns an `InjuryIndex` built from the interval arrays (no date parsing)."""
+        starts = self.arrays['injury_days'].astype('datetime64[D]')
+        ends = starts + self.arrays['injury_recovery'].astype('timedelta64[D]')
+        return InjuryIndex(self.player_names, self.arrays['injury_players'], starts, ends)
+
+    def injury_records(self):
+        """Returns (player names, injury records) as `build_injury_records` does, from the injury arrays."""
+        player_order = np.array(self.arrays['injury_player_order'])
+        record_player = np.zeros(len(self.player_names), dtype=np.int32)
+        record_player[player_order] = np.arange(len(player_order))
+        severity_codes = np.array([SEVERITY_CODES.get(severity, 0) for severity in self.header['severities']] or [0], dtype=np.int8)
+        recurrent_flags = np.array([value == "Yes" for value in self.header['recurrent_values']] or [False])
+
+        records = np.empty(len(self.arrays['injury_players']), dtype=INJURY_RECORD_DTYPE)
+        records['player_id'] = record_player[self.arrays['injury_players']]
+        records['date'] = self.arrays['injury_days'].astype('datetime64[D]')
+        records['recovery_time'] = self.arrays['injury_recovery']
+        records['severity'] = severity_codes[self.arrays['injury_severities']]
+        records['minutes_played'] = self.arrays['injury_minutes']
+        records['recurrent'] = recurrent_flags[self.arrays['injury_recurrent']]
+        return self._names(player_order), records
+
+    def position_masks(self):
+        """Returns (player names, position bitmask of every player, position names), in the order of `read_players`."""
+        return self._names(self.arrays['player_ids']), np.array(self.arrays['position_masks']), list(self.header['position_names'])
+
+    def position_index(self):
+        """Returns a `PositionIndex` built from the stored position bitmasks (no position list is read)."""
+        player_names, masks, position_names = self.position_masks()
+        return PositionIndex(player_names, position_names, [int(mask) for mask in masks.tolist()])
+
+def load_squad_snapshot(snapshot_path, source_paths):
+    """
+    Name:
+        load_squad_snapshot
+
+    Parameters:
+        snapshot_path (str): Path of the snapshot file.
+        source_paths (list): Text files the snapshot was compiled from.
+
+    Description:
+        Opens the snapshot if it exists and the modification time and size of every source file are the
+        ones recorded when it was written.
+
+    Expected Output:
+        SquadSnapshot or None: The snapshot, or None if it is missing, invalid or out of date.
+    """
+    try:
+        snapshot = SquadSnapshot(snapshot_path)
+    except (FileNotFoundError, ValueError):
+        return None
+    if snapshot.sources != file_stats(source_paths):
+        return None
+    return snapshot
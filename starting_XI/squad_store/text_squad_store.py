@@ -0,0 +1,90 @@
+import os
+from read_files.read_players import read_players
+from read_files.read_played_minutes import read_played_minutes, minutes_ledger_path
+from read_files.read_injury_history import read_injury_history, injury_journal_path
+from read_files.read_player_performance import read_player_performance
+from read_files.read_lineups import read_lineups
+from read_files.lineup_archive import LineupArchive
+from functions.save_lineup import save_lineup
+from functions.injuries.update_injury_history import update_injury_history
+from functions.played_minutes.record_match_minutes import record_match_minutes
+
+# Names of the data files inside a squad data directory
+PLAYERS_FILE = 'players.txt'
+PLAYED_MINUTES_FILE = 'played_minutes.txt'
+INJURY_HISTORY_FILE = 'injury_history.txt'
+PLAYER_PERFORMANCE_FILE = 'player_performance.txt'
+LINEUPS_FILE = 'lineups.txt'
+
+class TextSquadStore:
+    """
+    Name:
+        TextSquadStore
+
+    Parameters:
+        data_dir (str): Directory containing the squad text files (players.txt, played_minutes.txt,
+                        injury_history.txt, player_performance.txt and lineups.txt).
+
+    Description:
+        Squad data store backed by the text files under `data/`. Every method delegates to the existing
+        reader or writer function, so the file formats and behaviour are unchanged. It has the same
+        methods as `SQLiteSquadStore`, which lets `main.py` switch backends with one setting.
+    """
+
+    backend = "text"
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.players_file = os.path.join(data_dir, PLAYERS_FILE)
+        self.played_minutes_file = os.path.join(data_dir, PLAYED_MINUTES_FILE)
+        self.injury_history_file = os.path.join(data_dir, INJURY_HISTORY_FILE)
+        self.player_performance_file = os.path.join(data_dir, PLAYER_PERFORMANCE_FILE)
+        self.lineups_file = os.path.join(data_dir, LINEUPS_FILE)
+
+    def read_players(self):
+        return read_players(self.players_file)
+
+    def read_played_minutes(self):
+        return read_played_minutes(self.played_minutes_file)
+
+    def read_injury_history(self):
+        return read_injury_history(self.injury_history_file)
+
+    def read_player_performance(self):
+        return read_player_performance(self.player_performance_file)
+
+    def read_lineups(self):
+        return read_lineups(self.lineups_file)
+
+    def count_lineups(self):
+        return LineupArchive(self.lineups_file).count()
+
+    def read_lineup(self, number):
+        return LineupArchive(self.lineups_file).get(number)
+
+    def read_last_lineups(self, count):
+        return LineupArchive(self.lineups_file).last(count)
+
+    def save_lineup(self, lineup, lineup_number):
+        save_lineup(self.lineups_file, lineup, lineup_number)
+
+    def update_injury_history(self, player_name, injury_data):
+        update_injury_history(self.injury_history_file, player_name, injury_data)
+
+    def record_match_minutes(self, match_minutes, match_id=0):
+        record_match_minutes(self.played_minutes_file, match_minutes, match_id)
+
+    def describe(self):
+        """Returns a short description of where the data is stored (for messages)."""
+        return self.data_dir
+
+    def source_files(self, dataset):
+        """
+        Returns the files a dataset is read from ('players', 'played_minutes', 'injury_history',
+        'player_performance' or 'lineups'), including the minutes ledger and the injury journal.
+        """
+        if dataset == 'played_minutes':
+            return [self.played_minutes_file, minutes_ledger_path(self.played_minutes_file)]
+        if dataset == 'injury_history':
+            return [self.injury_history_file, injury_journal_path(self.injury_history_file)]
+        return [getattr(self, f"{dataset}_file")]
@@ -0,0 +1,39 @@
+# Shared helpers of the solver tests: random cost matrices and brute-force reference solutions
+from itertools import permutations
+import numpy as np
+from functions.hungarian_algorithm import hungarian_algorithm
+
+# Seeds of the randomized tests
+SEEDS = range(40)
+
+def random_costs(rng, shape, forbidden=0.3):
+    # Small integer costs (many ties) with a share of forbidden (np.inf) cells
+    costs = rng.integers(0, 10, size=shape).astype(float)
+    costs[rng.random(shape) < forbidden] = np.inf
+    return costs
+
+def brute_force_assignments(cost_matrix):
+    # Every assignment of the rows to distinct columns that avoids the forbidden cells, as (cost, columns)
+    num_rows, num_cols = cost_matrix.shape
+    assignments = []
+    for cols in permutations(range(num_cols), num_rows):
+        total = cost_matrix[np.arange(num_rows), cols].sum()
+        if np.isfinite(total):
+            assignments.append((float(total), cols))
+    return assignments
+
+def brute_force_cost(cost_matrix):
+    # Optimal total cost (np.inf if no assignment avoids the forbidden cells)
+    if cost_matrix.shape[0] > cost_matrix.shape[1]:
+        cost_matrix = cost_matrix.T
+    return min((total for total, _ in brute_force_assignments(cost_matrix)), default=np.inf)
+
+def solve_total(cost_matrix):
+    # Total cost of `hungarian_algorithm`, after checking the assignment is complete and valid
+    row_ind, col_ind = hungarian_algorithm(cost_matrix)
+    assert len(row_ind) == min(cost_matrix.shape)
+    assert len(set(row_ind)) == len(row_ind) and len(set(col_ind)) == len(col_ind)
+    assert list(row_ind) == sorted(row_ind)
+    total = cost_matrix[row_ind, col_ind].sum()
+    assert np.isfinite(total)
+    return float(total)
@@ -0,0 +1,65 @@
+import pytest
+
+# Small squad covering every 4-3-3 position twice: name -> (number, age, positions)
+SQUAD = {
+    "Goalkeeper A": (1, 30, ["Goalkeeper"]),
+    "Goalkeeper B": (13, 24, ["Goalkeeper"]),
+    "Centre-back A": (2, 27, ["Centre-back"]),
+    "Centre-back B": (4, 25, ["Centre-back", "Right-back"]),
+    "Centre-back C": (5, 31, ["Centre-back"]),
+    "Right-back A": (23, 28, ["Right-back"]),
+    "Left-back A": (3, 22, ["Left-back"]),
+    "Left-back B": (24, 29, ["Left-back", "Centre-back"]),
+    "Pivot A": (21, 26, ["Pivot", "Midfielder"]),
+    "Pivot B": (17, 21, ["Pivot"]),
+    "Midfielder A": (8, 23, ["Midfielder", "Attacking-midfielder"]),
+    "Midfielder B": (6, 20, ["Midfielder"]),
+    "Attacking-midfielder A": (20, 27, ["Attacking-midfielder", "Left-winger"]),
+    "Left-winger A": (11, 28, ["Left-winger"]),
+    "Right-winger A": (19, 18, ["Right-winger"]),
+    "Right-winger B": (7, 25, ["Right-winger", "Striker"]),
+    "Striker A": (9, 36, ["Striker"]),
+    "Striker B": (18, 20, ["Striker", "Left-winger"]),
+}
+
+INJURY_HISTORY = {
+    "Goalkeeper A": [
+        "2024-09-23, Knee Ligament, 214, Severe, 1800, No",
+        "2023-11-05, Back Injury, 86, Moderate, 2500, No",
+    ],
+    "Centre-back B": ["2024-10-01, Hamstring, 30, Moderate, 900, Yes"],
+    "Midfielder A": [
+        "2025-01-10, Ankle Sprain, 12, Mild, 400, No",
+        "2022-08-20, Groin Strain, 25, Mild, 3000, No",
+    ],
+    "Striker A": [],
+}
+
+LINEUP = [
+    ("Goalkeeper", "Goalkeeper A"), ("Centre-back", "Centre-back A"), ("Centre-back", "Centre-back C"),
+    ("Right-back", "Right-back A"), ("Left-back", "Left-back A"), ("Midfielder", "Midfielder B"),
+    ("Pivot", "Pivot B"), ("Attacking-midfielder", "Midfielder A"), ("Left-winger", "Left-winger A"),
+    ("Right-winger", "Right-winger A"), ("Striker", "Striker A"),
+]
+
+def write_squad_files(data_dir, lineups=2):
+    """Writes the five text files of the test squad (in the formats of `data/`) into `data_dir`."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    players = ["# Players"] + [f"{name}, {number}, {age}, [{', '.join(positions)}]" for name, (number, age, positions) in SQUAD.items()]
+    (data_dir / "players.txt").write_text("\n".join(players) + "\n", encoding="utf-8")
+    (data_dir / "played_minutes.txt").write_text("".join(f"{name},{i * 97 % 1500}\n" for i, name in enumerate(SQUAD)), encoding="utf-8")
+    (data_dir / "player_performance.txt").write_text("".join(f"{name}, {5 + i % 5}\n" for i, name in enumerate(SQUAD)), encoding="utf-8")
+    blocks = []
+    for name, injuries in INJURY_HISTORY.items():
+        blocks.append("\n".join([f"# Player: {name}", "# Injury History (Last 5 Years)"] + (injuries or ["No recorded injuries"])))
+    (data_dir / "injury_history.txt").write_text("\n\n".join(blocks) + "\n", encoding="utf-8")
+    (data_dir / "lineups.txt").write_text(
+        "".join(f"Lineup {number}:\n" + "".join(f"{position}: {player}\n" for position, player in LINEUP) + "\n" for number in range(1, lineups + 1)),
+        encoding="utf-8"
+    )
+    return data_dir
+
+@pytest.fixture
+def squad_dir(tmp_path):
+    """A squad data directory with the test squad, in a temporary directory."""
+    return write_squad_files(tmp_path / "data")
@@ -0,0 +1,80 @@
+import random
+import pytest
+from conftest import LINEUP, SQUAD, write_squad_files
+from functions.appearance_stats import AppearanceStats
+from squad_store.text_squad_store import TextSquadStore
+
+def random_lineups(seed, count):
+    # Lineups drawn from the test squad, with repeated players so counts go up and down
+    rng = random.Random(seed)
+    names = list(SQUAD)
+    return [[(position, rng.choice(names[:12])) for position, _ in LINEUP] for _ in range(count)]
+
+def brute_force_matrix(lineups):
+    matrix = {}
+    for lineup in lineups:
+        for position, player in lineup:
+            positions = matrix.setdefault(player, {})
+            positions[position] = positions.get(position, 0) + 1
+    return matrix
+
+def assert_matches(stats, lineups, windows):
+    for window in (None,) + tuple(windows):
+        recent = lineups if window is None else lineups[-window:]
+        matrix = brute_force_matrix(recent)
+        assert stats.start_matrix(window) == matrix
+        assert stats.start_counts(window) == {player: sum(positions.values()) for player, positions in matrix.items()}
+        for player in SQUAD:
+            assert stats.starts(player, window) == sum(matrix.get(player, {}).values())
+            assert stats.position_starts(player, window) == matrix.get(player, {})
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rolling_windows_match_a_count_over_the_last_lineups(seed):
+    lineups = random_lineups(seed, 30)
+    stats = AppearanceStats(windows=(3, 5, 10))
+    for number, lineup in enumerate(lineups, start=1):
+        stats.add_lineup(lineup)
+        assert_matches(stats, lineups[:number], (3, 5, 10))
+    assert stats.lineup_count == 30
+
+    rebuilt = AppearanceStats.from_lineups(list(enumerate(lineups, start=1)), windows=(3, 5, 10))
+    assert_matches(rebuilt, lineups, (3, 5, 10))
+
+def test_rotation_penalties_weight_the_starts_of_the_window():
+    lineups = random_lineups(7, 8)
+    stats = AppearanceStats.from_lineups(list(enumerate(lineups, start=1)))
+    starts = stats.start_counts(5)
+
+    assert stats.rotation_penalties(5, 2.5) == {player: 2.5 * count for player, count in starts.items()}
+
+def test_untracked_window_is_an_error():
+    stats = AppearanceStats(windows=(5,))
+    with pytest.raises(ValueError):
+        stats.starts("Striker A", window=10)
+    with pytest.raises(ValueError):
+        stats.rotation_penalties(3, 1.0)
+
+def test_sync_reads_only_the_new_lineups(squad_dir):
+    store = TextSquadStore(str(squad_dir))
+    stats = AppearanceStats()
+    assert stats.sync(store) == 2
+    assert stats.sync(store) == 0
+
+    new_lineups = random_lineups(3, 4)
+    for number, lineup in enumerate(new_lineups, start=3):
+        store.save_lineup(lineup, number)
+    assert stats.sync(store) == 4
+    assert_matches(stats, [LINEUP, LINEUP] + new_lineups, (5, 10))
+
+def test_sync_rebuilds_when_the_archive_has_fewer_lineups(squad_dir, tmp_path):
+    store = TextSquadStore(str(squad_dir))
+    for number, lineup in enumerate(random_lineups(4, 6), start=3):
+        store.save_lineup(lineup, number)
+    stats = AppearanceStats()
+    assert stats.sync(store) == 8
+
+    # A replaced archive with fewer lineups
+    smaller = TextSquadStore(str(write_squad_files(tmp_path / "smaller", lineups=3)))
+    assert stats.sync(smaller) == 3
+    assert stats.lineup_count == 3
+    assert_matches(stats, [LINEUP] * 3, (5, 10))
@@ -0,0 +1,58 @@
+import random
+import pytest
+from functions.injuries.calculate_coeficient_risk import calculate_coefficient_risk, calculate_coefficient_risk_from_records
+from read_files.injury_records import build_injury_records
+
+def original_coefficient_risk(injury_history):
+    # The per-player loop the grouped version replaced
+    severity_weights = {"Mild": 1, "Moderate": 2, "Severe": 3}
+    risk_coefficients = {}
+    for player, data in injury_history.items():
+        injuries = data['injuries']
+        total_severity_weight = sum(severity_weights.get(injury['severity'], 0) for injury in injuries)
+        total_recovery_time = sum(injury['recovery_time'] for injury in injuries)
+        recurrent_injuries = sum(1 for injury in injuries if injury['recurrent'] == "Yes")
+        average_recovery_time = total_recovery_time / len(injuries) if injuries else 0
+        risk_coefficient = (len(injuries) * total_severity_weight) + (recurrent_injuries * 2) + (average_recovery_time / 10)
+        risk_coefficients[player] = round(risk_coefficient, 2)
+    return risk_coefficients
+
+def random_injury_history(seed, num_players=60):
+    rng = random.Random(seed)
+    injury_history = {}
+    for player in range(num_players):
+        injuries = []
+        for _ in range(rng.choice([0, 0, 1, 2, 3, 7, 20])):
+            injuries.append({
+                'date': f"20{rng.randint(15, 25)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                'injury_type': rng.choice(["Hamstring", "Knee Ligament", "Ankle Sprain"]),
+                'recovery_time': rng.randint(0, 400),
+                'severity': rng.choice(["Mild", "Moderate", "Severe", "Unknown"]),
+                'minutes_played': rng.randint(0, 4000),
+                'recurrent': rng.choice(["Yes", "No"]),
+            })
+        injury_history[f"Player {player}"] = {'injuries': injuries}
+    return injury_history
+
+@pytest.mark.parametrize("seed", range(20))
+def test_grouped_coefficients_match_the_per_player_loop_exactly(seed):
+    injury_history = random_injury_history(seed)
+    expected = original_coefficient_risk(injury_history)
+
+    assert calculate_coefficient_risk_from_records(*build_injury_records(injury_history)) == expected
+    assert calculate_coefficient_risk(injury_history) == expected
+    assert list(calculate_coefficient_risk(injury_history)) == list(injury_history)
+
+def test_players_without_injuries_get_zero():
+    assert calculate_coefficient_risk({"Player A": {'injuries': []}}) == {"Player A": 0}
+    assert calculate_coefficient_risk({}) == {}
+
+def test_coefficients_from_the_test_squad_files(squad_dir):
+    from read_files.read_injury_history import read_injury_history
+    injury_history = read_injury_history(str(squad_dir / "injury_history.txt"))
+    coefficients = calculate_coefficient_risk(injury_history)
+
+    assert coefficients == original_coefficient_risk(injury_history)
+    # Severe + Moderate: 2 injuries * (3 + 2) weight + average recovery (214 + 86) / 2 / 10
+    assert coefficients["Goalkeeper A"] == 25.0
+    assert coefficients["Striker A"] == 0
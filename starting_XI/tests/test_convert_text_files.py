@@ -0,0 +1,51 @@
+from squad_store.convert_text_files import export_text_files, import_text_files
+from squad_store.text_squad_store import TextSquadStore
+
+INJURY = {'date': "2025-02-01", 'injury_type': "Calf Strain", 'recovery_time': 14, 'severity': "Mild", 'minutes_played': 700, 'recurrent': "No"}
+
+def read_all(store):
+    return {
+        'players': store.read_players(),
+        'played_minutes': store.read_played_minutes(),
+        'injury_history': store.read_injury_history(),
+        'player_performance': store.read_player_performance(),
+        'lineups': store.read_lineups(),
+    }
+
+def test_import_reads_the_same_data_as_the_text_files(squad_dir, tmp_path):
+    store = import_text_files(str(squad_dir), str(tmp_path / "squad.db"))
+    assert read_all(store) == read_all(TextSquadStore(str(squad_dir)))
+    assert store.count_lineups() == 2
+
+def test_export_round_trip_keeps_data_and_player_sections(squad_dir, tmp_path):
+    store = import_text_files(str(squad_dir), str(tmp_path / "squad.db"))
+    export_dir = tmp_path / "export"
+    export_text_files(store, str(export_dir))
+
+    assert read_all(TextSquadStore(str(export_dir))) == read_all(TextSquadStore(str(squad_dir)))
+    assert (export_dir / "players.txt").read_text(encoding="utf-8") == (squad_dir / "players.txt").read_text(encoding="utf-8")
+
+def test_export_includes_the_writes_made_in_the_database(squad_dir, tmp_path):
+    store = import_text_files(str(squad_dir), str(tmp_path / "squad.db"))
+    lineup = store.read_lineup(1)[1]
+    store.save_lineup(lineup, 3)
+    store.update_injury_history("Striker A", INJURY)
+    store.record_match_minutes({"Striker A": 90, "Pivot B": 45}, 3)
+
+    export_dir = tmp_path / "export"
+    export_text_files(store, str(export_dir))
+    exported = TextSquadStore(str(export_dir))
+    assert read_all(exported) == read_all(store)
+    assert exported.read_injury_history()["Striker A"]['injuries'] == [INJURY]
+    assert exported.read_last_lineups(1) == [(3, lineup)]
+
+def test_export_marks_an_existing_journal_and_ledger_as_included(squad_dir, tmp_path):
+    # Exporting over a text data directory must not add its pending journal or ledger entries a second time
+    text_store = TextSquadStore(str(squad_dir))
+    text_store.update_injury_history("Striker A", INJURY)
+    text_store.record_match_minutes({"Striker A": 90}, 3)
+    store = import_text_files(str(squad_dir), str(tmp_path / "squad.db"))
+    expected = read_all(store)
+
+    export_text_files(store, str(squad_dir))
+    assert read_all(TextSquadStore(str(squad_dir))) == expected
@@ -0,0 +1,97 @@
+import random
+from datetime import date, timedelta
+import pytest
+from functions.injuries.calculate_coeficient_risk import calculate_coefficient_risk
+from functions.injuries.decayed_injury_risk import DecayedInjuryRisk
+from read_files.injury_records import build_injury_records
+
+SEVERITY_WEIGHTS = {"Mild": 1, "Moderate": 2, "Severe": 3}
+
+def recomputed_coefficient(injuries, current_date, half_life_days):
+    # Full recompute from the injuries on or before the date, each weighted by its own age
+    day = date.fromisoformat(current_date)
+    injuries = [injury for injury in injuries if date.fromisoformat(injury['date']) <= day]
+    if not injuries:
+        return 0.0
+    weights = [0.5 ** ((day - date.fromisoformat(injury['date'])).days / half_life_days) for injury in injuries]
+    severity_weight = sum(weight * SEVERITY_WEIGHTS.get(injury['severity'], 0) for weight, injury in zip(weights, injuries))
+    recurrent_injuries = sum(weight for weight, injury in zip(weights, injuries) if injury['recurrent'] == "Yes")
+    average_recovery_time = sum(weight * injury['recovery_time'] for weight, injury in zip(weights, injuries)) / sum(weights)
+    return len(injuries) * severity_weight + recurrent_injuries * 2 + average_recovery_time / 10
+
+def random_injury_history(seed, num_players=25):
+    rng = random.Random(seed)
+    start = date(2018, 1, 1)
+    injury_history = {}
+    for player in range(num_players):
+        injuries = [{
+            'date': (start + timedelta(days=rng.randint(0, 2600))).isoformat(),
+            'injury_type': "Hamstring",
+            'recovery_time': rng.randint(1, 300),
+            'severity': rng.choice(["Mild", "Moderate", "Severe", "Unknown"]),
+            'minutes_played': rng.randint(0, 4000),
+            'recurrent': rng.choice(["Yes", "No"]),
+        } for _ in range(rng.choice([0, 1, 2, 5, 12]))]
+        # Newest first, as in the injury history files
+        injuries.sort(key=lambda injury: injury['date'], reverse=True)
+        injury_history[f"Player {player}"] = {'injuries': injuries}
+    return injury_history
+
+def query_dates(seed):
+    rng = random.Random(seed)
+    return [(date(2017, 6, 1) + timedelta(days=rng.randint(0, 3300))).isoformat() for _ in range(15)]
+
+def assert_close(coefficients, expected):
+    # Both sides are rounded to 2 decimals, so they can only differ by one unit of the last digit
+    assert coefficients.keys() == expected.keys()
+    for player in expected:
+        assert abs(coefficients[player] - round(expected[player], 2)) <= 0.01 + 1e-9, player
+
+@pytest.mark.parametrize("seed", range(8))
+def test_coefficients_match_a_full_recompute(seed):
+    injury_history = random_injury_history(seed)
+    risk = DecayedInjuryRisk.from_injury_history(injury_history, half_life_days=200)
+    for current_date in query_dates(seed):
+        expected = {player: recomputed_coefficient(data['injuries'], current_date, 200) for player, data in injury_history.items()}
+        assert_close(risk.coefficients(current_date), expected)
+
+@pytest.mark.parametrize("seed", range(8))
+def test_without_decay_the_coefficients_are_the_original_ones(seed):
+    injury_history = random_injury_history(seed)
+    risk = DecayedInjuryRisk.from_injury_history(injury_history, half_life_days=None)
+    assert risk.coefficients("2030-01-01") == calculate_coefficient_risk(injury_history)
+
+def test_one_injury_halves_after_one_half_life():
+    risk = DecayedInjuryRisk(half_life_days=365)
+    risk.add_injury("Player A", {'date': "2024-01-01", 'injury_type': "Knee", 'recovery_time': 30, 'severity': "Severe", 'minutes_played': 0, 'recurrent': "No"})
+
+    assert risk.coefficient("Player A", "2023-12-31") == 0.0
+    # 1 injury * weight 3 + average recovery 30 / 10
+    assert risk.coefficient("Player A", "2024-01-01") == 6.0
+    assert risk.coefficient("Player A", "2024-12-31") == 4.5
+    assert risk.coefficient("Unknown Player", "2024-12-31") == 0.0
+
+@pytest.mark.parametrize("seed", range(4))
+def test_injuries_added_in_any_order_match_a_rebuild(seed):
+    injury_history = random_injury_history(seed)
+    risk = DecayedInjuryRisk.from_injury_history({player: {'injuries': []} for player in injury_history}, half_life_days=200)
+    additions = [(player, injury) for player, data in injury_history.items() for injury in data['injuries']]
+    random.Random(seed).shuffle(additions)
+    for player, injury in additions:
+        risk.add_injury(player, injury)
+
+    rebuilt = DecayedInjuryRisk.from_injury_history(injury_history, half_life_days=200)
+    for current_date in query_dates(seed):
+        assert_close(risk.coefficients(current_date), rebuilt.coefficients(current_date))
+        expected = {player: recomputed_coefficient(data['injuries'], current_date, 200) for player, data in injury_history.items()}
+        assert_close(risk.coefficients(current_date), expected)
+
+@pytest.mark.parametrize("half_life_days", [365, None])
+def test_records_build_the_same_model_as_the_history(half_life_days):
+    injury_history = random_injury_history(99)
+    from_history = DecayedInjuryRisk.from_injury_history(injury_history, half_life_days)
+    from_records = DecayedInjuryRisk.from_records(*build_injury_records(injury_history), half_life_days=half_life_days)
+
+    for current_date in query_dates(99) + ["2030-01-01"]:
+        assert_close(from_records.coefficients(current_date), from_history.coefficients(current_date))
+    assert from_records.injuries == {player: sorted(injuries) for player, injuries in from_history.injuries.items()}
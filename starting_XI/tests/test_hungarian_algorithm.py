@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from functions.hungarian_algorithm import hungarian_algorithm
+from assignment_cases import SEEDS, brute_force_cost, random_costs, solve_total
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hungarian_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    shape = tuple(rng.integers(1, 7, size=2))
+    cost_matrix = random_costs(rng, shape)
+    expected = brute_force_cost(cost_matrix)
+    if np.isinf(expected):
+        with pytest.raises(ValueError):
+            hungarian_algorithm(cost_matrix)
+    else:
+        assert solve_total(cost_matrix) == expected
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hungarian_matches_scipy(seed):
+    linear_sum_assignment = pytest.importorskip("scipy.optimize").linear_sum_assignment
+    rng = np.random.default_rng(seed)
+    shape = tuple(rng.integers(5, 40, size=2))
+    cost_matrix = random_costs(rng, shape, forbidden=0.5) + rng.random(shape)
+    try:
+        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    except ValueError:
+        with pytest.raises(ValueError):
+            hungarian_algorithm(cost_matrix)
+        return
+    assert solve_total(cost_matrix) == pytest.approx(cost_matrix[row_ind, col_ind].sum())
+
+def test_hungarian_rejects_invalid_entries():
+    with pytest.raises(ValueError):
+        hungarian_algorithm(np.array([[1.0, np.nan], [2.0, 3.0]]))
+    with pytest.raises(ValueError):
+        hungarian_algorithm(np.array([[1.0, -np.inf], [2.0, 3.0]]))
@@ -0,0 +1,96 @@
+import os
+import pytest
+from conftest import LINEUP
+from read_files.lineup_archive import OFFSET_SIZE, LineupArchive, format_lineup
+
+OTHER_LINEUP = [(position, player.replace(" A", " B")) for position, player in LINEUP]
+
+def set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_read_only_calls_do_not_create_the_index(squad_dir):
+    archive = LineupArchive(str(squad_dir / "lineups.txt"))
+
+    assert archive.count() == 2
+    assert archive.get(2) == (2, LINEUP)
+    assert archive.last(5) == [(1, LINEUP), (2, LINEUP)]
+    assert archive.last(0) == []
+    assert not (squad_dir / "lineups.idx").exists()
+    with pytest.raises(IndexError):
+        archive.get(3)
+
+def test_append_writes_the_record_and_its_offset(squad_dir):
+    archive = LineupArchive(str(squad_dir / "lineups.txt"))
+    archive.append(OTHER_LINEUP, 3)
+
+    assert (squad_dir / "lineups.idx").stat().st_size == 3 * OFFSET_SIZE
+    assert (squad_dir / "lineups.txt").read_text(encoding="utf-8").endswith(format_lineup(OTHER_LINEUP, 3))
+    assert LineupArchive(str(squad_dir / "lineups.txt")).last(2) == [(2, LINEUP), (3, OTHER_LINEUP)]
+
+def test_missing_text_file_has_no_lineups(tmp_path):
+    archive = LineupArchive(str(tmp_path / "lineups.txt"))
+    assert archive.count() == 0
+    archive.append(LINEUP, 1)
+    assert archive.get(1) == (1, LINEUP)
+
+def test_index_older_than_the_text_file_is_rebuilt(squad_dir):
+    text_path = squad_dir / "lineups.txt"
+    archive = LineupArchive(str(text_path))
+    assert archive.reindex() == 2
+    index = (squad_dir / "lineups.idx").read_bytes()
+    size = text_path.stat().st_size
+
+    # Rewritten by hand: the first record is split in two, with the same file size and with the old offsets
+    # still at the start of records, so only the modification time tells the index is stale
+    first = format_lineup([("Goalkeeper", "Goalkeeper A")], 1)
+    padding = len(format_lineup(LINEUP, 1)) - len(first) - len(format_lineup([("Goalkeeper", "")], 5))
+    text_path.write_text(first + format_lineup([("Goalkeeper", "G" * padding)], 5) + format_lineup(LINEUP, 2), encoding="utf-8")
+    assert text_path.stat().st_size == size
+    set_mtime(squad_dir / "lineups.idx", text_path.stat().st_mtime_ns - 1_000_000_000)
+    assert archive.count() == 3
+    assert archive.get(2) == (5, [("Goalkeeper", "G" * padding)])
+    # Read-only calls leave the index file as it was
+    assert (squad_dir / "lineups.idx").read_bytes() == index
+
+    archive.append(OTHER_LINEUP, 6)
+    assert (squad_dir / "lineups.idx").stat().st_size == 4 * OFFSET_SIZE
+    assert LineupArchive(str(text_path)).last(2) == [(2, LINEUP), (6, OTHER_LINEUP)]
+
+def test_edited_file_is_indexed_again(squad_dir):
+    text_path = squad_dir / "lineups.txt"
+    archive = LineupArchive(str(text_path))
+    archive.append(OTHER_LINEUP, 3)
+
+    # The first record removed: the last indexed offset no longer starts a record
+    records = text_path.read_text(encoding="utf-8").split("\n\n")
+    text_path.write_text("\n\n".join(records[1:]), encoding="utf-8")
+    set_mtime(squad_dir / "lineups.idx", text_path.stat().st_mtime_ns + 1_000_000_000)
+    assert archive.count() == 2
+    assert archive.last(2) == [(2, LINEUP), (3, OTHER_LINEUP)]
+    assert archive.reindex() == 2
+    assert (squad_dir / "lineups.idx").stat().st_size == 2 * OFFSET_SIZE
+
+def test_records_after_the_last_indexed_one_are_added(squad_dir):
+    text_path = squad_dir / "lineups.txt"
+    archive = LineupArchive(str(text_path))
+    archive.reindex()
+
+    # An append interrupted after the record was written, before its offset was added to the index
+    with open(text_path, 'a', encoding='utf-8') as file:
+        file.write(format_lineup(OTHER_LINEUP, 3))
+    set_mtime(squad_dir / "lineups.idx", text_path.stat().st_mtime_ns + 1_000_000_000)
+    assert archive.count() == 3
+    assert archive.get(3) == (3, OTHER_LINEUP)
+    assert (squad_dir / "lineups.idx").stat().st_size == 2 * OFFSET_SIZE
+
+    archive.append(LINEUP, 4)
+    assert (squad_dir / "lineups.idx").stat().st_size == 4 * OFFSET_SIZE
+    assert LineupArchive(str(text_path)).last(2) == [(3, OTHER_LINEUP), (4, LINEUP)]
+
+def test_append_after_a_file_without_a_final_newline(squad_dir):
+    text_path = squad_dir / "lineups.txt"
+    text_path.write_text(text_path.read_text(encoding="utf-8").rstrip("\n"), encoding="utf-8")
+    archive = LineupArchive(str(text_path))
+    archive.append(OTHER_LINEUP, 3)
+
+    assert LineupArchive(str(text_path)).last(3) == [(1, LINEUP), (2, LINEUP), (3, OTHER_LINEUP)]
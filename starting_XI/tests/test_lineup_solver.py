@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from functions.generate_lineup import LINEUP_POSITIONS
+from functions.lineup_solver import LineupSolver
+from assignment_cases import SEEDS, solve_total
+
+def lineup_solver_squad(rng, num_players):
+    # Random squad for the 4-3-3 positions, with every position covered by at least two players
+    roles = list(dict.fromkeys(LINEUP_POSITIONS))
+    players = {}
+    for i in range(num_players):
+        positions = [roles[i % len(roles)]] + [role for role in roles if rng.random() < 0.2]
+        players[f"Player {i}"] = {'number': i + 1, 'age': int(rng.integers(18, 36)), 'positions': positions}
+    metrics = {
+        'played_minutes': {player: int(rng.integers(0, 3000)) for player in players},
+        'player_performance': {player: float(rng.uniform(1, 10)) for player in players},
+        'risk_coefficients': {player: float(rng.uniform(0, 20)) for player in players},
+        'age_risks': {player: float(rng.uniform(0, 5)) for player in players},
+    }
+    return players, metrics
+
+def expected_lineup_cost(solver):
+    # Optimal cost of the solver's available players, solved from scratch
+    available_costs = solver.costs[:, solver.available]
+    if available_costs.shape[1] < available_costs.shape[0]:
+        return np.inf
+    try:
+        return solve_total(available_costs)
+    except ValueError:
+        return np.inf
+
+def check_lineup(solver):
+    lineup = solver.lineup()
+    assert [position for position, _ in lineup] == list(solver.positions)
+    assert len({player for _, player in lineup}) == len(lineup)
+    for position, player in lineup:
+        col = solver.player_columns[player]
+        assert solver.available[col] and np.isfinite(solver.costs[solver.positions.index(position), col])
+    assert solver.total_cost() == pytest.approx(expected_lineup_cost(solver))
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_lineup_solver_repairs_match_full_solve(seed):
+    rng = np.random.default_rng(seed)
+    players, metrics = lineup_solver_squad(rng, int(rng.integers(14, 24)))
+    solver = LineupSolver(players, metrics['played_minutes'], metrics['player_performance'], metrics['risk_coefficients'], metrics['age_risks'])
+    check_lineup(solver)
+
+    roles = list(dict.fromkeys(LINEUP_POSITIONS))
+    for step in range(60):
+        player = solver.player_names[int(rng.integers(len(solver.player_names)))]
+        action = rng.choice(["remove", "add", "update", "new"])
+        before = (solver.lineup(), solver.total_cost())
+        try:
+            if action == "remove":
+                solver.remove_player(player)
+            elif action == "add":
+                solver.add_player(player)
+            elif action == "update":
+                solver.update_cost(player, float(rng.uniform(0, 20)))
+            else:
+                positions = [role for role in roles if rng.random() < 0.3] or [roles[0]]
+                solver.add_player(f"New player {step}", positions, float(rng.uniform(0, 20)))
+        except ValueError:
+            # Only a removal can leave a position without players; the lineup is then unchanged
+            assert action == "remove"
+            assert (solver.lineup(), solver.total_cost()) == before
+            continue
+        check_lineup(solver)
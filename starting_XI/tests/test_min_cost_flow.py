@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from functions.min_cost_flow import min_cost_flow
+from assignment_cases import SEEDS, brute_force_cost, random_costs
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_min_cost_flow_matches_slot_assignment(seed):
+    # The same problem with one column per slot, solved by brute force
+    rng = np.random.default_rng(seed)
+    role_capacities = list(rng.integers(1, 3, size=rng.integers(1, 4)))
+    num_slots = sum(role_capacities)
+    num_players = int(rng.integers(num_slots, num_slots + 3))
+    role_costs = random_costs(rng, (num_players, len(role_capacities)), forbidden=0.4)
+    edge_players, edge_roles = np.nonzero(np.isfinite(role_costs))
+    edge_costs = role_costs[edge_players, edge_roles]
+    slot_roles = np.repeat(np.arange(len(role_capacities)), role_capacities)
+
+    expected = brute_force_cost(role_costs[:, slot_roles])
+    if np.isinf(expected):
+        with pytest.raises(ValueError):
+            min_cost_flow(num_players, role_capacities, edge_players, edge_roles, edge_costs)
+        return
+
+    assignment = min_cost_flow(num_players, role_capacities, edge_players, edge_roles, edge_costs)
+    assigned_players = [player for player, _ in assignment]
+    assert assigned_players == sorted(set(assigned_players))
+    assert np.bincount([role for _, role in assignment], minlength=len(role_capacities)).tolist() == role_capacities
+    assert sum(role_costs[player, role] for player, role in assignment) == expected
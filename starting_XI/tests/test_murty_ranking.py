@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from functions.murty_ranking import rank_assignments
+from assignment_cases import SEEDS, brute_force_assignments, random_costs
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_rank_assignments_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    num_rows = int(rng.integers(1, 4))
+    cost_matrix = random_costs(rng, (num_rows, int(rng.integers(num_rows, 6))))
+    expected = sorted(total for total, _ in brute_force_assignments(cost_matrix))
+    if not expected:
+        with pytest.raises(ValueError):
+            rank_assignments(cost_matrix, 5)
+        return
+
+    k = int(rng.integers(1, len(expected) + 3))
+    ranked = rank_assignments(cost_matrix, k)
+    assert [total for total, _, _ in ranked] == expected[:k]
+    assert len({tuple(cols) for _, _, cols in ranked}) == len(ranked)
+    for total, rows, cols in ranked:
+        assert cost_matrix[rows, cols].sum() == total
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_rank_assignments_with_row_groups(seed):
+    # Rows of a group are copies of the same position; swapping their columns is the same lineup
+    rng = np.random.default_rng(seed)
+    row_groups = sorted(rng.integers(0, 3, size=int(rng.integers(2, 5))).tolist())
+    group_costs = random_costs(rng, (max(row_groups) + 1, int(rng.integers(len(row_groups), 7))))
+    cost_matrix = group_costs[row_groups]
+
+    def lineup_key(cols):
+        return frozenset((group, frozenset(np.asarray(cols)[np.asarray(row_groups) == group].tolist())) for group in set(row_groups))
+
+    distinct = {}
+    for total, cols in brute_force_assignments(cost_matrix):
+        distinct[lineup_key(cols)] = total
+    expected = sorted(distinct.values())
+    if not expected:
+        with pytest.raises(ValueError):
+            rank_assignments(cost_matrix, 5, row_groups)
+        return
+
+    k = len(expected) + 2
+    ranked = rank_assignments(cost_matrix, k, row_groups)
+    assert [total for total, _, _ in ranked] == expected
+    assert len({lineup_key(cols) for _, _, cols in ranked}) == len(ranked)
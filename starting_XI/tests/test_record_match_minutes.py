@@ -0,0 +1,79 @@
+import functions.played_minutes.record_match_minutes as record_module
+from functions.played_minutes.record_match_minutes import record_match_minutes, snapshot_played_minutes
+from read_files.read_played_minutes import LEDGER_OFFSET_PREFIX, read_ledger_offset, read_minutes_ledger, read_played_minutes
+from read_files.record_stream import RejectedRecords
+
+def test_match_minutes_are_appended_to_the_ledger_only(squad_dir):
+    minutes_file = squad_dir / "played_minutes.txt"
+    before = minutes_file.read_bytes()
+    record_match_minutes(str(minutes_file), {"Striker A": 90, "Pivot B": 45}, match_id=3)
+
+    assert minutes_file.read_bytes() == before
+    assert (squad_dir / "played_minutes.ledger").read_text(encoding="utf-8") == "3,90,Striker A\n3,45,Pivot B\n"
+
+def test_ledger_records_are_added_to_the_totals(squad_dir):
+    minutes_file = str(squad_dir / "played_minutes.txt")
+    original = read_played_minutes(minutes_file)
+    record_match_minutes(minutes_file, {"Striker A": 90, "Pivot B": 45}, match_id=3)
+    record_match_minutes(minutes_file, {"Striker A": 60, "New Signing": 30}, match_id=4)
+
+    played_minutes = read_played_minutes(minutes_file)
+    assert played_minutes["Striker A"] == original["Striker A"] + 150
+    assert played_minutes["Pivot B"] == original["Pivot B"] + 45
+    # Players only in the ledger go at the end
+    assert list(played_minutes) == list(original) + ["New Signing"]
+    assert played_minutes["New Signing"] == 30
+
+def test_snapshot_writes_the_offset_header_and_keeps_the_totals(squad_dir):
+    minutes_file = str(squad_dir / "played_minutes.txt")
+    record_match_minutes(minutes_file, {"Striker A": 90, "New Signing": 30}, match_id=3)
+    ledger = (squad_dir / "played_minutes.ledger").read_bytes()
+    expected = read_played_minutes(minutes_file)
+
+    snapshot_played_minutes(minutes_file)
+    first_line = (squad_dir / "played_minutes.txt").read_text(encoding="utf-8").splitlines()[0]
+    assert first_line == f"{LEDGER_OFFSET_PREFIX} {len(ledger)}"
+    assert read_ledger_offset(minutes_file) == len(ledger)
+    # The ledger is never modified, and its records before the offset are not added twice
+    assert (squad_dir / "played_minutes.ledger").read_bytes() == ledger
+    assert read_played_minutes(minutes_file) == expected
+
+    # Records after the offset are still added
+    record_match_minutes(minutes_file, {"Striker A": 10}, match_id=4)
+    assert read_played_minutes(minutes_file)["Striker A"] == expected["Striker A"] + 10
+
+def test_snapshot_is_taken_beyond_the_threshold(squad_dir, monkeypatch):
+    monkeypatch.setattr(record_module, 'SNAPSHOT_THRESHOLD', 40)
+    minutes_file = str(squad_dir / "played_minutes.txt")
+    expected = read_played_minutes(minutes_file)
+    for match_id in range(3, 10):
+        record_match_minutes(minutes_file, {"Striker A": 90, "Pivot B": 20}, match_id)
+        expected["Striker A"] += 90
+        expected["Pivot B"] += 20
+
+    assert read_ledger_offset(minutes_file) > 0
+    assert read_played_minutes(minutes_file) == expected
+
+def test_ledger_sums_match_the_records_and_skip_malformed_lines(tmp_path):
+    ledger_path = tmp_path / "played_minutes.ledger"
+    lines = [f"{match_id},{(match_id * 7) % 91},Player {match_id % 13}\n" for match_id in range(25000)]
+    lines.insert(100, "not a record\n")
+    ledger_path.write_text("".join(lines), encoding="utf-8")
+
+    expected = {}
+    for match_id in range(25000):
+        name = f"Player {match_id % 13}"
+        expected[name] = expected.get(name, 0) + (match_id * 7) % 91
+    rejected = RejectedRecords()
+    totals = read_minutes_ledger(str(ledger_path), rejected=rejected)
+    assert totals == expected
+    assert list(totals) == list(expected)
+    assert rejected.count == 1
+
+    # Reading from a byte offset only sums the records after it
+    start = len("".join(lines[:24000]).encode('utf-8'))
+    tail = {}
+    for line in lines[24000:]:
+        _, minutes, name = line.rstrip("\n").split(",")
+        tail[name] = tail.get(name, 0) + int(minutes)
+    assert read_minutes_ledger(str(ledger_path), start) == tail
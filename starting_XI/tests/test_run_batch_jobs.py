@@ -0,0 +1,92 @@
+import io
+import json
+from functions.run_batch_jobs import read_batch_jobs, run_batch_jobs
+from squad_store.text_squad_store import TextSquadStore
+
+INJURY = {"player": "Striker A", "date": "2025-3-5", "injury_type": "Calf Strain", "recovery_time": 14, "severity": "Mild", "minutes_played": 700, "recurrent": False}
+
+def run(store, jobs):
+    output = io.StringIO()
+    summary = run_batch_jobs(store, jobs, output)
+    return summary, [json.loads(line) for line in output.getvalue().splitlines()]
+
+def test_jobs_save_lineups_and_record_match_minutes(squad_dir):
+    store = TextSquadStore(str(squad_dir))
+    played_minutes = store.read_played_minutes()
+    # A dry run finds a starter and a substitute who can play in the same position
+    _, [dry_run] = run(store, [{"date": "2025-03-01", "save": False}])
+    players = store.read_players()
+    starters = {player for _, player in dry_run['lineup']}
+    starter, substitute = next(
+        (player, name) for position, player in dry_run['lineup'] for name, data in players.items()
+        if name not in starters and position in data['positions']
+    )
+    jobs = [
+        {"id": "md1", "date": "2025-03-01", "match": {"second_half_extra": 4, "substitutions": [{"out": starter, "in": substitute, "minute": 70}]}},
+        {"id": "md2", "date": "2025-03-08", "formation": "3-5-2", "save": False},
+        {"id": "md3", "date": "2025-03-15"},
+    ]
+    summary, results = run(store, jobs)
+
+    assert summary['jobs'] == 3 and summary['failed'] == 0
+    assert [(result['job'], result['id'], result['error']) for result in results] == [(1, "md1", None), (2, "md2", None), (3, "md3", None)]
+    assert results[0]['lineup'] == dry_run['lineup']
+    assert results[0]['lineup_number'] == 3 and results[2]['lineup_number'] == 4
+    assert 'lineup_number' not in results[1]
+    assert [position for position, _ in results[1]['lineup']].count("Centre-back") == 3
+    assert store.read_last_lineups(2) == [(3, [tuple(slot) for slot in results[0]['lineup']]), (4, [tuple(slot) for slot in results[2]['lineup']])]
+
+    match_minutes = results[0]['match_minutes']
+    assert match_minutes[starter] == 70 and match_minutes[substitute] == 24
+    recorded = store.read_played_minutes()
+    assert {name: recorded[name] - played_minutes.get(name, 0) for name in match_minutes} == match_minutes
+
+def test_failed_jobs_report_their_error_and_the_next_jobs_still_run(squad_dir):
+    store = TextSquadStore(str(squad_dir))
+    jobs = [
+        {"id": "unknown player", "injuries": [dict(INJURY, player="Nobody")], "date": "2025-03-01"},
+        {"id": "bad date", "date": "2025-02-30"},
+        {"id": "bad severity", "injuries": [dict(INJURY, severity="Serious")], "date": "2025-03-01"},
+        {"id": "unknown formation", "date": "2025-03-01", "formation": "2-3-5"},
+        {"id": "missing date"},
+        {"id": "ok", "date": "2025-03-01"},
+    ]
+    summary, results = run(store, jobs)
+
+    assert summary['jobs'] == 6 and summary['failed'] == 5
+    assert [result['error'] is None for result in results] == [False] * 5 + [True]
+    assert "Nobody" in results[0]['error']
+    assert results[1]['error'].startswith("ValueError")
+    assert "Serious" in results[2]['error']
+    assert "2-3-5" in results[3]['error']
+    assert results[4]['error'].startswith("KeyError")
+    # Failed jobs save nothing, so the job that runs gets the next lineup number
+    assert results[5]['lineup_number'] == 3
+    assert store.count_lineups() == 3
+    assert store.read_injury_history()["Striker A"]['injuries'] == []
+
+def test_registered_injuries_are_normalised_and_used_by_the_next_jobs(squad_dir):
+    store = TextSquadStore(str(squad_dir))
+    jobs = [
+        {"id": "injury", "injuries": [INJURY], "generate": False},
+        {"id": "md1", "date": "2025-03-10"},
+    ]
+    summary, results = run(store, jobs)
+
+    assert summary['failed'] == 0
+    assert results[0]['injuries_registered'] == 1 and 'lineup' not in results[0]
+    assert store.read_injury_history()["Striker A"]['injuries'] == [{
+        'date': "2025-03-05", 'injury_type': "Calf Strain", 'recovery_time': 14, 'severity': "Mild", 'minutes_played': 700, 'recurrent': "No"
+    }]
+    # Striker A is still recovering on the match date
+    assert ["Striker", "Striker A"] not in results[1]['lineup']
+
+def test_job_files_are_read_as_a_list_or_as_jsonl(tmp_path):
+    jobs = [{"id": "md1", "date": "2025-03-01"}, {"id": "md2", "date": "2025-03-08"}]
+    list_file = tmp_path / "jobs.json"
+    list_file.write_text(json.dumps(jobs), encoding="utf-8")
+    lines_file = tmp_path / "jobs.jsonl"
+    lines_file.write_text("// Matchdays\n" + "\n".join(json.dumps(job) for job in jobs) + "\n\n", encoding="utf-8")
+
+    assert read_batch_jobs(str(list_file)) == jobs
+    assert read_batch_jobs(str(lines_file)) == jobs
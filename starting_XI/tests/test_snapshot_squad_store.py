@@ -0,0 +1,64 @@
+import os
+import numpy as np
+from squad_store.snapshot_squad_store import SnapshotSquadStore
+from squad_store.squad_data_cache import SquadDataCache
+from squad_store.squad_snapshot import SNAPSHOT_FILE
+from squad_store.text_squad_store import TextSquadStore
+
+INJURY = {'date': "2025-02-01", 'injury_type': "Calf Strain", 'recovery_time': 14, 'severity': "Mild", 'minutes_played': 700, 'recurrent': "No"}
+
+def read_all(store):
+    return {
+        'players': store.read_players(),
+        'played_minutes': store.read_played_minutes(),
+        'injury_history': store.read_injury_history(),
+        'player_performance': store.read_player_performance(),
+    }
+
+def test_snapshot_reads_the_same_data_as_the_text_files(squad_dir):
+    store = SnapshotSquadStore(str(squad_dir))
+    assert read_all(store) == read_all(TextSquadStore(str(squad_dir)))
+    assert (squad_dir / SNAPSHOT_FILE).exists()
+
+def test_precompiled_values_match_the_ones_computed_from_the_text_files(squad_dir):
+    snapshot_cache = SquadDataCache(SnapshotSquadStore(str(squad_dir)))
+    text_cache = SquadDataCache(TextSquadStore(str(squad_dir)))
+
+    names, codes = snapshot_cache.get('injury_records')
+    text_names, text_codes = text_cache.get('injury_records')
+    assert names == text_names
+    assert np.array_equal(codes, text_codes)
+    assert snapshot_cache.get('risk_coefficients') == text_cache.get('risk_coefficients')
+
+def test_unchanged_sources_reuse_the_snapshot_file(squad_dir):
+    read_all(SnapshotSquadStore(str(squad_dir)))
+    snapshot_stat = os.stat(squad_dir / SNAPSHOT_FILE)
+
+    store = SnapshotSquadStore(str(squad_dir))
+    assert read_all(store) == read_all(TextSquadStore(str(squad_dir)))
+    assert os.stat(squad_dir / SNAPSHOT_FILE).st_mtime_ns == snapshot_stat.st_mtime_ns
+
+def test_snapshot_is_rebuilt_when_a_text_file_changes(squad_dir):
+    store = SnapshotSquadStore(str(squad_dir))
+    read_all(store)
+    with open(squad_dir / "player_performance.txt", 'a', encoding='utf-8') as file:
+        file.write("New Signing, 7\n")
+
+    assert store.read_player_performance()["New Signing"] == 7
+    assert read_all(SnapshotSquadStore(str(squad_dir))) == read_all(TextSquadStore(str(squad_dir)))
+
+def test_snapshot_is_rebuilt_when_the_journal_or_the_ledger_grows(squad_dir):
+    store = SnapshotSquadStore(str(squad_dir))
+    played_minutes = store.read_played_minutes()
+    assert store.read_injury_history()["Striker A"]['injuries'] == []
+
+    store.update_injury_history("Striker A", INJURY)
+    assert store.read_injury_history()["Striker A"]['injuries'] == [INJURY]
+
+    store.record_match_minutes({"Striker A": 90}, 3)
+    assert store.read_played_minutes()["Striker A"] == played_minutes["Striker A"] + 90
+    assert read_all(store) == read_all(TextSquadStore(str(squad_dir)))
+
+def test_invalid_snapshot_file_is_rebuilt(squad_dir):
+    (squad_dir / SNAPSHOT_FILE).write_bytes(b"not a snapshot")
+    assert read_all(SnapshotSquadStore(str(squad_dir))) == read_all(TextSquadStore(str(squad_dir)))
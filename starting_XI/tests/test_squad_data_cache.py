@@ -0,0 +1,86 @@
+import os
+from squad_store.convert_text_files import import_text_files
+from squad_store.sqlite_squad_store import SQLiteSquadStore
+from squad_store.squad_data_cache import DATASETS, SquadDataCache
+from squad_store.text_squad_store import TextSquadStore
+
+INJURY = {'date': "2025-02-01", 'injury_type': "Calf Strain", 'recovery_time': 14, 'severity': "Mild", 'minutes_played': 700, 'recurrent': "No"}
+
+def versions(cache):
+    return {dataset: cache.version(dataset) for dataset in DATASETS}
+
+def test_unchanged_files_return_the_cached_data(squad_dir):
+    cache = SquadDataCache(TextSquadStore(str(squad_dir)))
+    players = cache.get('players')
+    age_risks = cache.get('age_risks')
+
+    assert cache.refresh('players') is False
+    assert cache.get('players') is players
+    assert cache.get('age_risks') is age_risks
+
+def test_only_the_changed_dataset_is_read_again(squad_dir):
+    store = TextSquadStore(str(squad_dir))
+    cache = SquadDataCache(store)
+    before = versions(cache)
+    players = cache.get('players')
+
+    store.update_injury_history("Striker A", INJURY)
+    after = versions(cache)
+    assert after['injury_history'] == before['injury_history'] + 1
+    assert {name: version for name, version in after.items() if name != 'injury_history'} == {
+        name: version for name, version in before.items() if name != 'injury_history'
+    }
+    assert cache.get('players') is players
+    assert cache.get('injury_history')["Striker A"]['injuries'] == [INJURY]
+
+def test_touched_file_with_the_same_content_is_not_read_again(squad_dir):
+    cache = SquadDataCache(TextSquadStore(str(squad_dir)))
+    players = cache.get('players')
+    version = cache.version('players')
+
+    stat = os.stat(squad_dir / "players.txt")
+    os.utime(squad_dir / "players.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert cache.refresh('players') is False
+    assert cache.version('players') == version
+    assert cache.get('players') is players
+
+def test_derived_values_are_recomputed_when_their_dataset_changes(squad_dir):
+    store = TextSquadStore(str(squad_dir))
+    cache = SquadDataCache(store)
+    risk_coefficients = cache.get('risk_coefficients')
+    position_index = cache.get('position_index')
+
+    store.update_injury_history("Striker A", INJURY)
+    updated = cache.get('risk_coefficients')
+    assert updated is not risk_coefficients
+    assert updated["Striker A"] > risk_coefficients["Striker A"]
+    assert cache.get('position_index') is position_index
+
+def test_sqlite_write_to_one_table_keeps_the_other_datasets(squad_dir, tmp_path):
+    store = import_text_files(str(squad_dir), str(tmp_path / "squad.db"))
+    cache = SquadDataCache(store)
+    before = versions(cache)
+    players = cache.get('players')
+
+    store.save_lineup(store.read_lineup(1)[1], 3)
+    after = versions(cache)
+    assert after['lineups'] == before['lineups'] + 1
+    assert {name: version for name, version in after.items() if name != 'lineups'} == {
+        name: version for name, version in before.items() if name != 'lineups'
+    }
+    assert cache.get('players') is players
+    assert len(cache.get('lineups')) == 3
+
+def test_sqlite_write_from_another_connection_is_seen(squad_dir, tmp_path):
+    db_path = str(tmp_path / "squad.db")
+    import_text_files(str(squad_dir), db_path).close()
+    store = SQLiteSquadStore(db_path)
+    cache = SquadDataCache(store)
+    played_minutes = cache.get('played_minutes')
+
+    writer = SQLiteSquadStore(db_path)
+    writer.record_match_minutes({"Striker A": 90}, 3)
+    writer.close()
+    assert cache.refresh('played_minutes') is True
+    assert cache.get('played_minutes')["Striker A"] == played_minutes["Striker A"] + 90
+    store.close()
@@ -0,0 +1,71 @@
+import functions.injuries.update_injury_history as update_module
+from functions.injuries.compact_injury_history import compact_injury_history
+from functions.injuries.update_injury_history import update_injury_history
+from read_files.read_injury_history import JOURNAL_OFFSET_PREFIX, read_injury_history, read_journal_offset
+
+def injury(date, injury_type="Calf Strain", severity="Mild"):
+    return {'date': date, 'injury_type': injury_type, 'recovery_time': 14, 'severity': severity, 'minutes_played': 700, 'recurrent': "No"}
+
+def test_injuries_are_appended_to_the_journal_only(squad_dir):
+    history_file = squad_dir / "injury_history.txt"
+    before = history_file.read_bytes()
+    update_injury_history(str(history_file), "Striker A", injury("2025-02-01"))
+
+    assert history_file.read_bytes() == before
+    assert (squad_dir / "injury_history.journal").read_text(encoding="utf-8") == (
+        "Striker A\t2025-02-01, Calf Strain, 14, Mild, 700, No\n"
+    )
+
+def test_journal_entries_are_merged_newest_first(squad_dir):
+    history_file = str(squad_dir / "injury_history.txt")
+    original = read_injury_history(history_file)
+    update_injury_history(history_file, "Goalkeeper A", injury("2025-01-05"))
+    update_injury_history(history_file, "Goalkeeper A", injury("2025-03-01", "Knock"))
+    update_injury_history(history_file, "Pivot B", injury("2025-02-01"))
+
+    history = read_injury_history(history_file)
+    assert history["Goalkeeper A"]['injuries'] == [injury("2025-03-01", "Knock"), injury("2025-01-05")] + original["Goalkeeper A"]['injuries']
+    # Players only in the journal go at the end
+    assert list(history) == list(original) + ["Pivot B"]
+    assert history["Pivot B"]['injuries'] == [injury("2025-02-01")]
+
+def test_compaction_writes_the_offset_header_and_keeps_the_history(squad_dir):
+    history_file = str(squad_dir / "injury_history.txt")
+    update_injury_history(history_file, "Goalkeeper A", injury("2025-01-05"))
+    update_injury_history(history_file, "Pivot B", injury("2025-02-01"))
+    journal = (squad_dir / "injury_history.journal").read_bytes()
+    expected = read_injury_history(history_file)
+
+    compact_injury_history(history_file)
+    first_line = (squad_dir / "injury_history.txt").read_text(encoding="utf-8").splitlines()[0]
+    assert first_line == f"{JOURNAL_OFFSET_PREFIX} {len(journal)}"
+    assert read_journal_offset(history_file) == len(journal)
+    # The journal is never modified, and its compacted entries are not applied twice
+    assert (squad_dir / "injury_history.journal").read_bytes() == journal
+    assert read_injury_history(history_file) == expected
+
+    # Entries after the offset are still merged
+    update_injury_history(history_file, "Goalkeeper A", injury("2025-04-01", "Knock"))
+    history = read_injury_history(history_file)
+    assert history["Goalkeeper A"]['injuries'] == [injury("2025-04-01", "Knock")] + expected["Goalkeeper A"]['injuries']
+
+def test_journal_is_compacted_beyond_the_threshold(squad_dir, monkeypatch):
+    monkeypatch.setattr(update_module, 'COMPACTION_THRESHOLD', 150)
+    history_file = str(squad_dir / "injury_history.txt")
+    expected = read_injury_history(history_file)
+    for day in range(1, 6):
+        new_injury = injury(f"2025-01-0{day}")
+        update_injury_history(history_file, "Striker A", new_injury)
+        expected["Striker A"]['injuries'].insert(0, new_injury)
+
+    assert read_journal_offset(history_file) > 0
+    assert read_injury_history(history_file) == expected
+
+def test_journal_end_limits_the_merged_entries(squad_dir):
+    history_file = str(squad_dir / "injury_history.txt")
+    update_injury_history(history_file, "Striker A", injury("2025-01-01"))
+    journal_size = (squad_dir / "injury_history.journal").stat().st_size
+    update_injury_history(history_file, "Striker A", injury("2025-02-01"))
+
+    history = read_injury_history(history_file, journal_end=journal_size)
+    assert history["Striker A"]['injuries'] == [injury("2025-01-01")]